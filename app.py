@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 import json
 import os
 
+from pulse import cache, data, db, downsample, figures, fuzzy, vectors, warmup
+
 # Configure page
 st.set_page_config(
     page_title="PULSE - AI-Powered Banking Platform",
@@ -98,41 +100,22 @@ if 'user_permissions' not in st.session_state:
     }
 
 # Load mock data
-@st.cache_data
+@cache.cached('clients', 'risk', 'deals', 'performance')
 def load_mock_data():
     """Load mock banking data for demonstration"""
     
-    # Client data
-    clients = pd.DataFrame({
-        'client_id': range(1, 51),
-        'name': [f'Client {i}' for i in range(1, 51)],
-        'industry': np.random.choice(['Manufacturing', 'Technology', 'Healthcare', 'Finance', 'Retail'], 50),
-        'revenue': np.random.uniform(1000000, 100000000, 50),
-        'risk_score': np.random.uniform(1, 10, 50),
-        'relationship_manager': np.random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown'], 50),
-        'last_contact': pd.date_range(start='2024-01-01', periods=50, freq='D')
-    })
-    
-    # Deal pipeline data
-    deals = pd.DataFrame({
-        'deal_id': range(1, 101),
-        'client_id': np.random.choice(range(1, 51), 100),
-        'deal_name': [f'Deal {i}' for i in range(1, 101)],
-        'value': np.random.uniform(100000, 10000000, 100),
-        'stage': np.random.choice(['Prospect', 'Qualified', 'Proposal', 'Negotiation', 'Closed Won', 'Closed Lost'], 100),
-        'probability': np.random.uniform(0.1, 0.9, 100),
-        'close_date': pd.date_range(start='2024-01-01', periods=100, freq='W'),
-        'product': np.random.choice(['Term Loan', 'Trade Finance', 'Treasury Services', 'FX Services'], 100)
-    })
-    
-    # Performance data
-    performance = pd.DataFrame({
-        'month': pd.date_range(start='2024-01-01', periods=12, freq='M'),
-        'revenue': np.random.uniform(10000000, 20000000, 12),
-        'deals_closed': np.random.randint(20, 60, 12),
-        'new_clients': np.random.randint(5, 15, 12),
-        'client_satisfaction': np.random.uniform(8.0, 9.5, 12)
-    })
+    clients = data.clients().merge(data.risk()[['client_id', 'risk_score']], on='client_id')
+    deals = data.deals()
+    
+    # Monthly performance rolled up from the shared daily series
+    daily = data.performance()
+    performance = daily.groupby(daily['date'].dt.to_period('M')).agg({
+        'revenue': 'sum',
+        'deals_closed': 'sum',
+        'new_clients': 'sum',
+        'client_satisfaction': 'mean'
+    }).reset_index().rename(columns={'date': 'month'})
+    performance['month'] = performance['month'].dt.to_timestamp()
     
     return clients, deals, performance
 
@@ -172,6 +155,14 @@ def render_sidebar():
             }
         )
         
+        # Background cache warm-up progress
+        warmup_status = warmup.status()
+        if warmup_status['state'] == 'running':
+            st.progress(
+                warmup_status['progress'],
+                text=f"Warming caches ({warmup_status['done']}/{warmup_status['total']}): {warmup_status['current'] or ''}"
+            )
+        
         return selected
 
 # Dashboard page
@@ -227,7 +218,8 @@ def render_dashboard():
     
     with col1:
         st.subheader("📈 Revenue Trend")
-        fig = px.line(
+        fig = figures.plot(
+            px.line,
             performance, 
             x='month', 
             y='revenue',
@@ -238,8 +230,9 @@ def render_dashboard():
     
     with col2:
         st.subheader("🎯 Deal Pipeline by Stage")
-        pipeline_summary = deals.groupby('stage')['value'].sum().reset_index()
-        fig = px.pie(
+        pipeline_summary = deals.groupby('stage', observed=True)['value'].sum().reset_index()
+        fig = figures.plot(
+            px.pie,
             pipeline_summary,
             values='value',
             names='stage',
@@ -275,25 +268,39 @@ def render_client360():
     
     clients, deals, performance = load_mock_data()
     
-    # Client selection
+    # Client selection, searched through the shared client name index
+    client_search = st.text_input("🔍 Search Clients", placeholder="Type client name or CIF...")
+    
+    if client_search:
+        matches = fuzzy.clients().lookup(client_search, limit=fuzzy.PICKER_LIMIT)
+        # Keys are row positions in data.clients(), not in the merged frame
+        names = data.clients()['client_name'].iloc[matches['key']]
+        client_options = names[names.isin(clients['client_name'])].tolist()
+    else:
+        client_options = clients['client_name'].head(fuzzy.PICKER_LIMIT).tolist()
+    
+    if not client_options:
+        st.warning("No clients match your search")
+        return
+    
     selected_client = st.selectbox(
         "Select Client",
-        options=clients['name'].tolist(),
+        options=client_options,
         index=0
     )
     
-    client_data = clients[clients['name'] == selected_client].iloc[0]
+    client_data = clients[clients['client_name'] == selected_client].iloc[0]
     client_deals = deals[deals['client_id'] == client_data['client_id']]
     
     # Client overview
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        st.subheader(f"🏢 {client_data['name']}")
+        st.subheader(f"🏢 {client_data['client_name']}")
         st.write(f"**Industry:** {client_data['industry']}")
-        st.write(f"**Annual Revenue:** £{client_data['revenue']/1000000:.1f}M")
+        st.write(f"**Annual Revenue:** £{client_data['annual_revenue']/1000000:.1f}M")
         st.write(f"**Relationship Manager:** {client_data['relationship_manager']}")
-        st.write(f"**Last Contact:** {client_data['last_contact'].strftime('%Y-%m-%d')}")
+        st.write(f"**Last Contact:** {client_data['last_interaction'].strftime('%Y-%m-%d')}")
     
     with col2:
         st.metric(
@@ -315,7 +322,7 @@ def render_client360():
     
     if not client_deals.empty:
         st.dataframe(
-            client_deals[['deal_name', 'value', 'stage', 'probability', 'product']],
+            client_deals[['deal_name', 'value', 'stage', 'probability', 'product_type']],
             use_container_width=True
         )
     else:
@@ -671,23 +678,23 @@ def render_technical_architecture():
         
         with col1:
             st.markdown("""
-            **🔵 MS SQL Server**
+            **🔵 SQL Database**
             - Transactional data
             - ACID compliance
             - Complex queries
             - Reporting
             """)
             
-            if st.button("Test MS SQL Connection"):
-                st.success("✅ MS SQL Server connected")
-                st.code("""
-                SELECT TOP 10 
-                    client_name, 
-                    total_revenue,
-                    last_transaction_date
-                FROM clients 
-                ORDER BY total_revenue DESC
-                """)
+            if st.button("Test SQL Connection"):
+                started = datetime.now()
+                try:
+                    db.read("SELECT 1 AS ok", operation='connection test')
+                except Exception as exc:
+                    st.error(f"❌ Connection failed: {exc}")
+                else:
+                    elapsed_ms = (datetime.now() - started).total_seconds() * 1000
+                    st.success(f"✅ {db.stats()['dialect']} connected through the pool ({elapsed_ms:.1f} ms)")
+                    st.code(db.stats()['url'])
         
         with col2:
             st.markdown("""
@@ -699,50 +706,91 @@ def render_technical_architecture():
             """)
             
             if st.button("Test MongoDB Connection"):
-                st.success("✅ MongoDB connected")
-                st.code("""
-                db.user_sessions.find({
-                    "user_id": "john_smith",
-                    "session_date": {
-                        "$gte": ISODate("2024-01-01")
-                    }
-                }).sort({"timestamp": -1})
-                """)
+                mongo_url = os.environ.get('PULSE_MONGO_URL')
+                if not mongo_url:
+                    st.info("ℹ️ MongoDB not configured; set PULSE_MONGO_URL to test a server")
+                else:
+                    try:
+                        from pymongo import MongoClient
+                        MongoClient(mongo_url, serverSelectionTimeoutMS=2000).admin.command('ping')
+                        st.success("✅ MongoDB connected")
+                    except Exception as exc:
+                        st.error(f"❌ MongoDB connection failed: {exc}")
         
         with col3:
             st.markdown("""
-            **🟡 FAISS Vector DB**
+            **🟡 Vector Index (IVF)**
             - Similarity search
-            - AI embeddings
+            - Hashed TF-IDF embeddings
             - Semantic queries
             - Recommendations
             """)
             
-            if st.button("Test FAISS Connection"):
-                st.success("✅ FAISS Vector DB connected")
-                st.code("""
-                import faiss
-                import numpy as np
-                
-                # Search similar clients
-                query_vector = np.random.random(128)
-                distances, indices = index.search(
-                    query_vector.reshape(1, -1), k=5
+            similar_query = st.text_input("Find similar", placeholder="e.g. cash flow concerns")
+            if similar_query:
+                started = datetime.now()
+                similar = vectors.CORPUS.similar(similar_query, k=5)
+                elapsed_ms = (datetime.now() - started).total_seconds() * 1000
+                index_stats = vectors.CORPUS.stats()
+                st.caption(
+                    f"{len(similar)} matches in {elapsed_ms:.1f} ms over {index_stats['vectors']:,} vectors "
+                    f"in {index_stats['lists']} lists"
                 )
-                """)
-        
-        # Database performance metrics
-        st.subheader("📊 Database Performance")
-        
-        db_metrics = pd.DataFrame({
-            'Database': ['MS SQL', 'MongoDB', 'FAISS'],
-            'Response Time (ms)': [45, 23, 12],
-            'Throughput (ops/sec)': [1200, 2500, 5000],
-            'Storage (GB)': [250, 180, 45]
-        })
-        
-        fig = px.bar(db_metrics, x='Database', y='Response Time (ms)', title="Database Response Times")
-        st.plotly_chart(fig, use_container_width=True)
+                st.dataframe(similar[['source', 'key', 'score', 'text']], use_container_width=True, hide_index=True)
+        
+        # Live connection pool metrics
+        st.subheader("📊 Connection Pool Performance")
+        
+        bench_col1, bench_col2, bench_col3 = st.columns([2, 2, 1])
+        with bench_col1:
+            bench_queries = st.slider("Load test queries", 50, 2000, 200, step=50)
+        with bench_col2:
+            bench_workers = st.slider("Concurrent workers", 1, 32, 8)
+        with bench_col3:
+            st.write("")
+            if st.button("⚡ Run Load Test"):
+                elapsed = db.benchmark(queries=bench_queries, workers=bench_workers)
+                st.success(f"{bench_queries / elapsed:,.0f} queries/sec")
+        
+        pool_stats = db.stats()
+        pool_col1, pool_col2, pool_col3, pool_col4 = st.columns(4)
+        
+        with pool_col1:
+            st.metric(
+                "Pool Size",
+                f"{pool_stats['checked_out']} / {pool_stats['pool_size']}",
+                f"{pool_stats['idle']} idle, {pool_stats['overflow']} overflow",
+                delta_color="off"
+            )
+        
+        with pool_col2:
+            st.metric("Avg Wait Time", f"{pool_stats['avg_wait_ms']:.2f} ms", f"{pool_stats['timeouts']} timeouts", delta_color="off")
+        
+        with pool_col3:
+            st.metric("Checkout Latency", f"{pool_stats['avg_checkout_ms']:.2f} ms", f"p95 {pool_stats['p95_checkout_ms']:.2f} ms", delta_color="off")
+        
+        with pool_col4:
+            st.metric("Throughput", f"{pool_stats['throughput']:,.1f} ops/sec", f"{pool_stats['checkouts']:,} checkouts", delta_color="off")
+        
+        pool_samples = db.samples()
+        if len(pool_samples):
+            pool_samples['time'] = pd.to_datetime(pool_samples['timestamp'], unit='s')
+            fig = px.line(
+                pool_samples.melt(
+                    id_vars=['time', 'operation'],
+                    value_vars=['wait_ms', 'checkout_ms', 'query_ms'],
+                    var_name='Measure',
+                    value_name='Milliseconds'
+                ).replace({'wait_ms': 'Pool wait', 'checkout_ms': 'Checkout latency', 'query_ms': 'Query time'}),
+                x='time',
+                y='Milliseconds',
+                color='Measure',
+                hover_data=['operation'],
+                title=f"Recent Pooled Operations ({pool_stats['dialect']})"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No pooled operations yet. Test the connection or run a load test.")
         
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -959,7 +1007,9 @@ def render_technical_architecture():
             'Response Time': np.random.uniform(50, 200, 24)
         })
         
-        fig = px.line(metrics_data, x='Time', y='Success Rate', title="Service Success Rate Over Time")
+        # Min/max buckets keep every dip in success rate visible
+        metrics_trend = downsample.frame(metrics_data, 'Time', 'Success Rate', method='minmax')
+        fig = px.line(metrics_trend, x='Time', y='Success Rate', title="Service Success Rate Over Time")
         st.plotly_chart(fig, use_container_width=True)
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -1055,6 +1105,9 @@ def render_technical_architecture():
 def main():
     """Main application entry point"""
     
+    # Precompute datasets and shared aggregates in the background, once per process
+    warmup.start()
+    
     # Render sidebar and get selected page
     selected_page = render_sidebar()
     
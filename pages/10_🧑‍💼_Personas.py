@@ -2,6 +2,8 @@
 import streamlit as st
 import pandas as pd
 
+from pulse import cache, fuzzy
+
 # Dummy data for personas
 personas = [
     {
@@ -48,17 +50,28 @@ personas = [
 
 st.title("🧑‍💼 Personas - Client View")
 
+# Name index over persona names, designations, clients and CIFs, keyed by persona
+@cache.cached()
+def load_persona_index():
+    fields = ["name", "designation", "client", "cif"]
+    return fuzzy.NameIndex(
+        [p[field] for field in fields for p in personas],
+        keys=[i for field in fields for i in range(len(personas))]
+    )
+
+persona_index = load_persona_index()
+
 client_names = sorted(set(p["client"] for p in personas))
 selected_client = st.selectbox("Select a Client", client_names)
 
-search_query = st.text_input("Search Personas (Name or Designation)").strip().lower()
+search_query = st.text_input("Search Personas (Name, Designation or CIF)").strip()
 
-# Filter personas by client and search
-filtered_personas = [
-    p for p in personas
-    if p["client"] == selected_client and
-    (search_query in p["name"].lower() or search_query in p["designation"].lower())
-]
+# Filter personas by client, ranked by the search when there is one
+if search_query:
+    ranked = persona_index.lookup(search_query, limit=None)['key']
+else:
+    ranked = range(len(personas))
+filtered_personas = [personas[i] for i in ranked if personas[i]["client"] == selected_client]
 
 if filtered_personas:
     names = [p["name"] for p in filtered_personas]
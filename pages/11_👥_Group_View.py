@@ -5,47 +5,27 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, data, figures, fuzzy, views
+
 st.set_page_config(page_title="Group View", page_icon="👥", layout="wide")
 
 st.title("👥 Group View - Customer Portfolio Management")
 
-# Generate comprehensive customer data
-@st.cache_data
-def generate_customer_data():
-    customers = []
-    company_names = [
-        'TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro',
-        'StartupXYZ', 'LogisticsCorp', 'FinanceGroup', 'PropertyDev', 'MediaHouse',
-        'AutoMotors Ltd', 'FoodChain Co', 'PharmaCorp', 'TelecomGiant', 'ConstructionPro',
-        'AeroSpace Inc', 'MarineServices', 'AgriTech Ltd', 'CleanEnergy Co', 'DataSystems'
-    ]
-    
-    sectors = ['Technology', 'Manufacturing', 'Retail', 'Energy', 'Healthcare', 
-               'Logistics', 'Finance', 'Real Estate', 'Media', 'Automotive']
-    
-    for i, company in enumerate(company_names):
-        customers.append({
-            'customer_id': f"CUST-{1000+i}",
-            'company_name': company,
-            'sector': random.choice(sectors),
-            'relationship_manager': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown']),
-            'total_exposure': random.randint(1000000, 100000000),
-            'credit_rating': random.choice(['AAA', 'AA+', 'AA', 'A+', 'A', 'BBB+', 'BBB']),
-            'relationship_length': random.randint(1, 15),
-            'annual_revenue': random.randint(5000000, 500000000),
-            'employee_count': random.randint(50, 10000),
-            'country': random.choice(['UK', 'Germany', 'France', 'Netherlands', 'Switzerland']),
-            'risk_score': random.uniform(0.1, 0.8),
-            'profitability_score': random.uniform(0.3, 0.95),
-            'growth_potential': random.uniform(0.2, 0.9),
-            'last_interaction': datetime.now() - timedelta(days=random.randint(1, 30)),
-            'products_used': random.randint(2, 8),
-            'satisfaction_score': random.uniform(7.0, 9.8)
-        })
-    
-    return pd.DataFrame(customers)
+# Customer portfolio view over the shared client and risk datasets
+@cache.cached('clients', 'risk')
+def load_customer_data():
+    risk = data.risk()
+    customers = data.clients().rename(columns={
+        'client_id': 'customer_id',
+        'client_name': 'company_name',
+        'industry': 'sector'
+    })
+    customers['total_exposure'] = risk['exposure_amount']
+    customers['credit_rating'] = risk['credit_rating']
+    customers['risk_score'] = risk['risk_score'] / 10
+    return customers
 
-customer_df = generate_customer_data()
+customer_df = load_customer_data()
 
 # Search and filter section
 st.subheader("🔍 Customer Search & Filter")
@@ -53,15 +33,14 @@ st.subheader("🔍 Customer Search & Filter")
 col1, col2, col3 = st.columns([2, 1, 1])
 
 with col1:
-    # Searchable dropdown for customers
-    search_term = st.text_input("🔍 Search Customers", placeholder="Type customer name...")
+    # Searchable dropdown for customers, ranked by the shared client name index
+    search_term = st.text_input("🔍 Search Customers", placeholder="Type customer name or CIF...")
     
     if search_term:
-        filtered_customers = customer_df[
-            customer_df['company_name'].str.contains(search_term, case=False, na=False)
-        ]['company_name'].tolist()
+        matches = fuzzy.clients().lookup(search_term, limit=fuzzy.PICKER_LIMIT)
+        filtered_customers = data.clients()['client_name'].iloc[matches['key']].tolist()
     else:
-        filtered_customers = customer_df['company_name'].tolist()
+        filtered_customers = customer_df['company_name'].head(fuzzy.PICKER_LIMIT).tolist()
     
     selected_customer = st.selectbox(
         "Select Customer",
@@ -81,17 +60,23 @@ with col3:
         options=['All RMs'] + list(customer_df['relationship_manager'].unique())
     )
 
-# Apply filters
-filtered_df = customer_df.copy()
-
-if selected_customer != 'All Customers':
-    filtered_df = filtered_df[filtered_df['company_name'] == selected_customer]
-
-if sector_filter != 'All Sectors':
-    filtered_df = filtered_df[filtered_df['sector'] == sector_filter]
+# Apply filters, memoised per filter state across sessions
+@views.filtered('clients', 'risk')
+def filter_customers(customer, sector, rm):
+    filtered = customer_df.copy(deep=False)
+    
+    if customer != 'All Customers':
+        filtered = filtered[filtered['company_name'] == customer]
+    
+    if sector != 'All Sectors':
+        filtered = filtered[filtered['sector'] == sector]
+    
+    if rm != 'All RMs':
+        filtered = filtered[filtered['relationship_manager'] == rm]
+    return filtered
 
-if rm_filter != 'All RMs':
-    filtered_df = filtered_df[filtered_df['relationship_manager'] == rm_filter]
+customer_filters = {'customer': selected_customer, 'sector': sector_filter, 'rm': rm_filter}
+filtered_df = filter_customers(**customer_filters)
 
 # Portfolio overview metrics
 st.subheader("📊 Portfolio Overview")
@@ -122,8 +107,9 @@ with tab1:
     
     with col1:
         # Exposure by sector
-        sector_exposure = filtered_df.groupby('sector')['total_exposure'].sum().reset_index()
-        fig_sector = px.pie(
+        sector_exposure = filtered_df.groupby('sector', observed=True)['total_exposure'].sum().reset_index()
+        fig_sector = figures.plot(
+            px.pie,
             sector_exposure, 
             values='total_exposure', 
             names='sector',
@@ -133,10 +119,11 @@ with tab1:
     
     with col2:
         # Risk vs Profitability scatter
-        fig_risk = px.scatter(
+        fig_risk = figures.scatter(
             filtered_df,
-            x='risk_score',
-            y='profitability_score',
+            'risk_score',
+            'profitability_score',
+            source=(['clients', 'risk'], customer_filters),
             size='total_exposure',
             color='sector',
             hover_data=['company_name'],
@@ -182,7 +169,7 @@ with tab3:
         labels=['Low Risk', 'Medium Risk', 'High Risk']
     )
     
-    risk_summary = filtered_df.groupby('risk_category').agg({
+    risk_summary = filtered_df.groupby('risk_category', observed=True).agg({
         'company_name': 'count',
         'total_exposure': 'sum'
     }).reset_index()
@@ -190,7 +177,8 @@ with tab3:
     col1, col2 = st.columns(2)
     
     with col1:
-        fig_risk_count = px.bar(
+        fig_risk_count = figures.plot(
+            px.bar,
             risk_summary,
             x='risk_category',
             y='company_name',
@@ -205,7 +193,8 @@ with tab3:
         st.plotly_chart(fig_risk_count, use_container_width=True)
     
     with col2:
-        fig_risk_exposure = px.bar(
+        fig_risk_exposure = figures.plot(
+            px.bar,
             risk_summary,
             x='risk_category',
             y='total_exposure',
@@ -222,7 +211,7 @@ with tab3:
 with tab4:
     st.subheader("📊 RM Performance Dashboard")
     
-    rm_performance = filtered_df.groupby('relationship_manager').agg({
+    rm_performance = filtered_df.groupby('relationship_manager', observed=True).agg({
         'company_name': 'count',
         'total_exposure': 'sum',
         'satisfaction_score': 'mean',
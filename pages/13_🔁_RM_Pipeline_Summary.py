@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, figures, query
+
 st.set_page_config(
     page_title="RM Pipeline Summary",
     page_icon="🔁",
@@ -15,69 +17,11 @@ st.set_page_config(
 st.title("🔁 RM Pipeline Summary")
 st.markdown("📈 **Comprehensive pipeline overview across all relationship managers**")
 
-# Generate enhanced RM pipeline data
-@st.cache_data
-def generate_rm_pipeline_data():
-    rms = ['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown', 'Lisa Davis', 'James Wilson', 'Maria Garcia', 'Robert Taylor']
-    stages = ['🔍 Prospect', '✅ Qualified', '📋 Proposal', '🤝 Negotiation', '🎉 Closed Won', '❌ Closed Lost']
-    
-    pipeline_data = []
-    
-    for rm in rms:
-        # Generate deals for each RM
-        num_deals = random.randint(8, 20)
-        
-        for i in range(num_deals):
-            stage = random.choice(stages)
-            
-            # Probability based on stage
-            if stage == '❌ Closed Lost':
-                probability = 0
-            elif stage == '🎉 Closed Won':
-                probability = 100
-            elif stage == '🤝 Negotiation':
-                probability = random.randint(70, 90)
-            elif stage == '📋 Proposal':
-                probability = random.randint(50, 75)
-            elif stage == '✅ Qualified':
-                probability = random.randint(30, 60)
-            else:  # Prospect
-                probability = random.randint(10, 40)
-            
-            deal = {
-                'rm_name': rm,
-                'deal_id': f'DEAL-{rm[:2].upper()}-{1000 + i}',
-                'client_name': random.choice(['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro', 'StartupXYZ', 'LogisticsCorp', 'FinanceGroup', 'AutoMotive Co', 'ConsultingFirm']),
-                'deal_name': random.choice(['Credit Facility', 'Term Loan', 'Working Capital', 'Trade Finance', 'Investment Loan', 'Equipment Finance']),
-                'value': random.randint(250000, 15000000),
-                'stage': stage,
-                'probability': probability,
-                'created_date': datetime.now() - timedelta(days=random.randint(1, 120)),
-                'expected_close': datetime.now() + timedelta(days=random.randint(7, 90)),
-                'product_type': random.choice(['Term Loan', 'Credit Line', 'Trade Finance', 'Treasury Services', 'Investment Banking']),
-                'industry': random.choice(['Technology', 'Manufacturing', 'Healthcare', 'Retail', 'Energy', 'Finance', 'Automotive']),
-                'risk_rating': random.choice(['🟢 Low', '🟡 Medium', '🔴 High']),
-                'last_activity': datetime.now() - timedelta(days=random.randint(1, 10))
-            }
-            
-            # Calculate weighted value
-            deal['weighted_value'] = deal['value'] * (deal['probability'] / 100)
-            pipeline_data.append(deal)
-    
-    return pd.DataFrame(pipeline_data)
-
-pipeline_df = generate_rm_pipeline_data()
-
 # RM Performance Overview
 st.subheader("🎯 RM Performance Overview")
 
 # Calculate RM metrics
-rm_summary = pipeline_df.groupby('rm_name').agg({
-    'deal_id': 'count',
-    'value': 'sum',
-    'weighted_value': 'sum',
-    'probability': 'mean'
-}).reset_index()
+rm_summary = aggregates.rm_pipeline()
 
 rm_summary.columns = ['RM', 'Total Deals', 'Pipeline Value', 'Weighted Value', 'Avg Probability']
 
@@ -123,7 +67,8 @@ col1, col2 = st.columns(2)
 
 with col1:
     # RM Pipeline Value Chart
-    fig_rm_value = px.bar(
+    fig_rm_value = figures.plot(
+        px.bar,
         rm_summary.sort_values('Pipeline Value', ascending=True),
         x='Pipeline Value',
         y='RM',
@@ -137,7 +82,8 @@ with col1:
 
 with col2:
     # RM Deal Count vs Avg Probability
-    fig_rm_scatter = px.scatter(
+    fig_rm_scatter = figures.plot(
+        px.scatter,
         rm_summary,
         x='Total Deals',
         y='Avg Probability',
@@ -153,16 +99,14 @@ with col2:
 st.subheader("🔄 Pipeline Stage Distribution")
 
 # Calculate stage distribution across all RMs
-stage_summary = pipeline_df.groupby(['stage', 'rm_name']).agg({
-    'deal_id': 'count',
-    'value': 'sum'
-}).reset_index()
+stage_summary = aggregates.stage_by_rm()
 
 col1, col2 = st.columns(2)
 
 with col1:
     # Stacked bar chart by RM and stage
-    fig_stage_rm = px.bar(
+    fig_stage_rm = figures.plot(
+        px.bar,
         stage_summary,
         x='rm_name',
         y='deal_id',
@@ -175,8 +119,9 @@ with col1:
 
 with col2:
     # Overall stage distribution
-    overall_stages = pipeline_df.groupby('stage')['deal_id'].count().reset_index()
-    fig_stage_pie = px.pie(
+    overall_stages = stage_summary.groupby('stage', as_index=False)['deal_id'].sum()
+    fig_stage_pie = figures.plot(
+        px.pie,
         overall_stages,
         values='deal_id',
         names='stage',
@@ -189,7 +134,7 @@ st.subheader("👤 Individual RM Performance")
 
 # Create performance cards for each RM
 for _, rm_data in rm_summary.iterrows():
-    rm_deals = pipeline_df[pipeline_df['rm_name'] == rm_data['RM']]
+    rm_stages = stage_summary.loc[stage_summary['rm_name'] == rm_data['RM'], ['stage', 'deal_id']]
     
     with st.container():
         col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
@@ -213,7 +158,7 @@ for _, rm_data in rm_summary.iterrows():
         
         with col2:
             st.metric("Deals", rm_data['Total Deals'])
-            won_deals = len(rm_deals[rm_deals['stage'] == '🎉 Closed Won'])
+            won_deals = int(rm_stages.loc[rm_stages['stage'] == '🎉 Closed Won', 'deal_id'].sum())
             st.metric("Won", won_deals)
         
         with col3:
@@ -233,9 +178,9 @@ for _, rm_data in rm_summary.iterrows():
                 st.success(f"Contacting {rm_data['RM']}")
         
         # Mini pipeline for this RM
-        rm_stages = rm_deals.groupby('stage')['deal_id'].count().reset_index()
         if not rm_stages.empty:
-            fig_mini = px.bar(
+            fig_mini = figures.plot(
+                px.bar,
                 rm_stages,
                 x='stage',
                 y='deal_id',
@@ -251,11 +196,12 @@ for _, rm_data in rm_summary.iterrows():
 st.subheader("🔄 Pipeline Workflow Analysis")
 
 # Create workflow data
-workflow_data = pipeline_df.groupby('stage').agg({
-    'deal_id': 'count',
-    'value': 'sum',
-    'weighted_value': 'sum'
-}).reset_index()
+workflow_data = query.sql("""
+    SELECT stage_label AS stage, COUNT(deal_id) AS deal_id, SUM(value) AS value, SUM(weighted_value) AS weighted_value
+    FROM deals
+    GROUP BY stage_label
+    ORDER BY stage_label
+""", 'deals')
 
 # Sort by logical stage order
 stage_order = ['🔍 Prospect', '✅ Qualified', '📋 Proposal', '🤝 Negotiation', '🎉 Closed Won', '❌ Closed Lost']
@@ -313,14 +259,15 @@ tab1, tab2, tab3 = st.tabs(["📈 Trends", "🎯 Targets", "📊 Insights"])
 
 with tab1:
     # Monthly trends
-    pipeline_df['month'] = pipeline_df['created_date'].dt.to_period('M')
-    monthly_trends = pipeline_df.groupby(['month', 'rm_name']).agg({
-        'deal_id': 'count',
-        'value': 'sum'
-    }).reset_index()
-    monthly_trends['month'] = monthly_trends['month'].astype(str)
+    monthly_trends = query.sql(f"""
+        SELECT {query.month('created_date')} AS month, rm_name, COUNT(deal_id) AS deal_id, SUM(value) AS value
+        FROM deals
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """, 'deals')
     
-    fig_trends = px.line(
+    fig_trends = figures.plot(
+        px.line,
         monthly_trends,
         x='month',
         y='value',
@@ -5,40 +5,14 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from pulse import data, figures, paging, timeindex
+
 st.set_page_config(page_title="RM Notifications", page_icon="🔔", layout="wide")
 
 st.title("🔔 RM Notifications & Alerts")
 
-# Generate synthetic notification data
-@st.cache_data
-def generate_notification_data():
-    notifications = []
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro']
-    notification_types = ['Deal Alert', 'Risk Warning', 'Payment Due', 'Meeting Reminder', 'Compliance Alert', 'Opportunity']
-    priorities = ['High', 'Medium', 'Low', 'Critical']
-    statuses = ['Unread', 'Read', 'Acknowledged', 'Resolved']
-    
-    for i in range(50):
-        notification_time = datetime.now() - timedelta(hours=random.randint(1, 168))  # Last week
-        notifications.append({
-            'id': f"NOTIF-{1000+i}",
-            'timestamp': notification_time,
-            'client': random.choice(clients),
-            'type': random.choice(notification_types),
-            'priority': random.choice(priorities),
-            'status': random.choice(statuses),
-            'title': f"Alert for {random.choice(clients)}",
-            'message': f"Important notification regarding {random.choice(notification_types).lower()}",
-            'rm_assigned': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams']),
-            'action_required': random.choice([True, False]),
-            'due_date': notification_time + timedelta(days=random.randint(1, 14)),
-            'source': random.choice(['System', 'AI Engine', 'Manual', 'External API']),
-            'category': random.choice(['Client Management', 'Risk Management', 'Compliance', 'Sales'])
-        })
-    
-    return pd.DataFrame(notifications)
-
-notification_df = generate_notification_data()
+# Shared notification dataset
+notification_df = data.notifications()
 
 # Notification summary metrics
 col1, col2, col3, col4 = st.columns(4)
@@ -56,7 +30,7 @@ with col3:
     st.metric("⚡ Action Required", action_required, delta=f"{random.randint(5, 12)} pending")
 
 with col4:
-    overdue_count = len(notification_df[notification_df['due_date'] < datetime.now()])
+    overdue_count = timeindex.count('notifications', 'due_date', end=datetime.now())
     st.metric("⏰ Overdue", overdue_count, delta="Review needed")
 
 # Filter and search section
@@ -76,20 +50,21 @@ with col3:
 with col4:
     rm_filter = st.selectbox("RM", ['All'] + list(notification_df['rm_assigned'].unique()))
 
-# Apply filters
-filtered_notifications = notification_df.copy()
-
-if priority_filter != 'All':
-    filtered_notifications = filtered_notifications[filtered_notifications['priority'] == priority_filter]
-if status_filter != 'All':
-    filtered_notifications = filtered_notifications[filtered_notifications['status'] == status_filter]
-if type_filter != 'All':
-    filtered_notifications = filtered_notifications[filtered_notifications['type'] == type_filter]
-if rm_filter != 'All':
-    filtered_notifications = filtered_notifications[filtered_notifications['rm_assigned'] == rm_filter]
+# The feed is paged newest first in the SQL engine, a page per query
+filters = {
+    'priority': None if priority_filter == 'All' else [priority_filter],
+    'status': None if status_filter == 'All' else [status_filter],
+    'type': None if type_filter == 'All' else [type_filter],
+    'rm_assigned': None if rm_filter == 'All' else [rm_filter]
+}
+condition, params = paging.where(**filters)
+total_notifications = paging.count('notifications', condition, params)
 
-# Sort by timestamp (newest first)
-filtered_notifications = filtered_notifications.sort_values('timestamp', ascending=False)
+notification_pager = st.session_state.setdefault('notification_feed_pager', paging.Pager())
+notification_pager.start(filters)
+page_notifications, next_cursor = paging.page(
+    'notifications', [('timestamp', 'DESC')], condition, params, after=notification_pager.after
+)
 
 # Notification feed
 st.subheader("📋 Notification Feed")
@@ -110,7 +85,9 @@ status_colors = {
 }
 
 # Display notifications
-for idx, notif in filtered_notifications.head(20).iterrows():
+st.caption(f"Showing {len(page_notifications)} of {total_notifications:,} notifications")
+
+for idx, notif in page_notifications.iterrows():
     with st.container():
         col1, col2, col3, col4 = st.columns([1, 4, 2, 2])
         
@@ -147,6 +124,23 @@ for idx, notif in filtered_notifications.head(20).iterrows():
         
         st.divider()
 
+col1, col2, col3 = st.columns([1, 4, 1])
+
+with col1:
+    st.button(
+        "⬅️ Previous", key="notifications_previous",
+        disabled=notification_pager.number == 1, on_click=notification_pager.previous
+    )
+
+with col2:
+    st.caption(f"Page {notification_pager.number} of {max(1, -(-total_notifications // paging.PAGE_SIZE))}")
+
+with col3:
+    st.button(
+        "Next ➡️", key="notifications_next",
+        disabled=next_cursor is None, on_click=notification_pager.next, args=(next_cursor,)
+    )
+
 # Analytics tabs
 tab1, tab2, tab3, tab4 = st.tabs(["📊 Analytics", "⏰ Timeline", "🎯 Actions", "⚙️ Settings"])
 
@@ -158,7 +152,8 @@ with tab1:
     with col1:
         # Notifications by priority
         priority_counts = notification_df['priority'].value_counts()
-        fig_priority = px.pie(
+        fig_priority = figures.plot(
+            px.pie,
             values=priority_counts.values,
             names=priority_counts.index,
             title="Notifications by Priority",
@@ -174,7 +169,8 @@ with tab1:
     with col2:
         # Notifications by type
         type_counts = notification_df['type'].value_counts()
-        fig_type = px.bar(
+        fig_type = figures.plot(
+            px.bar,
             x=type_counts.index,
             y=type_counts.values,
             title="Notifications by Type"
@@ -183,7 +179,8 @@ with tab1:
     
     # Daily notification trend
     daily_notifications = notification_df.groupby(notification_df['timestamp'].dt.date).size().reset_index(name='count')
-    fig_trend = px.line(
+    fig_trend = figures.plot(
+        px.line,
         daily_notifications,
         x='timestamp',
         y='count',
@@ -199,6 +196,9 @@ with tab2:
     recent_notifications['hours_ago'] = (datetime.now() - recent_notifications['timestamp']).dt.total_seconds() / 3600
     # Convert action_required to int for size
     recent_notifications['action_required_size'] = recent_notifications['action_required'].astype(int)
+    # Plain values, so Plotly draws only the priorities and types present
+    for column in ['priority', 'type']:
+        recent_notifications[column] = recent_notifications[column].astype(str)
     
     fig_timeline = px.scatter(
         recent_notifications,
@@ -292,7 +292,8 @@ with st.sidebar:
     
     st.subheader("📈 Quick Stats")
     
-    today_notifications = len(notification_df[notification_df['timestamp'].dt.date == datetime.now().date()])
+    today = pd.Timestamp(datetime.now().date())
+    today_notifications = timeindex.count('notifications', 'timestamp', start=today, end=today + timedelta(days=1))
     st.metric("Today's Notifications", today_notifications)
     
     response_time = random.uniform(15, 45)
@@ -5,6 +5,8 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+from pulse import cache, data, downsample, figures
+
 st.set_page_config(
     page_title="PULSE Dashboard",
     page_icon="🏦",
@@ -14,37 +16,30 @@ st.set_page_config(
 st.title("🏦 PULSE Executive Dashboard")
 st.markdown("Real-time banking insights and performance metrics")
 
-# Generate sample data
-@st.cache_data
-def generate_dashboard_data():
-    dates = pd.date_range(start='2024-01-01', end='2024-06-27', freq='D')
-    
-    # Revenue data
-    revenue_data = pd.DataFrame({
-        'date': dates,
-        'revenue': np.random.uniform(800000, 1200000, len(dates)) + 
-                  np.sin(np.arange(len(dates)) * 2 * np.pi / 30) * 100000,
-        'target': 1000000
-    })
+# Dashboard view over the shared datasets
+@cache.cached('performance', 'clients', 'deals')
+def load_dashboard_data():
+    revenue_data = data.performance()[['date', 'revenue', 'target']]
     
-    # Client metrics
+    clients = data.clients()
     client_metrics = {
-        'total_clients': 1247,
-        'new_clients_month': 23,
-        'active_clients': 1189,
-        'client_satisfaction': 8.7
+        'total_clients': len(clients),
+        'new_clients_month': int((clients['last_interaction'] >= datetime.now() - timedelta(days=30)).sum()),
+        'active_clients': len(clients),
+        'client_satisfaction': round(clients['satisfaction_score'].mean(), 1)
     }
     
-    # Deal pipeline
-    pipeline_data = pd.DataFrame({
-        'stage': ['Prospect', 'Qualified', 'Proposal', 'Negotiation', 'Closed Won'],
-        'count': [45, 32, 18, 12, 8],
-        'value': [12500000, 8900000, 5600000, 3200000, 2100000]
-    })
+    # Deal pipeline, open stages only
+    deals = data.deals()
+    open_deals = deals[deals['stage'] != 'Closed Lost']
+    pipeline_data = open_deals.groupby('stage', sort=False, observed=True).agg(
+        count=('deal_id', 'count'),
+        value=('value', 'sum')
+    ).reindex(data.STAGES[:5]).reset_index()
     
     return revenue_data, client_metrics, pipeline_data
 
-revenue_data, client_metrics, pipeline_data = generate_dashboard_data()
+revenue_data, client_metrics, pipeline_data = load_dashboard_data()
 
 # Key metrics row
 col1, col2, col3, col4 = st.columns(4)
@@ -82,8 +77,9 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📈 Revenue Trend")
-    fig_revenue = px.line(
-        revenue_data.tail(30), 
+    fig_revenue = figures.plot(
+        px.line,
+        downsample.frame(revenue_data.tail(30), 'date', 'revenue', width=downsample.HALF_WIDTH),
         x='date', 
         y='revenue',
         title="Last 30 Days Revenue Performance"
@@ -93,7 +89,8 @@ with col1:
 
 with col2:
     st.subheader("🎯 Deal Pipeline")
-    fig_pipeline = px.funnel(
+    fig_pipeline = figures.plot(
+        px.funnel,
         pipeline_data,
         x='count',
         y='stage',
@@ -128,7 +125,8 @@ with col1:
         'Percentage': [53, 38, 9]
     })
     
-    fig_risk = px.pie(
+    fig_risk = figures.plot(
+        px.pie,
         risk_data,
         values='Count',
         names='Risk Level',
@@ -144,7 +142,8 @@ with col2:
         'Revenue': [12.5, 8.3, 6.7, 4.2]
     })
     
-    fig_products = px.bar(
+    fig_products = figures.plot(
+        px.bar,
         product_data,
         x='Product',
         y='Revenue',
@@ -160,7 +159,8 @@ with col3:
         'Revenue': [8.5, 6.2, 9.8, 4.1]
     })
     
-    fig_team = px.scatter(
+    fig_team = figures.plot(
+        px.scatter,
         team_data,
         x='Deals',
         y='Revenue',
@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, data
+
 st.set_page_config(
     page_title="RealTime Conversation Intel",
     page_icon="🎙️",
@@ -18,38 +20,8 @@ st.markdown("""
 🚀 **This module uses LangChain, LangGraph, and ReAct-based multi-agent AI tools to deliver insight-driven intelligence for Relationship Managers.**
 """)
 
-# Generate synthetic conversation data
-@st.cache_data
-def generate_conversation_data():
-    conversations = []
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro']
-    topics = ['Credit Expansion', 'Risk Assessment', 'Market Concerns', 'Payment Terms', 'Investment Plans']
-    sentiments = ['Positive', 'Neutral', 'Negative', 'Concerned', 'Optimistic']
-    
-    for i in range(50):
-        conv_date = datetime.now() - timedelta(days=random.randint(0, 30))
-        conversations.append({
-            'timestamp': conv_date,
-            'client': random.choice(clients),
-            'topic': random.choice(topics),
-            'sentiment': random.choice(sentiments),
-            'confidence_score': random.uniform(0.7, 0.98),
-            'risk_indicators': random.randint(0, 5),
-            'opportunity_score': random.uniform(0.3, 0.9),
-            'next_action': random.choice(['Follow-up Call', 'Send Proposal', 'Risk Review', 'Schedule Meeting']),
-            'rm_name': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams']),
-            'duration_minutes': random.randint(15, 90),
-            'key_phrases': random.choice([
-                'expansion plans, credit facility, market volatility',
-                'cash flow concerns, payment delays, restructuring',
-                'growth opportunities, investment, partnership',
-                'regulatory compliance, risk assessment, audit'
-            ])
-        })
-    
-    return pd.DataFrame(conversations)
-
-conversation_df = generate_conversation_data()
+# Shared conversation dataset
+conversation_df = data.conversations()
 
 # Real-time dashboard
 col1, col2, col3, col4 = st.columns(4)
@@ -185,7 +157,7 @@ with tab2:
     
     with col1:
         # Sentiment distribution
-        sentiment_counts = conversation_df['sentiment'].value_counts()
+        sentiment_counts = aggregates.conversation_sentiment()
         fig_sentiment = px.pie(
             values=sentiment_counts.values,
             names=sentiment_counts.index,
@@ -202,7 +174,7 @@ with tab2:
     
     with col2:
         # Risk indicators by client
-        risk_by_client = conversation_df.groupby('client')['risk_indicators'].mean().reset_index()
+        risk_by_client = conversation_df.groupby('client', observed=True)['risk_indicators'].mean().reset_index()
         fig_risk = px.bar(
             risk_by_client,
             x='client',
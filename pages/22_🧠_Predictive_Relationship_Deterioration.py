@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, data, figures
+
 st.set_page_config(
     page_title="Predictive Relationship Deterioration",
     page_icon="🧠",
@@ -18,41 +20,42 @@ st.markdown("""
 🚀 **AI-powered early warning system that predicts client relationship deterioration before it happens.**
 """)
 
-# Generate synthetic relationship health data
-@st.cache_data
+# Relationship health history for the watch list: the highest-risk clients
+# in the shared book, scored from their client, risk and call records
+WATCH_LIST = 10
+
+@cache.cached('clients', 'risk', 'calls')
 def generate_relationship_data():
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro', 
-               'StartupXYZ', 'LogisticsCorp', 'FinanceGroup', 'PropertyDev', 'MediaHouse']
+    rng = np.random.default_rng(data.SEED)
+    risk = data.risk().nlargest(WATCH_LIST, 'risk_score')
+    clients = data.clients().set_index('client_id').loc[risk['client_id']]
+    calls = data.calls()
+    recent_calls = calls[calls['date'] >= datetime.now() - timedelta(days=30)]['client_id'].value_counts()
     
     relationships = []
-    for client in clients:
-        # Generate historical data points
+    for (_, account), (_, client) in zip(risk.iterrows(), clients.iterrows()):
+        current = float(np.clip(0.5 * client['satisfaction_score'] / 10 + 0.5 * (1 - account['risk_score'] / 10), 0.2, 0.95))
+        # Deteriorating accounts were healthier a quarter ago; the rest drift around today's score
+        decline = 0.4 if account['risk_trend'] == 'Deteriorating' else 0.0
         for days_back in range(90, 0, -7):  # Weekly data points for 90 days
             date = datetime.now() - timedelta(days=days_back)
-            
-            # Simulate deterioration patterns for some clients
-            base_health = random.uniform(0.6, 0.95)
-            if client in ['RetailChain PLC', 'StartupXYZ']:  # Simulate deteriorating relationships
-                deterioration_factor = (90 - days_back) / 90 * 0.4  # Gradual decline
-                health_score = max(0.2, base_health - deterioration_factor)
-            else:
-                health_score = base_health + random.uniform(-0.1, 0.1)
+            health_score = float(np.clip(current + decline * days_back / 90 + rng.uniform(-0.05, 0.05), 0.05, 1.0))
             
             relationships.append({
-                'client': client,
+                'client': account['client_name'],
                 'date': date,
                 'health_score': health_score,
-                'interaction_frequency': random.randint(1, 15),
-                'response_time_hours': random.uniform(2, 48),
+                'interaction_frequency': int(recent_calls.get(account['client_id'], 0)),
+                'response_time_hours': rng.uniform(2, 48),
                 'satisfaction_score': health_score * 10,
-                'payment_delays': random.randint(0, 3),
-                'complaint_count': random.randint(0, 2),
-                'product_usage': random.uniform(0.3, 1.0),
-                'revenue_trend': random.uniform(-0.2, 0.3),
-                'risk_indicators': random.randint(0, 5),
-                'engagement_score': health_score * random.uniform(0.8, 1.2),
+                'payment_delays': {'Breach': 3, 'Warning': 1}.get(account['covenant_status'], 0),
+                'complaint_count': int(rng.integers(0, 3)),
+                'product_usage': client['products_used'] / 8,
+                'revenue_trend': float(account['revenue_growth']),
+                'risk_indicators': int(round(account['risk_score'] / 2)),
+                'engagement_score': health_score * rng.uniform(0.8, 1.2),
                 'churn_probability': 1 - health_score,
-                'predicted_action': random.choice(['Monitor', 'Engage', 'Urgent Action', 'Escalate'])
+                'predicted_action': 'Escalate' if health_score < 0.3 else 'Urgent Action' if health_score < 0.5 else 'Engage' if health_score < 0.7 else 'Monitor'
             })
     
     return pd.DataFrame(relationships)
@@ -162,13 +165,14 @@ with tab1:
     selected_clients = st.multiselect(
         "Select clients to analyze",
         options=relationship_df['client'].unique(),
-        default=['RetailChain PLC', 'StartupXYZ', 'TechCorp Ltd']
+        default=current_health.nsmallest(3, 'health_score')['client'].tolist()
     )
     
     if selected_clients:
         trend_data = relationship_df[relationship_df['client'].isin(selected_clients)]
         
-        fig_trends = px.line(
+        fig_trends = figures.plot(
+            px.line,
             trend_data,
             x='date',
             y='health_score',
@@ -187,7 +191,8 @@ with tab1:
         
         with col1:
             # Health score vs satisfaction correlation
-            fig_corr1 = px.scatter(
+            fig_corr1 = figures.plot(
+                px.scatter,
                 current_health,
                 x='satisfaction_score',
                 y='health_score',
@@ -200,7 +205,8 @@ with tab1:
         
         with col2:
             # Risk factors distribution
-            fig_risk = px.histogram(
+            fig_risk = figures.plot(
+                px.histogram,
                 current_health,
                 x='risk_indicators',
                 title="Risk Indicators Distribution",
@@ -236,7 +242,8 @@ with tab2:
         'Importance': [0.23, 0.19, 0.18, 0.15, 0.12, 0.08, 0.05]
     })
     
-    fig_importance = px.bar(
+    fig_importance = figures.plot(
+        px.bar,
         features,
         x='Importance',
         y='Feature',
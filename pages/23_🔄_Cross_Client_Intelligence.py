@@ -1,34 +1,41 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, data, figures
+
 st.set_page_config(page_title="Cross Client Intelligence", page_icon="🔄", layout="wide")
 
 st.title("🔄 Cross Client Intelligence")
 
-# Generate synthetic cross-client data
-@st.cache_data
+# Connections between the largest clients in the shared book, scored from
+# their client and risk records
+NETWORK_SIZE = 5
+
+@cache.cached('clients', 'risk')
 def generate_cross_client_data():
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro']
-    sectors = ['Technology', 'Manufacturing', 'Retail', 'Energy', 'Healthcare']
+    rng = np.random.default_rng(data.SEED)
+    clients = data.clients().nlargest(NETWORK_SIZE, 'annual_revenue')
+    risk_scores = data.risk().set_index('client_id')['risk_score']
     
     connections = []
-    for i, client1 in enumerate(clients):
-        for j, client2 in enumerate(clients):
+    for i, (_, client1) in enumerate(clients.iterrows()):
+        for j, (_, client2) in enumerate(clients.iterrows()):
             if i != j:
+                same_industry = client1['industry'] == client2['industry']
+                risk_gap = abs(float(risk_scores.get(client1['client_id'], 5)) - float(risk_scores.get(client2['client_id'], 5)))
                 connections.append({
-                    'client_a': client1,
-                    'client_b': client2,
-                    'connection_strength': random.uniform(0.1, 0.9),
-                    'shared_suppliers': random.randint(0, 5),
-                    'shared_customers': random.randint(0, 8),
-                    'geographic_overlap': random.uniform(0, 1),
-                    'business_synergy': random.uniform(0.2, 0.95),
-                    'risk_correlation': random.uniform(0.1, 0.8)
+                    'client_a': client1['client_name'],
+                    'client_b': client2['client_name'],
+                    'connection_strength': rng.uniform(0.1, 0.9),
+                    'shared_suppliers': int(rng.integers(0, 6)) + 2 * same_industry,
+                    'shared_customers': int(rng.integers(0, 9)),
+                    'geographic_overlap': 1.0 if client1['region'] == client2['region'] else 0.5 if client1['country'] == client2['country'] else rng.uniform(0, 0.3),
+                    'business_synergy': min(0.95, rng.uniform(0.2, 0.75) + 0.2 * same_industry),
+                    'risk_correlation': 1 - risk_gap / 10
                 })
     
     return pd.DataFrame(connections)
@@ -46,10 +53,10 @@ with col4:
     st.metric("🌐 Network Density", f"{cross_data['connection_strength'].mean():.2f}")
 
 # Network visualization
-fig = px.scatter(cross_data, x='connection_strength', y='business_synergy', 
-                size='shared_customers', color='risk_correlation',
-                hover_data=['client_a', 'client_b'],
-                title="Client Network Analysis")
+fig = figures.scatter(cross_data, 'connection_strength', 'business_synergy',
+                      size='shared_customers', color='risk_correlation',
+                      hover_data=['client_a', 'client_b'],
+                      title="Client Network Analysis")
 st.plotly_chart(fig, use_container_width=True)
 
 # Cross-selling opportunities
@@ -5,29 +5,42 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, data, downsample, figures
+
 st.set_page_config(page_title="Dynamic Persona Tracking", page_icon="🧬", layout="wide")
 
 st.title("🧬 Dynamic Persona Tracking")
 
-# Generate persona evolution data
-@st.cache_data
+# Persona evolution for the clients contributing most revenue in the shared
+# book, starting from their client and risk records
+TRACKED_CLIENTS = 4
+
+@cache.cached('clients', 'risk')
 def generate_persona_data():
-    personas = []
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd']
-    persona_types = ['Conservative', 'Growth-Oriented', 'Risk-Averse', 'Aggressive', 'Balanced']
+    rng = np.random.default_rng(data.SEED)
+    clients = data.clients().nlargest(TRACKED_CLIENTS, 'revenue_contribution')
+    risk_scores = data.risk().set_index('client_id')['risk_score']
+    growth = {'High': 0.75, 'Medium': 0.5, 'Low': 0.3}
     
-    for client in clients:
+    personas = []
+    for _, client in clients.iterrows():
+        risk_appetite = 1 - float(risk_scores.get(client['client_id'], 5)) / 10
         for days_back in range(30, 0, -1):
             date = datetime.now() - timedelta(days=days_back)
+            risk_appetite = float(np.clip(risk_appetite + rng.normal(0, 0.03), 0.1, 0.9))
+            growth_focus = float(np.clip(growth.get(client['growth_potential'], 0.5) + rng.normal(0, 0.05), 0.2, 0.8))
             personas.append({
-                'client': client,
+                'client': client['client_name'],
                 'date': date,
-                'persona_type': random.choice(persona_types),
-                'confidence_score': random.uniform(0.6, 0.95),
-                'risk_appetite': random.uniform(0.1, 0.9),
-                'growth_focus': random.uniform(0.2, 0.8),
-                'decision_speed': random.uniform(0.3, 0.9),
-                'relationship_depth': random.uniform(0.4, 1.0)
+                'persona_type': (
+                    'Aggressive' if risk_appetite > 0.75 else 'Growth-Oriented' if growth_focus > 0.6
+                    else 'Risk-Averse' if risk_appetite < 0.3 else 'Conservative' if risk_appetite < 0.45 else 'Balanced'
+                ),
+                'confidence_score': rng.uniform(0.6, 0.95),
+                'risk_appetite': risk_appetite,
+                'growth_focus': growth_focus,
+                'decision_speed': rng.uniform(0.3, 0.9),
+                'relationship_depth': min(1.0, 0.4 + client['relationship_length'] / 25)
             })
     
     return pd.DataFrame(personas)
@@ -45,8 +58,10 @@ with col4:
     st.metric("⚡ Real-time Updates", "Live")
 
 # Persona evolution chart
-fig = px.line(persona_df, x='date', y='risk_appetite', color='client',
-              title="Risk Appetite Evolution by Client")
+# At most a chart width of points per client reaches the browser
+persona_trend = downsample.frame(persona_df, 'date', 'risk_appetite', by='client')
+fig = figures.plot(px.line, persona_trend, x='date', y='risk_appetite', color='client',
+                   title="Risk Appetite Evolution by Client")
 st.plotly_chart(fig, use_container_width=True)
 
 # Current persona analysis
@@ -5,33 +5,34 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, data, figures
+
 st.set_page_config(page_title="Contextual Deal Assistant", page_icon="🧾", layout="wide")
 
 st.title("🧾 Contextual Deal Assistant")
 
-# Generate deal context data
-@st.cache_data
+# Deals still in the pipeline (Prospect to Negotiation) from the shared book,
+# scored against their client's relationship
+@cache.cached('deals', 'clients')
 def generate_deal_data():
-    deals = []
-    clients = ['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd']
-    deal_types = ['Credit Facility', 'Trade Finance', 'Investment Loan', 'Working Capital']
-    
-    for i in range(20):
-        deals.append({
-            'deal_id': f"DEAL-{1000+i}",
-            'client': random.choice(clients),
-            'deal_type': random.choice(deal_types),
-            'amount': random.randint(500000, 50000000),
-            'stage': random.choice(['Prospect', 'Proposal', 'Negotiation', 'Documentation', 'Closed']),
-            'probability': random.uniform(0.3, 0.95),
-            'ai_score': random.uniform(0.6, 0.98),
-            'risk_rating': random.choice(['Low', 'Medium', 'High']),
-            'timeline_days': random.randint(30, 180),
-            'competitive_intel': random.choice(['High', 'Medium', 'Low']),
-            'relationship_score': random.uniform(0.5, 1.0)
-        })
+    deals = data.deals()
+    deals = deals[deals['stage_value'].between(1, 4)]
+    satisfaction = data.clients().set_index('client_id')['satisfaction_score']
+    relationship_score = (deals['client_id'].map(satisfaction).astype('float64') / 10).fillna(0.5).clip(0.5, 1.0)
+    probability = deals['probability'].astype('float64') / 100
     
-    return pd.DataFrame(deals)
+    return pd.DataFrame({
+        'deal_id': deals['deal_id'],
+        'client': deals['client_name'],
+        'deal_type': deals['product_type'],
+        'amount': deals['value'],
+        'stage': deals['stage'],
+        'probability': probability,
+        'ai_score': (0.6 * probability + 0.4 * relationship_score).clip(0.6, 0.98),
+        'risk_rating': deals['risk_rating'],
+        'timeline_days': (deals['expected_close'] - pd.Timestamp(datetime.now())).dt.days.clip(lower=0),
+        'relationship_score': relationship_score
+    }).reset_index(drop=True)
 
 deal_df = generate_deal_data()
 
@@ -67,7 +68,8 @@ for _, deal in top_deals.iterrows():
                 st.success("Deal prioritized!")
 
 # Deal pipeline visualization
-fig = px.sunburst(deal_df, path=['stage', 'deal_type'], values='amount',
-                  title="Deal Pipeline by Stage and Type")
+pipeline = deal_df.groupby(['stage', 'deal_type'], observed=True)['amount'].sum().reset_index()
+fig = figures.plot(px.sunburst, pipeline, path=['stage', 'deal_type'], values='amount',
+                   title="Deal Pipeline by Stage and Type")
 st.plotly_chart(fig, use_container_width=True)
 
@@ -5,12 +5,14 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import random
 
+from pulse import cache, figures
+
 st.set_page_config(page_title="Regulatory Intelligence", page_icon="⚖️", layout="wide")
 
 st.title("⚖️ Regulatory Intelligence")
 
 # Generate regulatory data
-@st.cache_data
+@cache.cached()
 def generate_regulatory_data():
     regulations = []
     reg_types = ['Basel III', 'GDPR', 'AML/KYC', 'IFRS', 'Stress Testing', 'Capital Requirements']
@@ -50,7 +52,8 @@ with col4:
 
 # Regulatory timeline
 st.subheader("📅 Regulatory Timeline")
-fig = px.scatter(
+fig = figures.plot(
+    px.scatter,
     reg_df,
     x='deadline',
     y='regulation_type',
@@ -2,6 +2,8 @@
 import streamlit as st
 import plotly.graph_objects as go
 
+from pulse import figures
+
 st.title("🛰️ Agent Flow Dashboard – Real-time Interaction View")
 
 st.markdown("This is a simulated visualization of the agentic AI workflow for RM deal management.")
@@ -13,7 +15,8 @@ targets = [1, 2, 3]
 values = [10, 10, 10]
 
 # Build the graph
-fig = go.Figure(data=[go.Sankey(
+fig = figures.plot(go.Figure, data=[dict(
+    type="sankey",
     node=dict(
         pad=20,
         thickness=30,
@@ -26,9 +29,7 @@ fig = go.Figure(data=[go.Sankey(
         target=targets,
         value=values,
         color=["#A6CEE3", "#B2DF8A", "#FB9A99"]
-    ))])
-
-fig.update_layout(title_text="Agent-to-Agent Workflow", font_size=13)
+    ))], layout=dict(title_text="Agent-to-Agent Workflow", font_size=13))
 st.plotly_chart(fig, use_container_width=True)
 
 st.markdown("### 🔄 Sample Agent Actions")
@@ -2,6 +2,8 @@ import streamlit as st
 import pandas as pd
 import json
 
+from pulse import cache, data, db, figures, incremental, sections, tabs, vectors
+
 st.set_page_config(
     page_title="Admin Configuration",
     page_icon="⚙️",
@@ -20,15 +22,15 @@ if st.session_state.user_role not in ['Administrator', 'Super Admin']:
     st.stop()
 
 # Admin tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+tab1, tab2, tab3, tab4, tab5 = tabs.lazy([
     "👥 User Management", 
     "🔐 Roles & Permissions", 
     "🎨 UI Configuration", 
     "🌐 Localization", 
     "🔧 System Settings"
-])
+], key='admin_tab')
 
-with tab1:
+if tab1:
     st.header("👥 User Management")
     
     # User creation form
@@ -36,10 +38,10 @@ with tab1:
         col1, col2 = st.columns(2)
         
         with col1:
-            new_username = st.text_input("Username")
-            new_email = st.text_input("Email")
-            new_first_name = st.text_input("First Name")
-            new_last_name = st.text_input("Last Name")
+            new_username = st.text_input("Username", **tabs.keep('admin_new_username', ''))
+            new_email = st.text_input("Email", **tabs.keep('admin_new_email', ''))
+            new_first_name = st.text_input("First Name", **tabs.keep('admin_new_first_name', ''))
+            new_last_name = st.text_input("Last Name", **tabs.keep('admin_new_last_name', ''))
         
         with col2:
             new_role = st.selectbox("Role", [
@@ -48,15 +50,15 @@ with tab1:
                 "Risk Manager",
                 "Administrator",
                 "Read-Only User"
-            ])
+            ], **tabs.keep('admin_new_role', "Relationship Manager"))
             new_department = st.selectbox("Department", [
                 "Commercial Banking",
                 "Risk Management",
                 "Credit",
                 "Operations",
                 "IT"
-            ])
-            new_status = st.selectbox("Status", ["Active", "Inactive", "Pending"])
+            ], **tabs.keep('admin_new_department', "Commercial Banking"))
+            new_status = st.selectbox("Status", ["Active", "Inactive", "Pending"], **tabs.keep('admin_new_status', "Active"))
         
         if st.button("Create User"):
             st.success(f"✅ User '{new_username}' created successfully!")
@@ -79,7 +81,7 @@ with tab1:
     
     st.dataframe(users_data, use_container_width=True)
 
-with tab2:
+if tab2:
     st.header("🔐 Roles & Permissions")
     
     # Role selection
@@ -134,7 +136,7 @@ with tab2:
         }
     }
     
-    selected_role = st.selectbox("Select Role to Configure", list(roles.keys()))
+    selected_role = st.selectbox("Select Role to Configure", list(roles.keys()), **tabs.keep('admin_role', list(roles.keys())[0]))
     role_info = roles[selected_role]
     
     col1, col2 = st.columns([1, 2])
@@ -163,12 +165,11 @@ with tab2:
                     checked = perm in perms
                     st.checkbox(
                         perm, 
-                        value=checked, 
-                        key=f"{selected_role}_{category}_{perm}",
-                        disabled=selected_role == "Super Administrator"
+                        disabled=selected_role == "Super Administrator",
+                        **tabs.keep(f"{selected_role}_{category}_{perm}", checked)
                     )
 
-with tab3:
+if tab3:
     st.header("🎨 UI Configuration")
     
     # Theme configuration
@@ -184,7 +185,7 @@ with tab3:
             "Premium Purple": {"primary": "#8B5CF6", "secondary": "#7C3AED", "accent": "#A78BFA"}
         }
         
-        selected_theme = st.selectbox("Select Theme", list(themes.keys()))
+        selected_theme = st.selectbox("Select Theme", list(themes.keys()), **tabs.keep('admin_theme', "Corporate Blue"))
         
         # Color preview
         theme_colors = themes[selected_theme]
@@ -198,36 +199,36 @@ with tab3:
         
         # Custom colors
         st.markdown("**Custom Colors**")
-        primary_color = st.color_picker("Primary Color", theme_colors['primary'])
-        secondary_color = st.color_picker("Secondary Color", theme_colors['secondary'])
-        accent_color = st.color_picker("Accent Color", theme_colors['accent'])
+        primary_color = st.color_picker("Primary Color", **tabs.keep(f'admin_{selected_theme}_primary', theme_colors['primary']))
+        secondary_color = st.color_picker("Secondary Color", **tabs.keep(f'admin_{selected_theme}_secondary', theme_colors['secondary']))
+        accent_color = st.color_picker("Accent Color", **tabs.keep(f'admin_{selected_theme}_accent', theme_colors['accent']))
     
     with col2:
         st.subheader("📐 Layout Settings")
         
-        sidebar_position = st.selectbox("Sidebar Position", ["Left", "Right", "Collapsible"])
-        header_style = st.selectbox("Header Style", ["Fixed", "Sticky", "Static"])
-        content_width = st.selectbox("Content Width", ["Full Width", "Boxed", "Fluid"])
-        card_style = st.selectbox("Card Style", ["Shadow", "Border", "Flat", "Elevated"])
+        sidebar_position = st.selectbox("Sidebar Position", ["Left", "Right", "Collapsible"], **tabs.keep('admin_sidebar_position', "Left"))
+        header_style = st.selectbox("Header Style", ["Fixed", "Sticky", "Static"], **tabs.keep('admin_header_style', "Fixed"))
+        content_width = st.selectbox("Content Width", ["Full Width", "Boxed", "Fluid"], **tabs.keep('admin_content_width', "Full Width"))
+        card_style = st.selectbox("Card Style", ["Shadow", "Border", "Flat", "Elevated"], **tabs.keep('admin_card_style', "Shadow"))
         
         st.subheader("🔤 Typography")
         
         font_family = st.selectbox("Font Family", [
             "Inter", "Roboto", "Open Sans", "Lato", "Montserrat"
-        ])
-        font_size = st.selectbox("Base Font Size", ["14px", "15px", "16px", "17px", "18px"])
+        ], **tabs.keep('admin_font_family', "Inter"))
+        font_size = st.selectbox("Base Font Size", ["14px", "15px", "16px", "17px", "18px"], **tabs.keep('admin_font_size', "14px"))
         
         st.subheader("📱 Responsive Settings")
         
-        mobile_sidebar = st.checkbox("Collapsible sidebar on mobile", value=True)
-        touch_friendly = st.checkbox("Touch-friendly interface", value=True)
+        mobile_sidebar = st.checkbox("Collapsible sidebar on mobile", **tabs.keep('admin_mobile_sidebar', True))
+        touch_friendly = st.checkbox("Touch-friendly interface", **tabs.keep('admin_touch_friendly', True))
         
     # Apply settings
     if st.button("💾 Apply UI Settings"):
         st.success("✅ UI settings applied successfully!")
         st.balloons()
 
-with tab4:
+if tab4:
     st.header("🌐 Localization Management")
     
     # Language settings
@@ -250,7 +251,7 @@ with tab4:
             with col_lang:
                 st.write(lang)
             with col_active:
-                st.checkbox("Active", value=info["active"], key=f"lang_{info['code']}")
+                st.checkbox("Active", **tabs.keep(f"lang_{info['code']}", info["active"]))
             with col_completion:
                 st.write(info["completion"])
             with col_action:
@@ -269,12 +270,12 @@ with tab4:
             "menu.analytics": "Analytics"
         }
         
-        selected_label = st.selectbox("Select Label", list(labels.keys()))
+        selected_label = st.selectbox("Select Label", list(labels.keys()), **tabs.keep('admin_label', "dashboard.title"))
         
         # Edit form
-        english_text = st.text_input("English", value=labels[selected_label])
-        french_text = st.text_input("French", placeholder="Tableau de bord")
-        german_text = st.text_input("German", placeholder="Armaturenbrett")
+        english_text = st.text_input("English", **tabs.keep(f'admin_label_en_{selected_label}', labels[selected_label]))
+        french_text = st.text_input("French", placeholder="Tableau de bord", **tabs.keep(f'admin_label_fr_{selected_label}', ''))
+        german_text = st.text_input("German", placeholder="Armaturenbrett", **tabs.keep(f'admin_label_de_{selected_label}', ''))
         
         if st.button("💾 Save Label"):
             st.success(f"✅ Label '{selected_label}' updated!")
@@ -302,7 +303,7 @@ with tab4:
         if st.button("🔄 Sync with Translation Service"):
             st.info("Syncing with external translation service...")
 
-with tab5:
+if tab5:
     st.header("🔧 System Settings")
     
     # Security settings
@@ -311,39 +312,53 @@ with tab5:
     with col1:
         st.subheader("🔐 Security Configuration")
         
-        session_timeout = st.number_input("Session Timeout (minutes)", value=30, min_value=5, max_value=480)
-        password_expiry = st.number_input("Password Expiry (days)", value=90, min_value=30, max_value=365)
-        max_login_attempts = st.number_input("Max Login Attempts", value=3, min_value=1, max_value=10)
+        session_timeout = st.number_input("Session Timeout (minutes)", min_value=5, max_value=480, **tabs.keep('admin_session_timeout', 30))
+        password_expiry = st.number_input("Password Expiry (days)", min_value=30, max_value=365, **tabs.keep('admin_password_expiry', 90))
+        max_login_attempts = st.number_input("Max Login Attempts", min_value=1, max_value=10, **tabs.keep('admin_max_login_attempts', 3))
         
         st.markdown("**Password Requirements**")
-        min_length = st.number_input("Minimum Length", value=8, min_value=6, max_value=20)
-        require_uppercase = st.checkbox("Require uppercase letters", value=True)
-        require_numbers = st.checkbox("Require numbers", value=True)
-        require_symbols = st.checkbox("Require special characters", value=True)
+        min_length = st.number_input("Minimum Length", min_value=6, max_value=20, **tabs.keep('admin_min_length', 8))
+        require_uppercase = st.checkbox("Require uppercase letters", **tabs.keep('admin_require_uppercase', True))
+        require_numbers = st.checkbox("Require numbers", **tabs.keep('admin_require_numbers', True))
+        require_symbols = st.checkbox("Require special characters", **tabs.keep('admin_require_symbols', True))
         
         st.markdown("**Audit & Logging**")
-        enable_audit = st.checkbox("Enable audit logging", value=True)
-        log_retention = st.number_input("Log retention (days)", value=365, min_value=30, max_value=2555)
+        enable_audit = st.checkbox("Enable audit logging", **tabs.keep('admin_enable_audit', True))
+        log_retention = st.number_input("Log retention (days)", min_value=30, max_value=2555, **tabs.keep('admin_log_retention', 365))
     
     with col2:
         st.subheader("💾 Data Management")
         
-        data_retention = st.number_input("Data Retention (years)", value=7, min_value=1, max_value=20)
-        backup_frequency = st.selectbox("Backup Frequency", ["Daily", "Weekly", "Monthly"])
-        backup_retention = st.number_input("Backup Retention (months)", value=12, min_value=1, max_value=60)
+        # Saved system settings, read through the pooled database connection
+        stored_settings = db.settings({
+            'data_retention': 7,
+            'backup_frequency': "Daily",
+            'backup_retention': 12,
+            'max_concurrent_users': 100,
+            'maintenance_window': "Sunday 02:00-04:00",
+            'auto_updates': False
+        })
+        backup_options = ["Daily", "Weekly", "Monthly"]
+        maintenance_options = [
+            "Sunday 02:00-04:00",
+            "Saturday 23:00-01:00", 
+            "Daily 01:00-02:00"
+        ]
+        
+        data_retention = st.number_input("Data Retention (years)", min_value=1, max_value=20, **tabs.keep('admin_data_retention', stored_settings['data_retention']))
+        backup_frequency = st.selectbox("Backup Frequency", backup_options, **tabs.keep('admin_backup_frequency', stored_settings['backup_frequency']))
+        backup_retention = st.number_input("Backup Retention (months)", min_value=1, max_value=60, **tabs.keep('admin_backup_retention', stored_settings['backup_retention']))
         
         st.markdown("**Performance Settings**")
-        cache_duration = st.number_input("Cache Duration (hours)", value=24, min_value=1, max_value=168)
-        max_concurrent_users = st.number_input("Max Concurrent Users", value=100, min_value=10, max_value=1000)
+        cache_stats = cache.stats()
+        cache_duration = st.number_input("Cache Duration (hours)", min_value=1, max_value=168, **tabs.keep('admin_cache_duration', int(cache_stats['ttl_hours'])))
+        cache_size = st.number_input("Cache Size Limit (MB)", min_value=64, max_value=65536, step=64, **tabs.keep('admin_cache_size', int(cache_stats['max_bytes'] / 1024 / 1024)))
+        max_concurrent_users = st.number_input("Max Concurrent Users", min_value=10, max_value=1000, **tabs.keep('admin_max_concurrent_users', stored_settings['max_concurrent_users']))
         
         st.markdown("**Maintenance**")
-        maintenance_window = st.selectbox("Maintenance Window", [
-            "Sunday 02:00-04:00",
-            "Saturday 23:00-01:00", 
-            "Daily 01:00-02:00"
-        ])
+        maintenance_window = st.selectbox("Maintenance Window", maintenance_options, **tabs.keep('admin_maintenance_window', stored_settings['maintenance_window']))
         
-        auto_updates = st.checkbox("Enable automatic updates", value=False)
+        auto_updates = st.checkbox("Enable automatic updates", **tabs.keep('admin_auto_updates', stored_settings['auto_updates']))
     
     # System status
     st.subheader("📊 System Status")
@@ -362,8 +377,88 @@ with tab5:
     with status_col4:
         st.metric("Response Time", "120ms", "-15ms")
     
+    # Live statistics from the shared data cache
+    cache_stats = cache.stats()
+    cache_col1, cache_col2, cache_col3, cache_col4 = st.columns(4)
+    
+    with cache_col1:
+        st.metric("Cache Hit Rate", f"{cache_stats['hit_rate']:.1%}", f"{cache_stats['hits']:,} hits")
+    
+    with cache_col2:
+        st.metric("Cache Misses", f"{cache_stats['misses']:,}", f"{cache_stats['expirations']:,} expired", delta_color="off")
+    
+    with cache_col3:
+        st.metric("Cache Evictions", f"{cache_stats['evictions']:,}", delta_color="off")
+    
+    with cache_col4:
+        st.metric(
+            "Cache Memory",
+            f"{cache_stats['bytes'] / 1024 / 1024:.1f} MB",
+            f"{cache_stats['bytes'] / cache_stats['max_bytes']:.0%} of {cache_stats['max_bytes'] / 1024 / 1024:,.0f} MB",
+            delta_color="off"
+        )
+    st.caption(
+        f"Datasets pinned outside the budget: {cache_stats['pinned']} "
+        f"({cache_stats['pinned_bytes'] / 1024 / 1024:,.1f} MB, see the Memory Report page)"
+    )
+    
+    with st.expander(f"🗄️ Cached Entries ({cache_stats['entries'] + cache_stats['pinned']})"):
+        st.dataframe(cache.manager.entries(), use_container_width=True)
+        
+        inv_col1, inv_col2 = st.columns([3, 1])
+        with inv_col1:
+            invalidate_target = st.selectbox("Invalidate dataset", ["All datasets"] + data.datasets(), **tabs.keep('admin_invalidate_target', "All datasets"))
+        with inv_col2:
+            st.write("")
+            if st.button("🗑️ Invalidate"):
+                dropped = cache.invalidate(None if invalidate_target == "All datasets" else invalidate_target)
+                st.success(f"Dropped {dropped} cached entries")
+    
+    # Page sections reusing their outputs across reruns
+    section_stats = sections.stats()
+    with st.expander(f"🧩 Page Sections ({len(section_stats)})"):
+        st.dataframe(
+            pd.DataFrame.from_dict(section_stats, orient='index', columns=['runs', 'reuses', 'seconds', 'saved']),
+            use_container_width=True,
+            column_config={
+                'seconds': st.column_config.NumberColumn("Compute (s)", format="%.3f"),
+                'saved': st.column_config.NumberColumn("Saved (s)", format="%.3f")
+            }
+        )
+    
+    figure_stats = figures.stats()
+    with st.expander(f"📈 Figure Cache ({len(figure_stats)})"):
+        st.dataframe(
+            pd.DataFrame.from_dict(figure_stats, orient='index', columns=['builds', 'reuses', 'seconds', 'saved']),
+            use_container_width=True,
+            column_config={
+                'seconds': st.column_config.NumberColumn("Build (s)", format="%.3f"),
+                'saved': st.column_config.NumberColumn("Saved (s)", format="%.3f")
+            }
+        )
+    
+    with st.expander("🔁 Incremental Rollups"):
+        st.caption("Compare each rollup and the semantic index, as updated from deltas, with a full rebuild")
+        if st.button("🔍 Verify Rollups"):
+            drifted = incremental.check() + [f"semantic index {label}" for label in vectors.CORPUS.check()]
+            if drifted:
+                st.error("Rollups out of step with their data: " + "; ".join(drifted))
+            else:
+                st.success("Every rollup and the semantic index match a full rebuild")
+    
     # Apply settings
     if st.button("💾 Apply System Settings"):
+        cache.configure(ttl_hours=cache_duration, max_mb=cache_size)
+        db.save_settings({
+            'data_retention': data_retention,
+            'backup_frequency': backup_frequency,
+            'backup_retention': backup_retention,
+            'max_concurrent_users': max_concurrent_users,
+            'maintenance_window': maintenance_window,
+            'auto_updates': auto_updates,
+            'cache_duration': cache_duration,
+            'cache_size': cache_size
+        })
         st.success("✅ System settings applied successfully!")
         st.info("Some changes may require a system restart to take effect.")
 
@@ -3,6 +3,8 @@ import streamlit as st
 import plotly.graph_objects as go
 import random
 
+from pulse import figures
+
 st.title("🛠️ Agent Failure & Rerouting Simulation")
 
 # Simulate failure scenario
@@ -34,7 +36,8 @@ targets = target_map[failure]
 values = [10 for _ in sources]
 
 # Sankey diagram
-fig = go.Figure(data=[go.Sankey(
+fig = figures.plot(go.Figure, data=[dict(
+    type="sankey",
     node=dict(
         pad=20,
         thickness=30,
@@ -47,9 +50,7 @@ fig = go.Figure(data=[go.Sankey(
         target=targets,
         value=values,
         color=["#A6CEE3", "#FF6666", "#FFCC99", "#A6CEE3"][:len(sources)]
-    ))])
-
-fig.update_layout(title_text="Agent Flow with Failure Simulation", font_size=12)
+    ))], layout=dict(title_text="Agent Flow with Failure Simulation", font_size=12))
 st.plotly_chart(fig, use_container_width=True)
 
 st.markdown("### 🔄 Agent Rerouting Log")
@@ -0,0 +1,105 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from pulse import cache, data, schema
+
+st.set_page_config(
+    page_title="Memory Report",
+    page_icon="💾",
+    layout="wide"
+)
+
+st.title("💾 Dataset Memory Report")
+st.markdown("Footprint of each shared dataset under the compact schema, compared with plain object/int64/float64 columns")
+
+# Per-column report for every dataset, rebuilt when a dataset is reloaded
+@cache.cached(*data.datasets())
+def load_memory_report(versions):
+    reports = []
+    for name in data.datasets():
+        report = schema.report(data.get(name))
+        report.insert(0, 'dataset', name)
+        reports.append(report)
+    return pd.concat(reports, ignore_index=True)
+
+report_df = load_memory_report(tuple(data.version(name) for name in data.datasets()))
+
+dataset_df = report_df.groupby('dataset', sort=False).agg(
+    columns=('column', 'count'),
+    bytes=('bytes', 'sum'),
+    legacy_bytes=('legacy_bytes', 'sum')
+).reset_index()
+dataset_df['rows'] = [len(data.get(name)) for name in dataset_df['dataset']]
+dataset_df['saving'] = 1 - dataset_df['bytes'] / dataset_df['legacy_bytes']
+
+# Overview metrics
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("Datasets", len(dataset_df), f"scale {data.SCALE:g}", delta_color="off")
+
+with col2:
+    st.metric("Current Footprint", f"{dataset_df['bytes'].sum() / 1024 / 1024:,.1f} MB")
+
+with col3:
+    st.metric("Legacy Footprint", f"{dataset_df['legacy_bytes'].sum() / 1024 / 1024:,.1f} MB")
+
+with col4:
+    total_saving = 1 - dataset_df['bytes'].sum() / dataset_df['legacy_bytes'].sum()
+    st.metric("Memory Saved", f"{total_saving:.0%}")
+
+# Before / after by dataset
+st.subheader("📊 Bytes by Dataset")
+
+chart_df = dataset_df.melt(
+    id_vars='dataset',
+    value_vars=['legacy_bytes', 'bytes'],
+    var_name='layout',
+    value_name='megabytes'
+)
+chart_df['layout'] = chart_df['layout'].map({'legacy_bytes': 'Before (object/64-bit)', 'bytes': 'After (compact schema)'})
+chart_df['megabytes'] = chart_df['megabytes'] / 1024 / 1024
+
+fig_bytes = px.bar(
+    chart_df,
+    x='dataset',
+    y='megabytes',
+    color='layout',
+    barmode='group',
+    title="Memory per Dataset (MB)"
+)
+st.plotly_chart(fig_bytes, use_container_width=True)
+
+st.dataframe(
+    dataset_df[['dataset', 'rows', 'columns', 'legacy_bytes', 'bytes', 'saving']].rename(columns={
+        'dataset': 'Dataset',
+        'rows': 'Rows',
+        'columns': 'Columns',
+        'legacy_bytes': 'Before (bytes)',
+        'bytes': 'After (bytes)',
+        'saving': 'Saving'
+    }).style.format({'Before (bytes)': '{:,}', 'After (bytes)': '{:,}', 'Saving': '{:.0%}'}),
+    use_container_width=True,
+    hide_index=True
+)
+
+# Column drill-down
+st.subheader("🔍 Column Detail")
+
+selected_dataset = st.selectbox("Dataset", data.datasets())
+column_df = report_df[report_df['dataset'] == selected_dataset].drop(columns='dataset')
+column_df['saving'] = 1 - column_df['bytes'] / column_df['legacy_bytes']
+
+st.dataframe(
+    column_df.sort_values('legacy_bytes', ascending=False).rename(columns={
+        'column': 'Column',
+        'dtype': 'Dtype',
+        'legacy_dtype': 'Legacy Dtype',
+        'bytes': 'After (bytes)',
+        'legacy_bytes': 'Before (bytes)',
+        'saving': 'Saving'
+    }).style.format({'Before (bytes)': '{:,}', 'After (bytes)': '{:,}', 'Saving': '{:.0%}'}),
+    use_container_width=True,
+    hide_index=True
+)
@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, data, figures, query
+
 st.set_page_config(
     page_title="Pipeline Management",
     page_icon="💼",
@@ -15,52 +17,8 @@ st.set_page_config(
 st.title("💼 Deal Pipeline Management")
 st.markdown("🎯 **Track opportunities, analyze performance, and optimize your sales pipeline**")
 
-# Generate enhanced pipeline data
-@st.cache_data
-def generate_pipeline_data():
-    stages = ['🔍 Prospect', '✅ Qualified', '📋 Proposal', '🤝 Negotiation', '🎉 Closed Won', '❌ Closed Lost']
-    stage_values = [1, 2, 3, 4, 5, 0]
-    
-    deals = []
-    for i in range(45):
-        stage_idx = random.randint(0, len(stages)-1)
-        stage = stages[stage_idx]
-        stage_value = stage_values[stage_idx]
-        
-        # Probability based on stage
-        if stage_value == 0:  # Closed Lost
-            probability = 0
-        elif stage_value == 5:  # Closed Won
-            probability = 100
-        else:
-            probability = random.randint(stage_value * 15, min(95, stage_value * 25))
-        
-        deal = {
-            'deal_id': f'DEAL-{2024000 + i}',
-            'client_name': random.choice(['TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro', 'StartupXYZ', 'LogisticsCorp', 'FinanceGroup']),
-            'deal_name': random.choice(['Credit Facility', 'Term Loan', 'Working Capital', 'Trade Finance', 'Investment Loan']),
-            'value': random.randint(500000, 25000000),
-            'stage': stage,
-            'stage_value': stage_value,
-            'probability': probability,
-            'rm_name': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown', 'Lisa Davis']),
-            'created_date': datetime.now() - timedelta(days=random.randint(1, 180)),
-            'expected_close': datetime.now() + timedelta(days=random.randint(7, 120)),
-            'product_type': random.choice(['Term Loan', 'Credit Line', 'Trade Finance', 'Treasury Services', 'Investment Banking']),
-            'industry': random.choice(['Technology', 'Manufacturing', 'Healthcare', 'Retail', 'Energy', 'Finance']),
-            'risk_rating': random.choice(['🟢 Low', '🟡 Medium', '🔴 High']),
-            'last_activity': datetime.now() - timedelta(days=random.randint(1, 14)),
-            'next_action': random.choice(['Client Meeting', 'Proposal Review', 'Documentation', 'Credit Approval', 'Contract Signing']),
-            'weighted_value': 0
-        }
-        
-        # Calculate weighted value
-        deal['weighted_value'] = deal['value'] * (deal['probability'] / 100)
-        deals.append(deal)
-    
-    return pd.DataFrame(deals)
-
-pipeline_df = generate_pipeline_data()
+# Shared deal dataset, shown with the emoji stage labels used on this page
+pipeline_df = data.deals().drop(columns='stage').rename(columns={'stage_label': 'stage'})
 
 # Enhanced Pipeline Metrics with better styling
 st.subheader("📊 Pipeline Overview")
@@ -112,13 +70,7 @@ st.subheader("🔄 Pipeline Funnel")
 
 # Create funnel data
 active_deals = pipeline_df[pipeline_df['stage_value'] > 0]
-funnel_data = active_deals.groupby(['stage', 'stage_value']).agg({
-    'deal_id': 'count',
-    'value': 'sum',
-    'weighted_value': 'sum'
-}).reset_index()
-
-funnel_data = funnel_data.sort_values('stage_value', ascending=False)
+funnel_data = aggregates.pipeline_funnel()
 
 col1, col2 = st.columns([2, 1])
 
@@ -226,7 +178,7 @@ with col3:
     sort_by = st.selectbox("Sort by", ["Value (High to Low)", "Probability", "Expected Close", "Last Activity"])
 
 # Apply filters
-filtered_deals = active_deals.copy()
+filtered_deals = active_deals.copy(deep=False)
 
 if stage_filter != "All Stages":
     filtered_deals = filtered_deals[filtered_deals['stage'] == stage_filter]
@@ -290,8 +242,15 @@ with tab1:
     
     with col1:
         # Value by industry
-        industry_value = active_deals.groupby('industry')['value'].sum().reset_index()
-        fig_industry = px.pie(
+        industry_value = query.sql("""
+            SELECT industry, SUM(value) AS value
+            FROM deals
+            WHERE stage_value > 0
+            GROUP BY industry
+            ORDER BY industry
+        """, 'deals')
+        fig_industry = figures.plot(
+            px.pie,
             industry_value,
             values='value',
             names='industry',
@@ -301,7 +260,8 @@ with tab1:
     
     with col2:
         # Probability distribution
-        fig_prob = px.histogram(
+        fig_prob = figures.plot(
+            px.histogram,
             active_deals,
             x='probability',
             nbins=10,
@@ -311,12 +271,7 @@ with tab1:
 
 with tab2:
     # RM performance
-    rm_performance = active_deals.groupby('rm_name').agg({
-        'deal_id': 'count',
-        'value': 'sum',
-        'weighted_value': 'sum',
-        'probability': 'mean'
-    }).reset_index()
+    rm_performance = aggregates.active_rm_pipeline()
     
     rm_performance.columns = ['RM', 'Deal Count', 'Total Value', 'Weighted Value', 'Avg Probability']
     
@@ -337,15 +292,16 @@ with tab2:
 
 with tab3:
     # Monthly trend
-    active_deals['month'] = active_deals['created_date'].dt.to_period('M')
-    monthly_trend = active_deals.groupby('month').agg({
-        'deal_id': 'count',
-        'value': 'sum'
-    }).reset_index()
-    
-    monthly_trend['month'] = monthly_trend['month'].astype(str)
+    monthly_trend = query.sql(f"""
+        SELECT {query.month('created_date')} AS month, COUNT(deal_id) AS deal_id, SUM(value) AS value
+        FROM deals
+        WHERE stage_value > 0
+        GROUP BY 1
+        ORDER BY 1
+    """, 'deals')
     
-    fig_trend = px.line(
+    fig_trend = figures.plot(
+        px.line,
         monthly_trend,
         x='month',
         y='value',
@@ -7,6 +7,8 @@ from datetime import datetime, timedelta
 import random
 import time
 
+from pulse import tabs
+
 st.set_page_config(
     page_title="AI Assistant",
     page_icon="🤖",
@@ -128,9 +130,9 @@ with col4:
         st.rerun()
 
 # AI Capabilities showcase
-tab1, tab2, tab3, tab4 = st.tabs(["🧠 AI Capabilities", "📊 Analytics", "🔧 Tools", "⚙️ Settings"])
+tab1, tab2, tab3, tab4 = tabs.lazy(["🧠 AI Capabilities", "📊 Analytics", "🔧 Tools", "⚙️ Settings"], key='assistant_tab')
 
-with tab1:
+if tab1:
     st.subheader("🧠 AI Assistant Capabilities")
     
     capabilities = [
@@ -177,7 +179,7 @@ with tab1:
             for feature in capability['features']:
                 st.write(f"• {feature}")
 
-with tab2:
+if tab2:
     st.subheader("📊 AI Performance Analytics")
     
     # Generate sample AI performance data
@@ -210,7 +212,7 @@ with tab2:
                 value=f"{metric['Target']}{metric['Unit']}"
             )
 
-with tab3:
+if tab3:
     st.subheader("🔧 AI Tools & Integrations")
     
     tools = [
@@ -235,7 +237,7 @@ with tab3:
         with col3:
             st.caption(tool['description'])
 
-with tab4:
+if tab4:
     st.subheader("⚙️ AI Assistant Settings")
     
     col1, col2 = st.columns(2)
@@ -243,26 +245,26 @@ with tab4:
     with col1:
         st.markdown("**Response Preferences**")
         
-        response_style = st.selectbox("Response Style", ["Professional", "Casual", "Technical", "Concise"])
-        detail_level = st.selectbox("Detail Level", ["High", "Medium", "Low"])
-        language = st.selectbox("Language", ["English", "French", "German", "Spanish"])
+        response_style = st.selectbox("Response Style", ["Professional", "Casual", "Technical", "Concise"], **tabs.keep('assistant_response_style', "Professional"))
+        detail_level = st.selectbox("Detail Level", ["High", "Medium", "Low"], **tabs.keep('assistant_detail_level', "High"))
+        language = st.selectbox("Language", ["English", "French", "German", "Spanish"], **tabs.keep('assistant_language', "English"))
         
         st.markdown("**Notification Settings**")
-        proactive_alerts = st.checkbox("Proactive Insights", value=True)
-        daily_summary = st.checkbox("Daily Summary", value=True)
-        urgent_alerts = st.checkbox("Urgent Alerts", value=True)
+        proactive_alerts = st.checkbox("Proactive Insights", **tabs.keep('assistant_proactive_alerts', True))
+        daily_summary = st.checkbox("Daily Summary", **tabs.keep('assistant_daily_summary', True))
+        urgent_alerts = st.checkbox("Urgent Alerts", **tabs.keep('assistant_urgent_alerts', True))
     
     with col2:
         st.markdown("**AI Model Configuration**")
         
-        model_version = st.selectbox("AI Model", ["GPT-4 Turbo", "Claude-3", "Gemini Pro"])
-        confidence_threshold = st.slider("Confidence Threshold", 0.5, 1.0, 0.8)
-        context_memory = st.slider("Context Memory (messages)", 10, 100, 50)
+        model_version = st.selectbox("AI Model", ["GPT-4 Turbo", "Claude-3", "Gemini Pro"], **tabs.keep('assistant_model_version', "GPT-4 Turbo"))
+        confidence_threshold = st.slider("Confidence Threshold", 0.5, 1.0, **tabs.keep('assistant_confidence_threshold', 0.8))
+        context_memory = st.slider("Context Memory (messages)", 10, 100, **tabs.keep('assistant_context_memory', 50))
         
         st.markdown("**Data Sources**")
-        crm_integration = st.checkbox("CRM Data", value=True)
-        market_data = st.checkbox("Market Data", value=True)
-        news_feeds = st.checkbox("News Feeds", value=True)
+        crm_integration = st.checkbox("CRM Data", **tabs.keep('assistant_crm_data', True))
+        market_data = st.checkbox("Market Data", **tabs.keep('assistant_market_data', True))
+        news_feeds = st.checkbox("News Feeds", **tabs.keep('assistant_news_feeds', True))
         
         if st.button("💾 Save Settings"):
             st.success("AI Assistant settings saved!")
@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, bitmap, cache, data, figures, paging, render, search, timeindex, views
+
 st.set_page_config(
     page_title="News Intelligence",
     page_icon="📰",
@@ -15,70 +17,22 @@ st.set_page_config(
 st.title("📰 News Intelligence")
 st.markdown("AI-curated market insights and sentiment analysis")
 
-# Generate sample news data
-@st.cache_data
-def generate_news_data():
-    categories = ['Banking', 'Technology', 'Healthcare', 'Manufacturing', 'Energy', 'Retail']
-    sources = ['Financial Times', 'Reuters', 'Bloomberg', 'Wall Street Journal', 'BBC Business', 'CNBC']
-    sentiments = ['Positive', 'Negative', 'Neutral']
-    
-    news_items = []
-    for i in range(100):
-        news_item = {
-            'id': f'NEWS-{1000 + i}',
-            'headline': generate_headline(i),
-            'category': random.choice(categories),
-            'source': random.choice(sources),
-            'sentiment': random.choice(sentiments),
-            'sentiment_score': random.uniform(-1, 1),
-            'relevance_score': random.uniform(0.3, 1.0),
-            'published_date': datetime.now() - timedelta(hours=random.randint(1, 168)),
-            'impact_level': random.choice(['High', 'Medium', 'Low']),
-            'client_mentions': random.randint(0, 5),
-            'summary': generate_summary(i),
-            'tags': random.sample(['M&A', 'IPO', 'Earnings', 'Regulation', 'Innovation', 'ESG'], random.randint(1, 3))
-        }
-        news_items.append(news_item)
-    
-    return pd.DataFrame(news_items)
-
-def generate_headline(i):
-    headlines = [
-        "Technology Sector Shows Strong Q2 Performance Amid Market Volatility",
-        "Central Bank Signals Potential Interest Rate Adjustments",
-        "Healthcare Innovation Drives Record Investment Levels",
-        "Manufacturing Industry Faces Supply Chain Challenges",
-        "ESG Financing Reaches New Heights in Corporate Banking",
-        "Digital Banking Transformation Accelerates Post-Pandemic",
-        "Energy Sector Transitions Toward Renewable Solutions",
-        "Retail Banking Embraces AI for Customer Experience",
-        "Regulatory Changes Impact Commercial Lending Practices",
-        "Fintech Partnerships Reshape Traditional Banking Models"
-    ]
-    return headlines[i % len(headlines)] + f" - Update {i//10 + 1}"
-
-def generate_summary(i):
-    summaries = [
-        "Market analysis reveals significant growth opportunities in the technology sector, with increased demand for digital solutions driving revenue growth across multiple subsectors.",
-        "Economic indicators suggest potential monetary policy adjustments, which could impact lending rates and credit availability for commercial clients.",
-        "Healthcare sector demonstrates resilience with strong fundamentals, presenting attractive lending opportunities for banks focused on this vertical.",
-        "Supply chain disruptions continue to challenge manufacturing companies, requiring flexible financing solutions and risk management approaches.",
-        "Environmental, Social, and Governance (ESG) criteria increasingly influence corporate financing decisions, creating new market opportunities.",
-        "Digital transformation initiatives accelerate across industries, driving demand for technology financing and innovation funding.",
-        "Renewable energy investments surge as companies commit to sustainability goals, opening new financing markets for forward-thinking banks.",
-        "Artificial intelligence adoption in banking operations improves efficiency and customer experience while reducing operational costs.",
-        "New regulatory frameworks require banks to adapt compliance procedures and risk management practices for commercial lending.",
-        "Strategic partnerships between traditional banks and fintech companies create innovative solutions for business banking clients."
-    ]
-    return summaries[i % len(summaries)]
+# Shared news dataset
+news_df = data.news()
+news_metrics = aggregates.news_sentiment()
+
+# Filter bar index for facet counts, rebuilt when the news dataset changes
+@cache.cached('news')
+def load_news_index(version):
+    return bitmap.BitmapIndex(data.news(), ['category', 'sentiment', 'impact_level'], 'published_date')
 
-news_df = generate_news_data()
+news_index = load_news_index(data.version('news'))
 
 # News overview metrics
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_articles = len(news_df)
+    total_articles = news_metrics['total_articles']
     st.metric(
         label="📰 Total Articles",
         value=total_articles,
@@ -86,7 +40,7 @@ with col1:
     )
 
 with col2:
-    avg_sentiment = news_df['sentiment_score'].mean()
+    avg_sentiment = news_metrics['avg_sentiment']
     sentiment_label = "Positive" if avg_sentiment > 0.1 else "Negative" if avg_sentiment < -0.1 else "Neutral"
     st.metric(
         label="📊 Market Sentiment",
@@ -95,7 +49,7 @@ with col2:
     )
 
 with col3:
-    high_impact_count = len(news_df[news_df['impact_level'] == 'High'])
+    high_impact_count = news_metrics['high_impact_count']
     st.metric(
         label="⚠️ High Impact News",
         value=high_impact_count,
@@ -103,7 +57,7 @@ with col3:
     )
 
 with col4:
-    client_mentions = news_df['client_mentions'].sum()
+    client_mentions = news_metrics['client_mentions']
     st.metric(
         label="👥 Client Mentions",
         value=client_mentions,
@@ -113,63 +67,116 @@ with col4:
 # News filters and search
 st.subheader("🔍 News Filters")
 
+category_options = news_df['category'].unique().tolist()
+sentiment_options = news_df['sentiment'].unique().tolist()
+impact_options = news_df['impact_level'].unique().tolist()
+time_options = ["Last 24 hours", "Last 3 days", "Last week", "Last month"]
+
+time_mapping = {
+    "Last 24 hours": 1,
+    "Last 3 days": 3,
+    "Last week": 7,
+    "Last month": 30
+}
+as_of = pd.Timestamp.now().floor('min')
+
+# Facet counts are part of each option's label, and Streamlit derives a widget's
+# identity from its labels, so selections are kept here and re-applied each run
+def saved_selection(key, default):
+    selection = st.session_state.setdefault(f'{key}_saved', default)
+    st.session_state[key] = selection
+    return selection
+
+def save_selection(key):
+    st.session_state[f'{key}_saved'] = st.session_state[key]
+
+# Option counts given the other active filters, the time window and the search
+facet_query = st.session_state.get('news_search_query', '')
+facets = news_index.facets(
+    {
+        'category': saved_selection('news_category_filter', category_options),
+        'sentiment': saved_selection('news_sentiment_filter', sentiment_options),
+        'impact_level': saved_selection('news_impact_filter', impact_options)
+    },
+    low=as_of - timedelta(days=time_mapping[st.session_state.get('news_time_filter', time_options[2])]),
+    within=news_index.bitmap(search.NEWS.search(facet_query)[0]) if facet_query else None
+)
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     category_filter = st.multiselect(
         "Category",
-        options=news_df['category'].unique(),
-        default=news_df['category'].unique()
+        options=category_options,
+        format_func=bitmap.label(facets['category']),
+        key='news_category_filter',
+        on_change=save_selection,
+        args=('news_category_filter',)
     )
 
 with col2:
     sentiment_filter = st.multiselect(
         "Sentiment",
-        options=news_df['sentiment'].unique(),
-        default=news_df['sentiment'].unique()
+        options=sentiment_options,
+        format_func=bitmap.label(facets['sentiment']),
+        key='news_sentiment_filter',
+        on_change=save_selection,
+        args=('news_sentiment_filter',)
     )
 
 with col3:
     impact_filter = st.multiselect(
         "Impact Level",
-        options=news_df['impact_level'].unique(),
-        default=news_df['impact_level'].unique()
+        options=impact_options,
+        format_func=bitmap.label(facets['impact_level']),
+        key='news_impact_filter',
+        on_change=save_selection,
+        args=('news_impact_filter',)
     )
 
 with col4:
     time_filter = st.selectbox(
         "Time Range",
-        options=["Last 24 hours", "Last 3 days", "Last week", "Last month"],
-        index=2
+        options=time_options,
+        index=2,
+        key='news_time_filter'
     )
 
 # Search functionality
-search_query = st.text_input("🔍 Search news articles...", placeholder="Enter keywords, company names, or topics")
-
-# Apply filters
-filtered_df = news_df[
-    (news_df['category'].isin(category_filter)) &
-    (news_df['sentiment'].isin(sentiment_filter)) &
-    (news_df['impact_level'].isin(impact_filter))
-]
+search_query = st.text_input(
+    "🔍 Search news articles...",
+    placeholder='Enter keywords, company names, or topics; "exact phrase" or prefix*',
+    key='news_search_query'
+)
 
-# Apply time filter
-time_mapping = {
-    "Last 24 hours": 1,
-    "Last 3 days": 3,
-    "Last week": 7,
-    "Last month": 30
+# Filter chain, memoised per filter state across sessions; time windows move by the minute
+@views.filtered('news')
+def filter_news(time_range, as_of, category, sentiment, impact_level, query):
+    # Time window from the sorted time index, then the other filters
+    time_threshold = as_of - timedelta(days=time_mapping[time_range])
+    filtered = news_df.iloc[timeindex.window('news', 'published_date', start=time_threshold)]
+    filtered = filtered[
+        (filtered['category'].isin(category)) &
+        (filtered['sentiment'].isin(sentiment)) &
+        (filtered['impact_level'].isin(impact_level))
+    ]
+    # Search through the inverted index, keeping the BM25 score for ranking
+    if query:
+        search_rows, search_scores = search.NEWS.search(query)
+        search_scores = pd.Series(search_scores, index=news_df.index[search_rows])
+        filtered = filtered[filtered.index.isin(search_scores.index)]
+        filtered = filtered.assign(search_score=search_scores)
+    return filtered
+
+view_filters = {
+    'time_range': time_filter,
+    'as_of': as_of,
+    'category': category_filter,
+    'sentiment': sentiment_filter,
+    'impact_level': impact_filter,
+    'query': search_query
 }
-time_threshold = datetime.now() - timedelta(days=time_mapping[time_filter])
-filtered_df = filtered_df[filtered_df['published_date'] >= time_threshold]
-
-# Apply search filter
-if search_query:
-    search_mask = (
-        filtered_df['headline'].str.contains(search_query, case=False, na=False) |
-        filtered_df['summary'].str.contains(search_query, case=False, na=False)
-    )
-    filtered_df = filtered_df[search_mask]
+filtered_df = filter_news(**view_filters)
 
 # News analytics
 col1, col2 = st.columns(2)
@@ -177,10 +184,12 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("📊 Sentiment Analysis")
     
-    # Sentiment distribution
-    sentiment_counts = filtered_df['sentiment'].value_counts()
+    # Sentiment distribution: the facet counts of the selected sentiments
+    sentiment_counts = facets['sentiment'].where(facets['sentiment'].index.isin(sentiment_filter), 0)
+    sentiment_counts = sentiment_counts.sort_values(ascending=False)
     
-    fig_sentiment = px.pie(
+    fig_sentiment = figures.plot(
+        px.pie,
         values=sentiment_counts.values,
         names=sentiment_counts.index,
         title="News Sentiment Distribution",
@@ -196,10 +205,10 @@ with col2:
     st.subheader("📈 Sentiment Trends")
     
     # Sentiment over time
-    filtered_df['date'] = filtered_df['published_date'].dt.date
-    daily_sentiment = filtered_df.groupby('date')['sentiment_score'].mean().reset_index()
+    daily_sentiment = filtered_df.groupby('date', observed=True)['sentiment_score'].mean().reset_index()
     
-    fig_trend = px.line(
+    fig_trend = figures.plot(
+        px.line,
         daily_sentiment,
         x='date',
         y='sentiment_score',
@@ -214,9 +223,11 @@ col1, col2 = st.columns(2)
 with col1:
     st.subheader("🏷️ News by Category")
     
-    category_counts = filtered_df['category'].value_counts()
+    category_counts = facets['category'].where(facets['category'].index.isin(category_filter), 0)
+    category_counts = category_counts.sort_values(ascending=False)
     
-    fig_category = px.bar(
+    fig_category = figures.plot(
+        px.bar,
         x=category_counts.values,
         y=category_counts.index,
         orientation='h',
@@ -227,9 +238,10 @@ with col1:
 with col2:
     st.subheader("📊 Impact Analysis")
     
-    impact_sentiment = filtered_df.groupby(['impact_level', 'sentiment']).size().reset_index(name='count')
+    impact_sentiment = filtered_df.groupby(['impact_level', 'sentiment'], observed=True).size().reset_index(name='count')
     
-    fig_impact = px.bar(
+    fig_impact = figures.plot(
+        px.bar,
         impact_sentiment,
         x='impact_level',
         y='count',
@@ -259,94 +271,112 @@ with col2:
         index=0
     )
 
-# Sort the dataframe
-if sort_option == "Relevance":
-    filtered_df = filtered_df.sort_values('relevance_score', ascending=False)
-elif sort_option == "Date":
-    filtered_df = filtered_df.sort_values('published_date', ascending=False)
-elif sort_option == "Sentiment":
-    filtered_df = filtered_df.sort_values('sentiment_score', ascending=False)
-elif sort_option == "Impact":
-    impact_order = {'High': 3, 'Medium': 2, 'Low': 1}
-    filtered_df['impact_numeric'] = filtered_df['impact_level'].map(impact_order)
-    filtered_df = filtered_df.sort_values('impact_numeric', ascending=False)
-
-# Display news articles
-for idx, article in filtered_df.head(20).iterrows():
-    with st.container():
-        # Article header
-        col1, col2, col3 = st.columns([6, 2, 2])
-        
-        with col1:
-            # Sentiment color coding
-            sentiment_color = {
-                'Positive': '#28a745',
-                'Negative': '#dc3545',
-                'Neutral': '#6c757d'
-            }
-            
-            st.markdown(f"""
-            <div style="border-left: 4px solid {sentiment_color[article['sentiment']]}; padding-left: 10px;">
-                <h4 style="margin: 0; color: #333;">{article['headline']}</h4>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            impact_color = {'High': '#dc3545', 'Medium': '#ffc107', 'Low': '#28a745'}
-            st.markdown(f"""
-            <span style="background-color: {impact_color[article['impact_level']]}; color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em;">
-                {article['impact_level']} Impact
-            </span>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"**{article['source']}**")
-        
-        # Article details
-        col1, col2, col3, col4 = st.columns([3, 2, 2, 3])
-        
-        with col1:
-            st.markdown(f"📅 {article['published_date'].strftime('%Y-%m-%d %H:%M')}")
-        
-        with col2:
-            st.markdown(f"🏷️ {article['category']}")
-        
-        with col3:
-            sentiment_emoji = {'Positive': '😊', 'Negative': '😟', 'Neutral': '😐'}
-            st.markdown(f"{sentiment_emoji[article['sentiment']]} {article['sentiment']}")
-        
-        with col4:
-            if article['client_mentions'] > 0:
-                st.markdown(f"👥 {article['client_mentions']} client mentions")
-        
-        # Article summary
-        st.markdown(f"**Summary:** {article['summary']}")
-        
-        # Tags
-        if article['tags']:
-            tag_html = " ".join([f"<span style='background-color: #e9ecef; padding: 2px 6px; border-radius: 8px; font-size: 0.8em; margin-right: 5px;'>{tag}</span>" for tag in article['tags']])
-            st.markdown(f"**Tags:** {tag_html}", unsafe_allow_html=True)
-        
-        # Action buttons
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("📖 Read Full", key=f"read_{article['id']}"):
-                st.info("Opening full article...")
-        
-        with col2:
-            if st.button("📧 Share", key=f"share_{article['id']}"):
-                st.success("Article shared!")
-        
-        with col3:
-            if st.button("🔖 Save", key=f"save_{article['id']}"):
-                st.success("Article saved!")
-        
-        with col4:
-            if st.button("🚨 Alert", key=f"alert_{article['id']}"):
-                st.info("Alert created for similar news")
-        
-        st.markdown("---")
+# Sort columns; ties keep a stable order by article id
+sort_mapping = {
+    "Relevance": 'search_score' if search_query else 'relevance_score',
+    "Date": 'published_date',
+    "Sentiment": 'sentiment_score',
+    "Impact": 'impact_numeric'
+}
+
+# Articles per feed window; the list only builds the ones scrolled into view
+FEED_SIZE = 2000
+
+# Page through the feed with cursors; new filters start again at the first window
+news_pager = st.session_state.setdefault('news_feed_pager', paging.Pager())
+news_pager.start({
+    'time_range': time_filter,
+    'category': category_filter,
+    'sentiment': sentiment_filter,
+    'impact_level': impact_filter,
+    'query': search_query,
+    'sort': sort_option
+})
+
+# Feed payload per filter state, sort order and window, built once and shared
+@cache.cached('news')
+def load_feed(version, view_filters, sort_column, after):
+    articles, next_cursor = paging.frame_page(
+        filter_news(**view_filters), [(sort_column, 'DESC')], 'id', after=after, size=FEED_SIZE
+    )
+    sentiment_color = {'Positive': '#28a745', 'Negative': '#dc3545', 'Neutral': '#6c757d'}
+    sentiment_emoji = {'Positive': '😊', 'Negative': '😟', 'Neutral': '😐'}
+    impact_color = {'High': '#dc3545', 'Medium': '#ffc107', 'Low': '#28a745'}
+    items = pd.DataFrame({
+        'headline': articles['headline'].astype(str),
+        'summary': articles['summary'].astype(str),
+        'source': articles['source'].astype(str),
+        'category': articles['category'].astype(str),
+        'sentiment': articles['sentiment'].astype(str),
+        'sentiment_color': articles['sentiment'].astype(str).map(sentiment_color),
+        'sentiment_emoji': articles['sentiment'].astype(str).map(sentiment_emoji),
+        'impact_level': articles['impact_level'].astype(str),
+        'impact_color': articles['impact_level'].astype(str).map(impact_color),
+        'published': articles['published_date'].dt.strftime('%Y-%m-%d %H:%M'),
+        'mentions': [
+            f"👥 {count} client mentions" if count > 0 else '' for count in articles['client_mentions']
+        ],
+        'tags': [
+            ''.join(f'<span class="news-tag">{render.escape(tag)}</span>' for tag in tags) for tags in articles['tags']
+        ]
+    }).to_dict('records')
+    return items, next_cursor
+
+feed_items, next_cursor = load_feed(
+    data.version('news'), view_filters, sort_mapping[sort_option], news_pager.after
+)
+
+# Display news articles: one component, rendering only the visible window
+render.virtual_list(
+    feed_items,
+    template="""
+    <div class="news-card">
+      <div class="news-header" style="border-left-color: {{sentiment_color}}">
+        <h4>{{headline}}</h4>
+        <span class="news-impact" style="background-color: {{impact_color}}">{{impact_level}} Impact</span>
+        <b>{{source}}</b>
+      </div>
+      <div class="news-details">
+        <span>📅 {{published}}</span><span>🏷️ {{category}}</span>
+        <span>{{sentiment_emoji}} {{sentiment}}</span><span>{{mentions}}</span>
+      </div>
+      <div class="news-summary"><b>Summary:</b> {{summary}}</div>
+      <div class="news-tags">{{{tags}}}</div>
+      <div class="news-actions">
+        <button data-message="Opening full article...">📖 Read Full</button>
+        <button data-message="Article shared!">📧 Share</button>
+        <button data-message="Article saved!">🔖 Save</button>
+        <button data-message="Alert created for similar news">🚨 Alert</button>
+      </div>
+    </div>
+    """,
+    row_height=210,
+    height=720,
+    styles="""
+    .news-card { padding: 8px 4px; border-bottom: 1px solid #e6e6e6; height: 100%; box-sizing: border-box; }
+    .news-header { display: flex; align-items: center; gap: 12px; border-left: 4px solid; padding-left: 10px; }
+    .news-header h4 { margin: 0; flex: 1; color: #333; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .news-impact { color: white; padding: 2px 8px; border-radius: 12px; font-size: 0.8em; white-space: nowrap; }
+    .news-details { display: flex; gap: 24px; margin: 6px 0; }
+    .news-summary { display: -webkit-box; -webkit-line-clamp: 2; -webkit-box-orient: vertical; overflow: hidden; }
+    .news-tags { margin: 6px 0; height: 1.4em; overflow: hidden; }
+    .news-tag { background-color: #e9ecef; padding: 2px 6px; border-radius: 8px; font-size: 0.8em; margin-right: 5px; }
+    .news-actions button { background: white; border: 1px solid #d6d6d9; border-radius: 6px; padding: 3px 10px;
+                           margin-right: 6px; cursor: pointer; }
+    """,
+    empty="No articles match the current filters"
+)
+
+col1, col2, col3 = st.columns([1, 4, 1])
+
+with col1:
+    st.button("⬅️ Previous", key="news_previous", disabled=news_pager.number == 1, on_click=news_pager.previous)
+
+with col2:
+    st.caption(f"Window {news_pager.number} of {max(1, -(-len(filtered_df) // FEED_SIZE))}")
+
+with col3:
+    st.button("Next ➡️", key="news_next", disabled=next_cursor is None, on_click=news_pager.next, args=(next_cursor,))
 
 # AI Insights sidebar
 with st.sidebar:
@@ -392,7 +422,7 @@ with st.sidebar:
     st.subheader("🔔 News Alerts")
     
     alert_keywords = st.text_input("Keywords", placeholder="e.g., regulation, fintech")
-    alert_categories = st.multiselect("Categories", options=news_df['category'].unique())
+    alert_categories = st.multiselect("Categories", options=news_df['category'].unique().tolist())
     alert_sentiment = st.selectbox("Sentiment", options=["Any", "Positive", "Negative", "Neutral"])
     
     if st.button("🔔 Create Alert"):
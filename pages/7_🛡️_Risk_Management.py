@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, bitmap, cache, data, figures, render, sections, tabs, views
+
 st.set_page_config(
     page_title="Risk Management",
     page_icon="🛡️",
@@ -15,41 +17,25 @@ st.set_page_config(
 st.title("🛡️ Risk Management")
 st.markdown("Real-time risk assessment and monitoring")
 
-# Generate sample risk data
-@st.cache_data
-def generate_risk_data():
-    clients = []
-    for i in range(100):
-        client = {
-            'client_id': f'CLI-{1000 + i}',
-            'client_name': f'Client {chr(65 + i % 26)}{i}',
-            'industry': random.choice(['Technology', 'Manufacturing', 'Healthcare', 'Retail', 'Energy', 'Finance']),
-            'credit_rating': random.choice(['AAA', 'AA', 'A', 'BBB', 'BB', 'B', 'CCC']),
-            'risk_score': random.uniform(1, 10),
-            'probability_default': random.uniform(0.01, 0.15),
-            'exposure_amount': random.uniform(1000000, 50000000),
-            'collateral_value': random.uniform(500000, 30000000),
-            'debt_to_equity': random.uniform(0.2, 3.0),
-            'current_ratio': random.uniform(0.8, 2.5),
-            'cash_flow_ratio': random.uniform(-0.2, 0.4),
-            'revenue_growth': random.uniform(-0.3, 0.5),
-            'last_review_date': datetime.now() - timedelta(days=random.randint(1, 365)),
-            'next_review_date': datetime.now() + timedelta(days=random.randint(30, 180)),
-            'risk_trend': random.choice(['Improving', 'Stable', 'Deteriorating']),
-            'covenant_status': random.choice(['Compliant', 'Warning', 'Breach']),
-            'relationship_manager': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown'])
-        }
-        clients.append(client)
-    
-    return pd.DataFrame(clients)
+# Shared risk dataset
+risk_df = data.risk()
+
+# Filter bar index, rebuilt when the risk dataset changes
+@cache.cached('risk')
+def load_risk_index(version):
+    return bitmap.BitmapIndex(
+        data.risk(), ['industry', 'risk_level', 'covenant_status', 'risk_trend'], 'exposure_amount'
+    )
 
-risk_df = generate_risk_data()
+risk_index = load_risk_index(data.version('risk'))
+
+risk_metrics = aggregates.risk_metrics()
 
 # Risk overview metrics
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_exposure = risk_df['exposure_amount'].sum()
+    total_exposure = risk_metrics['total_exposure']
     st.metric(
         label="💰 Total Exposure",
         value=f"£{total_exposure/1000000:.1f}M",
@@ -57,7 +43,7 @@ with col1:
     )
 
 with col2:
-    avg_risk_score = risk_df['risk_score'].mean()
+    avg_risk_score = risk_metrics['avg_risk_score']
     st.metric(
         label="📊 Avg Risk Score",
         value=f"{avg_risk_score:.1f}/10",
@@ -65,7 +51,7 @@ with col2:
     )
 
 with col3:
-    high_risk_count = len(risk_df[risk_df['risk_score'] > 7])
+    high_risk_count = risk_metrics['high_risk_count']
     st.metric(
         label="⚠️ High Risk Clients",
         value=high_risk_count,
@@ -73,7 +59,7 @@ with col3:
     )
 
 with col4:
-    covenant_breaches = len(risk_df[risk_df['covenant_status'] == 'Breach'])
+    covenant_breaches = risk_metrics['covenant_breaches']
     st.metric(
         label="🚨 Covenant Breaches",
         value=covenant_breaches,
@@ -87,10 +73,10 @@ with col1:
     st.subheader("🎯 Risk Distribution")
     
     # Risk score distribution
-    risk_bins = pd.cut(risk_df['risk_score'], bins=[0, 3, 5, 7, 10], labels=['Low', 'Medium', 'High', 'Critical'])
-    risk_counts = risk_bins.value_counts()
+    risk_counts = risk_metrics['risk_level_counts']
     
-    fig_risk_dist = px.pie(
+    fig_risk_dist = figures.plot(
+        px.pie,
         values=risk_counts.values,
         names=risk_counts.index,
         title="Risk Score Distribution",
@@ -107,10 +93,11 @@ with col2:
     st.subheader("📈 Risk vs Exposure")
     
     # Risk score vs exposure scatter plot
-    fig_scatter = px.scatter(
+    fig_scatter = figures.scatter(
         risk_df,
-        x='risk_score',
-        y='exposure_amount',
+        'risk_score',
+        'exposure_amount',
+        source=(['risk'], {}),
         color='industry',
         size='probability_default',
         title="Risk Score vs Exposure Amount",
@@ -126,27 +113,60 @@ with col2:
 # Risk filters
 st.subheader("🔍 Risk Filters")
 
+industry_options = risk_df['industry'].unique().tolist()
+covenant_options = risk_df['covenant_status'].unique().tolist()
+risk_level_options = ['Low', 'Medium', 'High', 'Critical']
+
+# Facet counts are part of each option's label, and Streamlit derives a widget's
+# identity from its labels, so selections are kept here and re-applied each run
+def saved_selection(key, default):
+    selection = st.session_state.setdefault(f'{key}_saved', default)
+    st.session_state[key] = selection
+    return selection
+
+def save_selection(key):
+    st.session_state[f'{key}_saved'] = st.session_state[key]
+
+# Option counts given the other active filters, in one pass over the bitmap index
+facets = risk_index.facets(
+    {
+        'industry': saved_selection('risk_industry_filter', industry_options),
+        'risk_level': saved_selection('risk_level_filter', ['High', 'Critical']),
+        'covenant_status': saved_selection('risk_covenant_filter', covenant_options)
+    },
+    low=st.session_state.get('risk_min_exposure', 0.0) * 1000000
+)
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     industry_filter = st.multiselect(
         "Industry",
-        options=risk_df['industry'].unique(),
-        default=risk_df['industry'].unique()
+        options=industry_options,
+        format_func=bitmap.label(facets['industry']),
+        key='risk_industry_filter',
+        on_change=save_selection,
+        args=('risk_industry_filter',)
     )
 
 with col2:
     risk_level_filter = st.multiselect(
         "Risk Level",
-        options=['Low', 'Medium', 'High', 'Critical'],
-        default=['High', 'Critical']
+        options=risk_level_options,
+        format_func=bitmap.label(facets['risk_level']),
+        key='risk_level_filter',
+        on_change=save_selection,
+        args=('risk_level_filter',)
     )
 
 with col3:
     covenant_filter = st.multiselect(
         "Covenant Status",
-        options=risk_df['covenant_status'].unique(),
-        default=risk_df['covenant_status'].unique()
+        options=covenant_options,
+        format_func=bitmap.label(facets['covenant_status']),
+        key='risk_covenant_filter',
+        on_change=save_selection,
+        args=('risk_covenant_filter',)
     )
 
 with col4:
@@ -155,25 +175,36 @@ with col4:
         min_value=0.0,
         max_value=50.0,
         value=0.0,
-        step=1.0
+        step=1.0,
+        key='risk_min_exposure'
     )
 
-# Apply filters
-risk_bins = pd.cut(risk_df['risk_score'], bins=[0, 3, 5, 7, 10], labels=['Low', 'Medium', 'High', 'Critical'])
-risk_df['risk_level'] = risk_bins
+# Apply filters through the bitmap index, memoised per filter state across sessions
+@views.filtered('risk')
+def filter_risk(industry, risk_level, covenant_status, min_exposure):
+    selection = risk_index.select(
+        {
+            'industry': industry,
+            'risk_level': risk_level,
+            'covenant_status': covenant_status
+        },
+        low=min_exposure * 1000000
+    )
+    return risk_df.iloc[risk_index.positions(selection)]
 
-filtered_risk_df = risk_df[
-    (risk_df['industry'].isin(industry_filter)) &
-    (risk_df['risk_level'].isin(risk_level_filter)) &
-    (risk_df['covenant_status'].isin(covenant_filter)) &
-    (risk_df['exposure_amount'] >= min_exposure * 1000000)
-]
+risk_filters = {
+    'industry': industry_filter,
+    'risk_level': risk_level_filter,
+    'covenant_status': covenant_filter,
+    'min_exposure': min_exposure
+}
+filtered_risk_df = filter_risk(**risk_filters)
 
 # Risk monitoring table
 st.subheader("📋 Risk Monitoring Dashboard")
 
 # Prepare display dataframe
-display_risk_df = filtered_risk_df.copy()
+display_risk_df = filtered_risk_df.copy(deep=False)
 display_risk_df['Exposure (£M)'] = (display_risk_df['exposure_amount'] / 1000000).round(2)
 display_risk_df['PD (%)'] = (display_risk_df['probability_default'] * 100).round(2)
 display_risk_df['Risk Score'] = display_risk_df['risk_score'].round(1)
@@ -237,16 +268,16 @@ st.dataframe(
 # Risk analytics
 st.subheader("📊 Risk Analytics")
 
-tab1, tab2, tab3, tab4 = st.tabs(["🏭 Industry Analysis", "📈 Trend Analysis", "🎯 Portfolio Metrics", "🚨 Alert System"])
+tab1, tab2, tab3, tab4 = tabs.lazy(["🏭 Industry Analysis", "📈 Trend Analysis", "🎯 Portfolio Metrics", "🚨 Alert System"], key='risk_tab')
 
-with tab1:
+if tab1:
     st.markdown("**🏭 Industry Risk Analysis**")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
+    # Industry figures, rebuilt only when the risk filters or the data change
+    @sections.section('risk')
+    def industry_section(**filters):
         # Industry risk distribution
-        industry_risk = filtered_risk_df.groupby('industry').agg({
+        industry_risk = filtered_risk_df.groupby('industry', observed=True).agg({
             'risk_score': 'mean',
             'exposure_amount': 'sum',
             'probability_default': 'mean'
@@ -254,48 +285,60 @@ with tab1:
         
         industry_risk['exposure_millions'] = industry_risk['exposure_amount'] / 1000000
         
-        fig_industry_risk = px.bar(
+        fig_industry_risk = figures.plot(
+            px.bar,
             industry_risk,
             x='industry',
             y='risk_score',
             title="Average Risk Score by Industry"
         )
-        st.plotly_chart(fig_industry_risk, use_container_width=True)
-    
-    with col2:
+        
         # Industry exposure
-        fig_industry_exposure = px.bar(
+        fig_industry_exposure = figures.plot(
+            px.bar,
             industry_risk,
             x='industry',
             y='exposure_millions',
             title="Total Exposure by Industry (£M)"
         )
-        st.plotly_chart(fig_industry_exposure, use_container_width=True)
+        
+        industry_matrix = filtered_risk_df.groupby(['industry', 'risk_level'], observed=True).size().unstack(fill_value=0)
+        
+        fig_matrix = figures.plot(
+            px.imshow,
+            industry_matrix.values,
+            x=industry_matrix.columns,
+            y=industry_matrix.index,
+            title="Industry vs Risk Level Matrix",
+            color_continuous_scale="Reds"
+        )
+        return {'risk': fig_industry_risk, 'exposure': fig_industry_exposure, 'matrix': fig_matrix}
     
-    # Industry risk matrix
-    st.markdown("**Industry Risk Matrix**")
+    industry_figures = industry_section(**risk_filters)
     
-    industry_matrix = filtered_risk_df.groupby(['industry', 'risk_level']).size().unstack(fill_value=0)
+    col1, col2 = st.columns(2)
     
-    fig_matrix = px.imshow(
-        industry_matrix.values,
-        x=industry_matrix.columns,
-        y=industry_matrix.index,
-        title="Industry vs Risk Level Matrix",
-        color_continuous_scale="Reds"
-    )
-    st.plotly_chart(fig_matrix, use_container_width=True)
+    with col1:
+        st.plotly_chart(industry_figures['risk'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(industry_figures['exposure'], use_container_width=True)
+    
+    # Industry risk matrix
+    st.markdown("**Industry Risk Matrix**")
+    st.plotly_chart(industry_figures['matrix'], use_container_width=True)
 
-with tab2:
+if tab2:
     st.markdown("**📈 Risk Trend Analysis**")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Risk trend distribution
-        trend_counts = filtered_risk_df['risk_trend'].value_counts()
+    # Trend figures from the facet counts, rebuilt only when the risk filters or the data change
+    @sections.section('risk')
+    def trend_section(**filters):
+        # Risk trend distribution, from the facet counts (no filter on trend)
+        trend_counts = facets['risk_trend'].sort_values(ascending=False)
         
-        fig_trends = px.pie(
+        fig_trends = figures.plot(
+            px.pie,
             values=trend_counts.values,
             names=trend_counts.index,
             title="Risk Trend Distribution",
@@ -305,13 +348,13 @@ with tab2:
                 'Deteriorating': '#dc3545'
             }
         )
-        st.plotly_chart(fig_trends, use_container_width=True)
-    
-    with col2:
-        # Covenant status distribution
-        covenant_counts = filtered_risk_df['covenant_status'].value_counts()
         
-        fig_covenant = px.bar(
+        # Covenant status distribution: the facet counts of the selected statuses
+        covenant_counts = facets['covenant_status'].where(facets['covenant_status'].index.isin(covenant_filter), 0)
+        covenant_counts = covenant_counts.sort_values(ascending=False)
+        
+        fig_covenant = figures.plot(
+            px.bar,
             x=covenant_counts.index,
             y=covenant_counts.values,
             title="Covenant Status Distribution",
@@ -322,7 +365,17 @@ with tab2:
                 'Breach': '#dc3545'
             }
         )
-        st.plotly_chart(fig_covenant, use_container_width=True)
+        return {'trends': fig_trends, 'covenant': fig_covenant}
+    
+    trend_figures = trend_section(**risk_filters)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(trend_figures['trends'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(trend_figures['covenant'], use_container_width=True)
     
     # Risk migration analysis
     st.markdown("**Risk Migration Analysis**")
@@ -340,52 +393,72 @@ with tab2:
     
     st.dataframe(migration_data, use_container_width=True)
 
-with tab3:
+if tab3:
     st.markdown("**🎯 Portfolio Risk Metrics**")
     
+    # Portfolio metrics, rebuilt only when the risk filters or the data change
+    @sections.section('risk')
+    def portfolio_section(**filters):
+        losses = filtered_risk_df['exposure_amount'] * filtered_risk_df['probability_default']
+        top_5_exposure = filtered_risk_df.nlargest(5, 'exposure_amount')['exposure_amount'].sum()
+        
+        correlation_factors = ['risk_score', 'debt_to_equity', 'current_ratio', 'cash_flow_ratio', 'revenue_growth']
+        correlation_matrix = filtered_risk_df[correlation_factors].corr()
+        
+        fig_corr = figures.plot(
+            px.imshow,
+            correlation_matrix,
+            title="Risk Factor Correlation Matrix",
+            color_continuous_scale="RdBu",
+            aspect="auto"
+        )
+        return {
+            'var_95': np.percentile(losses, 95),
+            'expected_loss': losses.sum(),
+            'concentration_ratio': (top_5_exposure / filtered_risk_df['exposure_amount'].sum()) * 100,
+            'industry_count': filtered_risk_df['industry'].nunique(),
+            'portfolio_risk': filtered_risk_df['risk_score'].mean(),
+            'correlation': fig_corr
+        }
+    
+    portfolio = portfolio_section(**risk_filters)
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # Value at Risk
-        var_95 = np.percentile(filtered_risk_df['exposure_amount'] * filtered_risk_df['probability_default'], 95)
         st.metric(
             label="📊 VaR (95%)",
-            value=f"£{var_95/1000000:.1f}M",
+            value=f"£{portfolio['var_95']/1000000:.1f}M",
             delta="↓ 5.2%"
         )
         
         # Expected Loss
-        expected_loss = (filtered_risk_df['exposure_amount'] * filtered_risk_df['probability_default']).sum()
         st.metric(
             label="💸 Expected Loss",
-            value=f"£{expected_loss/1000000:.1f}M",
+            value=f"£{portfolio['expected_loss']/1000000:.1f}M",
             delta="↓ 2.1%"
         )
     
     with col2:
         # Concentration risk
-        top_5_exposure = filtered_risk_df.nlargest(5, 'exposure_amount')['exposure_amount'].sum()
-        concentration_ratio = (top_5_exposure / filtered_risk_df['exposure_amount'].sum()) * 100
-        
         st.metric(
             label="🎯 Concentration (Top 5)",
-            value=f"{concentration_ratio:.1f}%",
+            value=f"{portfolio['concentration_ratio']:.1f}%",
             delta="↑ 1.3%"
         )
         
         # Portfolio diversity
-        industry_count = filtered_risk_df['industry'].nunique()
         st.metric(
             label="🌐 Industry Diversity",
-            value=f"{industry_count} sectors",
+            value=f"{portfolio['industry_count']} sectors",
             delta="Stable"
         )
     
     with col3:
         # Risk-adjusted return
         portfolio_return = 0.085  # 8.5% assumed return
-        portfolio_risk = filtered_risk_df['risk_score'].mean()
-        risk_adjusted_return = portfolio_return / (portfolio_risk / 10)
+        risk_adjusted_return = portfolio_return / (portfolio['portfolio_risk'] / 10)
         
         st.metric(
             label="📈 Risk-Adj Return",
@@ -403,90 +476,11 @@ with tab3:
     
     # Risk correlation matrix
     st.markdown("**Risk Factor Correlation Matrix**")
-    
-    correlation_factors = ['risk_score', 'debt_to_equity', 'current_ratio', 'cash_flow_ratio', 'revenue_growth']
-    correlation_matrix = filtered_risk_df[correlation_factors].corr()
-    
-    fig_corr = px.imshow(
-        correlation_matrix,
-        title="Risk Factor Correlation Matrix",
-        color_continuous_scale="RdBu",
-        aspect="auto"
-    )
-    st.plotly_chart(fig_corr, use_container_width=True)
+    st.plotly_chart(portfolio['correlation'], use_container_width=True)
 
-with tab4:
+if tab4:
     st.markdown("**🚨 Risk Alert System**")
     
-    # Generate risk alerts
-    alerts = []
-    
-    # High risk score alerts
-    high_risk_clients = filtered_risk_df[filtered_risk_df['risk_score'] > 8]
-    for _, client in high_risk_clients.iterrows():
-        alerts.append({
-            'severity': 'Critical',
-            'type': 'High Risk Score',
-            'client': client['client_name'],
-            'message': f"Risk score {client['risk_score']:.1f}/10 - Immediate review required",
-            'timestamp': datetime.now() - timedelta(hours=random.randint(1, 24))
-        })
-    
-    # Covenant breach alerts
-    breach_clients = filtered_risk_df[filtered_risk_df['covenant_status'] == 'Breach']
-    for _, client in breach_clients.iterrows():
-        alerts.append({
-            'severity': 'High',
-            'type': 'Covenant Breach',
-            'client': client['client_name'],
-            'message': f"Covenant breach detected - Legal action may be required",
-            'timestamp': datetime.now() - timedelta(hours=random.randint(1, 48))
-        })
-    
-    # Deteriorating trend alerts
-    deteriorating_clients = filtered_risk_df[filtered_risk_df['risk_trend'] == 'Deteriorating']
-    for _, client in deteriorating_clients.head(5).iterrows():
-        alerts.append({
-            'severity': 'Medium',
-            'type': 'Deteriorating Trend',
-            'client': client['client_name'],
-            'message': f"Risk trend deteriorating - Enhanced monitoring recommended",
-            'timestamp': datetime.now() - timedelta(hours=random.randint(1, 72))
-        })
-    
-    # Sort alerts by severity and timestamp
-    severity_order = {'Critical': 3, 'High': 2, 'Medium': 1}
-    alerts.sort(key=lambda x: (severity_order[x['severity']], x['timestamp']), reverse=True)
-    
-    # Display alerts
-    for alert in alerts[:10]:  # Show top 10 alerts
-        severity_color = {
-            'Critical': '#dc3545',
-            'High': '#fd7e14',
-            'Medium': '#ffc107'
-        }
-        
-        severity_icon = {
-            'Critical': '🚨',
-            'High': '⚠️',
-            'Medium': '⚡'
-        }
-        
-        st.markdown(f"""
-        <div style="border-left: 4px solid {severity_color[alert['severity']]}; padding: 15px; margin: 10px 0; background-color: #f8f9fa;">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <strong>{severity_icon[alert['severity']]} {alert['severity']} - {alert['type']}</strong><br>
-                    <strong>Client:</strong> {alert['client']}<br>
-                    <em>{alert['message']}</em>
-                </div>
-                <div style="text-align: right; font-size: 0.9em; color: #666;">
-                    {alert['timestamp'].strftime('%Y-%m-%d %H:%M')}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-    
     # Alert configuration
     st.markdown("**Alert Configuration**")
     
@@ -494,23 +488,124 @@ with tab4:
     
     with col1:
         st.markdown("**Risk Score Thresholds**")
-        critical_threshold = st.slider("Critical Alert", 7.0, 10.0, 8.0, 0.1)
-        high_threshold = st.slider("High Alert", 5.0, 8.0, 6.5, 0.1)
-        medium_threshold = st.slider("Medium Alert", 3.0, 6.0, 5.0, 0.1)
+        critical_threshold = st.slider("Critical Alert", 7.0, 10.0, step=0.1, **tabs.keep('risk_critical_threshold', 8.0))
+        high_threshold = st.slider("High Alert", 5.0, 8.0, step=0.1, **tabs.keep('risk_high_threshold', 6.5))
+        medium_threshold = st.slider("Medium Alert", 3.0, 6.0, step=0.1, **tabs.keep('risk_medium_threshold', 5.0))
     
     with col2:
         st.markdown("**Notification Settings**")
-        email_alerts = st.checkbox("Email Alerts", value=True)
-        sms_alerts = st.checkbox("SMS Alerts", value=False)
-        dashboard_alerts = st.checkbox("Dashboard Alerts", value=True)
+        email_alerts = st.checkbox("Email Alerts", **tabs.keep('risk_email_alerts', True))
+        sms_alerts = st.checkbox("SMS Alerts", **tabs.keep('risk_sms_alerts', False))
+        dashboard_alerts = st.checkbox("Dashboard Alerts", **tabs.keep('risk_dashboard_alerts', True))
         
         alert_frequency = st.selectbox(
             "Alert Frequency",
-            options=["Immediate", "Hourly", "Daily", "Weekly"]
+            options=["Immediate", "Hourly", "Daily", "Weekly"],
+            **tabs.keep('risk_alert_frequency', "Immediate")
         )
     
     if st.button("💾 Save Alert Settings"):
         st.success("Alert settings saved successfully!")
+    
+    # Alerts, rebuilt only when the thresholds, the risk filters or the data change
+    @sections.section('risk')
+    def alert_section(critical_threshold, high_threshold, medium_threshold, **filters):
+        # Alerts from the rules, built column-wise
+        high_risk_clients = filtered_risk_df[filtered_risk_df['risk_score'] > critical_threshold]
+        elevated_clients = filtered_risk_df[
+            (filtered_risk_df['risk_score'] > high_threshold) & (filtered_risk_df['risk_score'] <= critical_threshold)
+        ]
+        breach_clients = filtered_risk_df[filtered_risk_df['covenant_status'] == 'Breach']
+        deteriorating_clients = filtered_risk_df[
+            (filtered_risk_df['risk_trend'] == 'Deteriorating') & (filtered_risk_df['risk_score'] > medium_threshold)
+        ].head(5)
+        
+        alerts = pd.concat([
+            pd.DataFrame({
+                'severity': 'Critical',
+                'type': 'High Risk Score',
+                'client': high_risk_clients['client_name'].astype(str),
+                'message': [
+                    f"Risk score {score:.1f}/10 - Immediate review required" for score in high_risk_clients['risk_score']
+                ],
+                'hours_ago': np.random.randint(1, 25, len(high_risk_clients))
+            }),
+            pd.DataFrame({
+                'severity': 'High',
+                'type': 'Elevated Risk Score',
+                'client': elevated_clients['client_name'].astype(str),
+                'message': [
+                    f"Risk score {score:.1f}/10 - Review at next credit committee" for score in elevated_clients['risk_score']
+                ],
+                'hours_ago': np.random.randint(1, 49, len(elevated_clients))
+            }),
+            pd.DataFrame({
+                'severity': 'High',
+                'type': 'Covenant Breach',
+                'client': breach_clients['client_name'].astype(str),
+                'message': "Covenant breach detected - Legal action may be required",
+                'hours_ago': np.random.randint(1, 49, len(breach_clients))
+            }),
+            pd.DataFrame({
+                'severity': 'Medium',
+                'type': 'Deteriorating Trend',
+                'client': deteriorating_clients['client_name'].astype(str),
+                'message': "Risk trend deteriorating - Enhanced monitoring recommended",
+                'hours_ago': np.random.randint(1, 73, len(deteriorating_clients))
+            })
+        ], ignore_index=True)
+        alerts['timestamp'] = pd.Timestamp.now() - pd.to_timedelta(alerts['hours_ago'], unit='h')
+        
+        # Sort alerts by severity and timestamp
+        severity_order = {'Critical': 3, 'High': 2, 'Medium': 1}
+        severity_icon = {'Critical': '🚨', 'High': '⚠️', 'Medium': '⚡'}
+        alerts['rank'] = alerts['severity'].map(severity_order)
+        alerts = alerts.sort_values(['rank', 'timestamp'], ascending=False)
+        return pd.DataFrame({
+            'severity': alerts['severity'],
+            'severity_class': alerts['severity'].str.lower(),
+            'icon': alerts['severity'].map(severity_icon),
+            'type': alerts['type'],
+            'client': alerts['client'],
+            'message': alerts['message'],
+            'rank': alerts['rank'],
+            'time': alerts['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
+        }).to_dict('records')
+    
+    alert_items = alert_section(
+        critical_threshold=critical_threshold,
+        high_threshold=high_threshold,
+        medium_threshold=medium_threshold,
+        **risk_filters
+    )
+    
+    # Display alerts: one component, sorted and filtered in the browser
+    render.cards(
+        alert_items,
+        template="""
+        <div class="risk-alert risk-alert--{{severity_class}}">
+          <div>
+            <strong>{{icon}} {{severity}} - {{type}}</strong><br>
+            <strong>Client:</strong> {{client}}<br>
+            <em>{{message}}</em>
+          </div>
+          <div class="risk-alert-time">{{time}}</div>
+        </div>
+        """,
+        sorts=[("Severity", 'rank', True), ("Newest", 'time', True), ("Client", 'client', False)],
+        facet='severity',
+        height=480,
+        styles="""
+        .risk-alert { display: flex; justify-content: space-between; align-items: center; padding: 15px;
+                      margin: 10px 0; background-color: #f8f9fa; border-left: 4px solid; }
+        .risk-alert--critical { border-left-color: #dc3545; }
+        .risk-alert--high { border-left-color: #fd7e14; }
+        .risk-alert--medium { border-left-color: #ffc107; }
+        .risk-alert-time { text-align: right; font-size: 0.9em; color: #666; }
+        """,
+        empty="No alerts for the current filters"
+    )
+    
 
 # Risk reporting
 st.subheader("📊 Risk Reporting")
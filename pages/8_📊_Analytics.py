@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import data, downsample, figures, query, sections, tabs
+
 st.set_page_config(
     page_title="Analytics",
     page_icon="📊",
@@ -15,29 +17,8 @@ st.set_page_config(
 st.title("📊 Advanced Analytics")
 st.markdown("Business intelligence and performance metrics")
 
-# Generate comprehensive analytics data
-@st.cache_data
-def generate_analytics_data():
-    # Performance data
-    dates = pd.date_range(start='2024-01-01', end='2024-06-30', freq='D')
-    performance_data = []
-    
-    for date in dates:
-        performance_data.append({
-            'date': date,
-            'revenue': random.uniform(800000, 1200000),
-            'new_clients': random.randint(2, 8),
-            'deals_closed': random.randint(1, 5),
-            'pipeline_value': random.uniform(50000000, 80000000),
-            'client_satisfaction': random.uniform(7.5, 9.5),
-            'operational_efficiency': random.uniform(0.75, 0.95),
-            'risk_score': random.uniform(3.0, 7.0),
-            'market_share': random.uniform(0.12, 0.18)
-        })
-    
-    return pd.DataFrame(performance_data)
-
-analytics_df = generate_analytics_data()
+# Shared daily performance dataset
+analytics_df = data.performance()
 
 # Key performance indicators
 st.subheader("📈 Key Performance Indicators")
@@ -90,9 +71,9 @@ with col5:
     )
 
 # Analytics dashboard
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📈 Performance", "👥 Client Analytics", "💼 Deal Analytics", "🎯 Predictive", "📊 Custom Reports"])
+tab1, tab2, tab3, tab4, tab5 = tabs.lazy(["📈 Performance", "👥 Client Analytics", "💼 Deal Analytics", "🎯 Predictive", "📊 Custom Reports"], key='analytics_tab')
 
-with tab1:
+if tab1:
     st.subheader("📈 Performance Analytics")
     
     # Time period selector
@@ -105,59 +86,76 @@ with tab1:
         time_period = st.selectbox(
             "Time Period",
             options=["Last 30 days", "Last 90 days", "Last 6 months", "Year to date"],
-            index=2
+            **tabs.keep('analytics_time_period', "Last 6 months")
         )
     
-    # Filter data based on time period
-    if time_period == "Last 30 days":
-        filtered_data = analytics_df.tail(30)
-    elif time_period == "Last 90 days":
-        filtered_data = analytics_df.tail(90)
-    elif time_period == "Last 6 months":
-        filtered_data = analytics_df.tail(180)
-    else:
-        filtered_data = analytics_df
-    
-    # Revenue trend
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        fig_revenue = px.line(
-            filtered_data,
+    # Performance figures, rebuilt only when the period or the data changes
+    @sections.section('performance')
+    def performance_section(time_period):
+        # Filter data based on time period
+        if time_period == "Last 30 days":
+            filtered_data = analytics_df.tail(30)
+        elif time_period == "Last 90 days":
+            filtered_data = analytics_df.tail(90)
+        elif time_period == "Last 6 months":
+            filtered_data = analytics_df.tail(180)
+        else:
+            filtered_data = analytics_df
+        
+        fig_revenue = figures.plot(
+            px.line,
+            downsample.frame(filtered_data, 'date', 'revenue', width=downsample.HALF_WIDTH),
             x='date',
             y='revenue',
             title="Daily Revenue Trend"
         )
         fig_revenue.update_layout(yaxis_tickformat='£,.0f')
-        st.plotly_chart(fig_revenue, use_container_width=True)
-    
-    with col2:
+        
         # Monthly revenue aggregation
-        monthly_revenue = filtered_data.groupby(filtered_data['date'].dt.to_period('M'))['revenue'].sum().reset_index()
-        monthly_revenue['date'] = monthly_revenue['date'].astype(str)
+        monthly_revenue = query.sql(f"""
+            SELECT {query.month('"date"')} AS "date", SUM(revenue) AS revenue
+            FROM performance
+            WHERE "date" >= ?
+            GROUP BY 1
+            ORDER BY 1
+        """, 'performance', params=[filtered_data['date'].min().to_pydatetime()])
         monthly_revenue['revenue_millions'] = monthly_revenue['revenue'] / 1000000
         
-        fig_monthly = px.bar(
+        fig_monthly = figures.plot(
+            px.bar,
             monthly_revenue,
             x='date',
             y='revenue_millions',
             title="Monthly Revenue (£M)"
         )
-        st.plotly_chart(fig_monthly, use_container_width=True)
+        
+        # Performance correlation matrix
+        correlation_cols = ['revenue', 'new_clients', 'deals_closed', 'client_satisfaction', 'operational_efficiency']
+        correlation_matrix = filtered_data[correlation_cols].corr()
+        
+        fig_corr = figures.plot(
+            px.imshow,
+            correlation_matrix,
+            title="Performance Metrics Correlation",
+            color_continuous_scale="RdBu",
+            aspect="auto"
+        )
+        return {'revenue': fig_revenue, 'monthly': fig_monthly, 'correlation': fig_corr}
     
-    # Performance correlation matrix
-    st.markdown("**Performance Correlation Analysis**")
+    performance_figures = performance_section(time_period=time_period)
     
-    correlation_cols = ['revenue', 'new_clients', 'deals_closed', 'client_satisfaction', 'operational_efficiency']
-    correlation_matrix = filtered_data[correlation_cols].corr()
+    # Revenue trend
+    col1, col2 = st.columns(2)
     
-    fig_corr = px.imshow(
-        correlation_matrix,
-        title="Performance Metrics Correlation",
-        color_continuous_scale="RdBu",
-        aspect="auto"
-    )
-    st.plotly_chart(fig_corr, use_container_width=True)
+    with col1:
+        st.plotly_chart(performance_figures['revenue'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(performance_figures['monthly'], use_container_width=True)
+    
+    # Performance correlation matrix
+    st.markdown("**Performance Correlation Analysis**")
+    st.plotly_chart(performance_figures['correlation'], use_container_width=True)
     
     # Performance benchmarks
     st.markdown("**Performance Benchmarks**")
@@ -172,106 +170,81 @@ with tab1:
     
     st.dataframe(benchmarks, use_container_width=True)
 
-with tab2:
+if tab2:
     st.subheader("👥 Client Analytics")
     
-    # Generate client analytics data
-    @st.cache_data
-    def generate_client_analytics():
-        industries = ['Technology', 'Healthcare', 'Manufacturing', 'Retail', 'Energy', 'Finance']
-        regions = ['London', 'Manchester', 'Birmingham', 'Edinburgh', 'Cardiff']
-        
-        client_data = []
-        for i in range(200):
-            client_data.append({
-                'client_id': f'CLI-{1000 + i}',
-                'industry': random.choice(industries),
-                'region': random.choice(regions),
-                'revenue_contribution': random.uniform(100000, 5000000),
-                'relationship_length': random.randint(1, 15),
-                'satisfaction_score': random.uniform(6.0, 10.0),
-                'products_used': random.randint(1, 8),
-                'last_interaction': datetime.now() - timedelta(days=random.randint(1, 90)),
-                'growth_potential': random.choice(['High', 'Medium', 'Low']),
-                'risk_level': random.choice(['Low', 'Medium', 'High'])
-            })
-        
-        return pd.DataFrame(client_data)
-    
-    client_analytics_df = generate_client_analytics()
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
+    # Client figures and tables, rebuilt only when the client book changes
+    @sections.section('clients')
+    def client_section():
+        client_analytics_df = data.clients()
+        
         # Client distribution by industry
-        industry_revenue = client_analytics_df.groupby('industry')['revenue_contribution'].sum().reset_index()
+        industry_revenue = query.sql("""
+            SELECT industry, SUM(revenue_contribution) AS revenue_contribution
+            FROM clients
+            GROUP BY industry
+            ORDER BY industry
+        """, 'clients')
         industry_revenue['revenue_millions'] = industry_revenue['revenue_contribution'] / 1000000
         
-        fig_industry = px.pie(
+        fig_industry = figures.plot(
+            px.pie,
             industry_revenue,
             values='revenue_millions',
             names='industry',
             title="Revenue Distribution by Industry"
         )
-        st.plotly_chart(fig_industry, use_container_width=True)
-    
-    with col2:
+        
         # Client satisfaction by industry
-        satisfaction_by_industry = client_analytics_df.groupby('industry')['satisfaction_score'].mean().reset_index()
+        satisfaction_by_industry = query.sql("""
+            SELECT industry, AVG(satisfaction_score) AS satisfaction_score
+            FROM clients
+            GROUP BY industry
+            ORDER BY industry
+        """, 'clients')
         
-        fig_satisfaction = px.bar(
+        fig_satisfaction = figures.plot(
+            px.bar,
             satisfaction_by_industry,
             x='industry',
             y='satisfaction_score',
             title="Average Satisfaction by Industry"
         )
-        st.plotly_chart(fig_satisfaction, use_container_width=True)
-    
-    # Client segmentation analysis
-    st.markdown("**Client Segmentation Analysis**")
-    
-    # Create client segments based on revenue and relationship length
-    client_analytics_df['segment'] = 'Standard'
-    client_analytics_df.loc[
-        (client_analytics_df['revenue_contribution'] > 1000000) & 
-        (client_analytics_df['relationship_length'] > 5), 'segment'
-    ] = 'Premium'
-    client_analytics_df.loc[
-        (client_analytics_df['revenue_contribution'] > 2000000) & 
-        (client_analytics_df['relationship_length'] > 10), 'segment'
-    ] = 'Elite'
-    
-    segment_analysis = client_analytics_df.groupby('segment').agg({
-        'client_id': 'count',
-        'revenue_contribution': ['sum', 'mean'],
-        'satisfaction_score': 'mean',
-        'products_used': 'mean'
-    }).round(2)
-    
-    segment_analysis.columns = ['Client Count', 'Total Revenue', 'Avg Revenue', 'Avg Satisfaction', 'Avg Products']
-    segment_analysis['Total Revenue'] = segment_analysis['Total Revenue'] / 1000000
-    segment_analysis['Avg Revenue'] = segment_analysis['Avg Revenue'] / 1000000
-    
-    st.dataframe(segment_analysis, use_container_width=True)
-    
-    # Client lifecycle analysis
-    col1, col2 = st.columns(2)
-    
-    with col1:
+        
+        # Create client segments based on revenue and relationship length
+        segment_analysis = query.sql("""
+            SELECT segment, COUNT(client_id), ROUND(SUM(revenue_contribution), 2), ROUND(AVG(revenue_contribution), 2),
+                   ROUND(AVG(satisfaction_score), 2), ROUND(AVG(products_used), 2)
+            FROM (
+                SELECT *, CASE
+                    WHEN revenue_contribution > 2000000 AND relationship_length > 10 THEN 'Elite'
+                    WHEN revenue_contribution > 1000000 AND relationship_length > 5 THEN 'Premium'
+                    ELSE 'Standard'
+                END AS segment
+                FROM clients
+            ) AS segmented
+            GROUP BY segment
+            ORDER BY segment
+        """, 'clients').set_index('segment')
+        
+        segment_analysis.columns = ['Client Count', 'Total Revenue', 'Avg Revenue', 'Avg Satisfaction', 'Avg Products']
+        segment_analysis['Total Revenue'] = segment_analysis['Total Revenue'] / 1000000
+        segment_analysis['Avg Revenue'] = segment_analysis['Avg Revenue'] / 1000000
+        
         # Relationship length distribution
-        fig_relationship = px.histogram(
+        fig_relationship = figures.plot(
+            px.histogram,
             client_analytics_df,
             x='relationship_length',
             title="Client Relationship Length Distribution",
             nbins=15
         )
-        st.plotly_chart(fig_relationship, use_container_width=True)
-    
-    with col2:
+        
         # Growth potential analysis
         growth_counts = client_analytics_df['growth_potential'].value_counts()
         
-        fig_growth = px.bar(
+        fig_growth = figures.plot(
+            px.bar,
             x=growth_counts.index,
             y=growth_counts.values,
             title="Client Growth Potential Distribution",
@@ -282,111 +255,152 @@ with tab2:
                 'Low': '#dc3545'
             }
         )
-        st.plotly_chart(fig_growth, use_container_width=True)
-
-with tab3:
-    st.subheader("💼 Deal Analytics")
+        return {
+            'industry': fig_industry,
+            'satisfaction': fig_satisfaction,
+            'segments': segment_analysis,
+            'relationship': fig_relationship,
+            'growth': fig_growth
+        }
     
-    # Generate deal analytics data
-    @st.cache_data
-    def generate_deal_analytics():
-        deal_types = ['Term Loan', 'Credit Line', 'Trade Finance', 'Treasury Services', 'Equipment Finance']
-        stages = ['Prospect', 'Qualified', 'Proposal', 'Negotiation', 'Closed Won', 'Closed Lost']
-        
-        deal_data = []
-        for i in range(300):
-            deal_data.append({
-                'deal_id': f'DEAL-{2000 + i}',
-                'deal_type': random.choice(deal_types),
-                'deal_value': random.uniform(500000, 20000000),
-                'stage': random.choice(stages),
-                'probability': random.uniform(10, 95),
-                'days_in_pipeline': random.randint(1, 365),
-                'rm_name': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown', 'Lisa Davis']),
-                'industry': random.choice(['Technology', 'Healthcare', 'Manufacturing', 'Retail', 'Energy']),
-                'created_date': datetime.now() - timedelta(days=random.randint(1, 365)),
-                'expected_close': datetime.now() + timedelta(days=random.randint(1, 180)),
-                'actual_close': datetime.now() - timedelta(days=random.randint(1, 30)) if random.random() > 0.7 else None
-            })
-        
-        return pd.DataFrame(deal_data)
-    
-    deal_analytics_df = generate_deal_analytics()
+    client_outputs = client_section()
     
     col1, col2 = st.columns(2)
     
     with col1:
+        st.plotly_chart(client_outputs['industry'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(client_outputs['satisfaction'], use_container_width=True)
+    
+    # Client segmentation analysis
+    st.markdown("**Client Segmentation Analysis**")
+    st.dataframe(client_outputs['segments'], use_container_width=True)
+    
+    # Client lifecycle analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(client_outputs['relationship'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(client_outputs['growth'], use_container_width=True)
+
+if tab3:
+    st.subheader("💼 Deal Analytics")
+    
+    # Deal figures and tables, rebuilt only when the deals change
+    @sections.section('deals')
+    def deal_section():
         # Deal value by type
-        deal_value_by_type = deal_analytics_df.groupby('deal_type')['deal_value'].sum().reset_index()
+        deal_value_by_type = query.sql("""
+            SELECT product_type AS deal_type, SUM(value) AS deal_value
+            FROM deals
+            GROUP BY product_type
+            ORDER BY product_type
+        """, 'deals')
         deal_value_by_type['deal_value_millions'] = deal_value_by_type['deal_value'] / 1000000
         
-        fig_deal_value = px.bar(
+        fig_deal_value = figures.plot(
+            px.bar,
             deal_value_by_type,
             x='deal_type',
             y='deal_value_millions',
             title="Total Deal Value by Type (£M)"
         )
-        st.plotly_chart(fig_deal_value, use_container_width=True)
-    
-    with col2:
+        
         # Deal conversion funnel
         stage_order = ['Prospect', 'Qualified', 'Proposal', 'Negotiation', 'Closed Won', 'Closed Lost']
-        funnel_data = deal_analytics_df['stage'].value_counts().reindex(stage_order, fill_value=0)
+        funnel_data = query.sql("""
+            SELECT stage, COUNT(*) AS deals
+            FROM deals
+            GROUP BY stage
+        """, 'deals').set_index('stage')['deals'].reindex(stage_order, fill_value=0)
         
-        fig_funnel = px.funnel(
+        fig_funnel = figures.plot(
+            px.funnel,
             x=funnel_data.values,
             y=funnel_data.index,
             title="Deal Conversion Funnel"
         )
-        st.plotly_chart(fig_funnel, use_container_width=True)
-    
-    # RM performance analysis
-    st.markdown("**Relationship Manager Performance**")
-    
-    rm_performance = deal_analytics_df.groupby('rm_name').agg({
-        'deal_id': 'count',
-        'deal_value': ['sum', 'mean'],
-        'probability': 'mean',
-        'days_in_pipeline': 'mean'
-    }).round(2)
-    
-    rm_performance.columns = ['Deal Count', 'Total Value', 'Avg Deal Size', 'Avg Probability', 'Avg Days in Pipeline']
-    rm_performance['Total Value'] = rm_performance['Total Value'] / 1000000
-    rm_performance['Avg Deal Size'] = rm_performance['Avg Deal Size'] / 1000000
-    
-    st.dataframe(rm_performance, use_container_width=True)
-    
-    # Deal velocity analysis
-    col1, col2 = st.columns(2)
-    
-    with col1:
+        
+        # RM performance analysis
+        rm_performance = query.sql("""
+            SELECT rm_name, COUNT(deal_id), ROUND(SUM(value), 2), ROUND(AVG(value), 2),
+                   ROUND(AVG(probability), 2), ROUND(AVG(days_in_pipeline), 2)
+            FROM deals
+            GROUP BY rm_name
+            ORDER BY rm_name
+        """, 'deals').set_index('rm_name')
+        
+        rm_performance.columns = ['Deal Count', 'Total Value', 'Avg Deal Size', 'Avg Probability', 'Avg Days in Pipeline']
+        rm_performance['Total Value'] = rm_performance['Total Value'] / 1000000
+        rm_performance['Avg Deal Size'] = rm_performance['Avg Deal Size'] / 1000000
+        
         # Average days in pipeline by stage
-        pipeline_days = deal_analytics_df.groupby('stage')['days_in_pipeline'].mean().reset_index()
+        pipeline_days = query.sql("""
+            SELECT stage, AVG(days_in_pipeline) AS days_in_pipeline
+            FROM deals
+            GROUP BY stage
+            ORDER BY stage
+        """, 'deals')
         
-        fig_velocity = px.bar(
+        fig_velocity = figures.plot(
+            px.bar,
             pipeline_days,
             x='stage',
             y='days_in_pipeline',
             title="Average Days in Pipeline by Stage"
         )
-        st.plotly_chart(fig_velocity, use_container_width=True)
-    
-    with col2:
+        
         # Win rate by industry
-        closed_deals = deal_analytics_df[deal_analytics_df['stage'].isin(['Closed Won', 'Closed Lost'])]
-        win_rate_by_industry = closed_deals.groupby('industry').apply(
-            lambda x: (x['stage'] == 'Closed Won').sum() / len(x) * 100
-        ).reset_index(name='win_rate')
+        win_rate_by_industry = query.sql("""
+            SELECT industry, AVG(CASE WHEN stage = 'Closed Won' THEN 100.0 ELSE 0.0 END) AS win_rate
+            FROM deals
+            WHERE stage IN ('Closed Won', 'Closed Lost')
+            GROUP BY industry
+            ORDER BY industry
+        """, 'deals')
         
-        fig_win_rate = px.bar(
+        fig_win_rate = figures.plot(
+            px.bar,
             win_rate_by_industry,
             x='industry',
             y='win_rate',
             title="Win Rate by Industry (%)"
         )
-        st.plotly_chart(fig_win_rate, use_container_width=True)
+        return {
+            'deal_value': fig_deal_value,
+            'funnel': fig_funnel,
+            'rm_performance': rm_performance,
+            'velocity': fig_velocity,
+            'win_rate': fig_win_rate
+        }
+    
+    deal_outputs = deal_section()
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(deal_outputs['deal_value'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(deal_outputs['funnel'], use_container_width=True)
+    
+    # RM performance analysis
+    st.markdown("**Relationship Manager Performance**")
+    st.dataframe(deal_outputs['rm_performance'], use_container_width=True)
+    
+    # Deal velocity analysis
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(deal_outputs['velocity'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(deal_outputs['win_rate'], use_container_width=True)
 
-with tab4:
+if tab4:
     st.subheader("🎯 Predictive Analytics")
     
     # Revenue forecasting
@@ -416,7 +430,7 @@ with tab4:
     })
     
     # Combine historical and forecast data
-    historical_df = analytics_df[['date', 'revenue']].copy()
+    historical_df = analytics_df[['date', 'revenue']]
     historical_df['type'] = 'Historical'
     
     combined_df = pd.concat([historical_df.tail(60), forecast_df], ignore_index=True)
@@ -492,7 +506,8 @@ with tab4:
             'Accuracy': [82.1, 84.3, 85.7, 86.9, 87.2, 87.5]
         })
         
-        fig_accuracy = px.line(
+        fig_accuracy = figures.plot(
+            px.line,
             accuracy_trend,
             x='Month',
             y='Accuracy',
@@ -500,7 +515,7 @@ with tab4:
         )
         st.plotly_chart(fig_accuracy, use_container_width=True)
 
-with tab5:
+if tab5:
     st.subheader("📊 Custom Reports")
     
     st.markdown("**Report Builder**")
@@ -512,29 +527,32 @@ with tab5:
         
         report_type = st.selectbox(
             "Report Type",
-            options=["Executive Summary", "Client Analysis", "Deal Performance", "Risk Assessment", "Custom"]
+            options=["Executive Summary", "Client Analysis", "Deal Performance", "Risk Assessment", "Custom"],
+            **tabs.keep('analytics_report_type', "Executive Summary")
         )
         
         date_range = st.date_input(
             "Date Range",
-            value=[datetime.now() - timedelta(days=30), datetime.now()],
-            max_value=datetime.now()
+            max_value=datetime.now(),
+            **tabs.keep('analytics_report_dates', ((datetime.now() - timedelta(days=30)).date(), datetime.now().date()), argument='value')
         )
         
         metrics = st.multiselect(
             "Metrics to Include",
             options=["Revenue", "Client Count", "Deal Value", "Risk Score", "Satisfaction", "Efficiency"],
-            default=["Revenue", "Client Count", "Deal Value"]
+            **tabs.keep('analytics_report_metrics', ["Revenue", "Client Count", "Deal Value"])
         )
         
         grouping = st.selectbox(
             "Group By",
-            options=["Daily", "Weekly", "Monthly", "Quarterly"]
+            options=["Daily", "Weekly", "Monthly", "Quarterly"],
+            **tabs.keep('analytics_report_grouping', "Daily")
         )
         
         format_type = st.selectbox(
             "Export Format",
-            options=["PDF", "Excel", "PowerPoint", "CSV"]
+            options=["PDF", "Excel", "PowerPoint", "CSV"],
+            **tabs.keep('analytics_report_format', "PDF")
         )
     
     with col2:
@@ -563,7 +581,8 @@ with tab5:
             
             # Show preview chart
             if "Revenue" in metrics:
-                fig_preview = px.line(
+                fig_preview = figures.plot(
+                    px.line,
                     preview_data.head(20),
                     x='date',
                     y='revenue',
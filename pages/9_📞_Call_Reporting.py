@@ -6,6 +6,8 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import random
 
+from pulse import aggregates, data, figures, fuzzy, paging, sections, tabs, timeindex
+
 st.set_page_config(
     page_title="Call Reporting & Meeting Management",
     page_icon="📞",
@@ -15,50 +17,17 @@ st.set_page_config(
 st.title("📞 Call Reporting & Meeting Management")
 st.markdown("Log and generate call/meeting reports with AI assistance, MS Teams/Zoom integration, and action item tracking")
 
-# Generate sample call/meeting data
-@st.cache_data
-def generate_call_data():
-    meeting_types = ['Client Call', 'Internal Meeting', 'Prospect Call', 'Review Meeting', 'Training Session']
-    platforms = ['MS Teams', 'Zoom', 'Phone', 'In-Person', 'Google Meet']
-    statuses = ['Completed', 'Scheduled', 'Cancelled', 'Rescheduled']
-    
-    calls = []
-    for i in range(150):
-        call_date = datetime.now() - timedelta(days=random.randint(0, 90))
-        call = {
-            'call_id': f'CALL-{3000 + i}',
-            'meeting_type': random.choice(meeting_types),
-            'client_name': f'Client {chr(65 + i % 26)}{i % 50}',
-            'participants': random.randint(2, 8),
-            'duration_minutes': random.randint(15, 120),
-            'platform': random.choice(platforms),
-            'date': call_date,
-            'status': random.choice(statuses),
-            'rm_name': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown', 'Lisa Davis']),
-            'transcript_available': random.choice([True, False]),
-            'ai_summary_generated': random.choice([True, False]),
-            'action_items_count': random.randint(0, 8),
-            'follow_up_required': random.choice([True, False]),
-            'satisfaction_rating': random.uniform(7.0, 10.0) if random.random() > 0.3 else None,
-            'deal_value_discussed': random.uniform(0, 10000000) if random.random() > 0.5 else 0,
-            'next_meeting_scheduled': random.choice([True, False]),
-            'recording_available': random.choice([True, False])
-        }
-        calls.append(call)
-    
-    return pd.DataFrame(calls)
+# Shared call dataset
+calls_df = data.calls()
 
-calls_df = generate_call_data()
-
-# Call reporting overview
+# Call reporting overview, read from the call rollups
+call_summary = aggregates.call_summary()
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_calls = len(calls_df[calls_df['status'] == 'Completed'])
-    calls_this_week = len(calls_df[
-        (calls_df['status'] == 'Completed') & 
-        (calls_df['date'] >= datetime.now() - timedelta(days=7))
-    ])
+    total_calls = call_summary['completed_calls']
+    recent_calls = calls_df.iloc[timeindex.window('calls', 'date', start=datetime.now() - timedelta(days=7))]
+    calls_this_week = int((recent_calls['status'] == 'Completed').sum())
     st.metric(
         label="📞 Total Calls",
         value=total_calls,
@@ -66,8 +35,8 @@ with col1:
     )
 
 with col2:
-    total_duration = calls_df[calls_df['status'] == 'Completed']['duration_minutes'].sum()
-    avg_duration = calls_df[calls_df['status'] == 'Completed']['duration_minutes'].mean()
+    total_duration = call_summary['completed_minutes']
+    avg_duration = total_duration / total_calls if total_calls else 0.0
     st.metric(
         label="⏱️ Total Duration",
         value=f"{total_duration/60:.1f} hours",
@@ -75,7 +44,7 @@ with col2:
     )
 
 with col3:
-    total_action_items = calls_df['action_items_count'].sum()
+    total_action_items = call_summary['action_items']
     completed_action_items = int(total_action_items * 0.73)  # Assume 73% completion rate
     st.metric(
         label="✅ Action Items",
@@ -84,7 +53,7 @@ with col3:
     )
 
 with col4:
-    avg_satisfaction = calls_df['satisfaction_rating'].mean()
+    avg_satisfaction = call_summary['avg_satisfaction']
     satisfaction_trend = 0.3  # Positive trend
     st.metric(
         label="😊 Avg Satisfaction",
@@ -93,9 +62,9 @@ with col4:
     )
 
 # Main interface tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs(["📝 New Call Report", "📋 Call History", "🎯 Action Items", "📊 Analytics", "⚙️ Settings"])
+tab1, tab2, tab3, tab4, tab5 = tabs.lazy(["📝 New Call Report", "📋 Call History", "🎯 Action Items", "📊 Analytics", "⚙️ Settings"], key='call_reporting_tab')
 
-with tab1:
+if tab1:
     st.subheader("📝 Create New Call Report")
     
     # Call report form
@@ -106,48 +75,59 @@ with tab1:
         
         meeting_type = st.selectbox(
             "Meeting Type",
-            options=['Client Call', 'Internal Meeting', 'Prospect Call', 'Review Meeting', 'Training Session']
+            options=['Client Call', 'Internal Meeting', 'Prospect Call', 'Review Meeting', 'Training Session'],
+            **tabs.keep('call_meeting_type', 'Client Call')
         )
         
-        client_name = st.text_input("Client/Participant Name")
+        client_name = st.text_input("Client/Participant Name", **tabs.keep('call_client_name', ''))
+        
+        rm_choice = st.selectbox(
+            "Relationship Manager",
+            options=data.RELATIONSHIP_MANAGERS,
+            index=None,
+            placeholder="From the client record",
+            **tabs.keep('call_rm', None)
+        )
         
-        meeting_date = st.date_input("Meeting Date", value=datetime.now().date())
-        meeting_time = st.time_input("Meeting Time", value=datetime.now().time())
+        meeting_date = st.date_input("Meeting Date", **tabs.keep('call_meeting_date', datetime.now().date()))
+        meeting_time = st.time_input("Meeting Time", **tabs.keep('call_meeting_time', datetime.now().time()))
         
-        duration = st.number_input("Duration (minutes)", min_value=5, max_value=480, value=60, step=5)
+        duration = st.number_input("Duration (minutes)", min_value=5, max_value=480, step=5, **tabs.keep('call_duration', 60))
         
         platform = st.selectbox(
             "Platform",
-            options=['MS Teams', 'Zoom', 'Phone', 'In-Person', 'Google Meet']
+            options=['MS Teams', 'Zoom', 'Phone', 'In-Person', 'Google Meet'],
+            **tabs.keep('call_platform', 'MS Teams')
         )
         
-        participants = st.text_area("Participants", placeholder="List all participants...")
+        participants = st.text_area("Participants", placeholder="List all participants...", **tabs.keep('call_participants', ''))
     
     with col2:
         st.markdown("**Integration Options**")
         
         # MS Teams/Zoom integration
-        integration_enabled = st.checkbox("🔗 Auto-import from Teams/Zoom", value=True)
+        integration_enabled = st.checkbox("🔗 Auto-import from Teams/Zoom", **tabs.keep('call_integration', True))
         
         if integration_enabled:
             st.info("✅ Connected to MS Teams and Zoom. Meeting details will be auto-populated.")
             
             # Simulated integration options
-            auto_transcript = st.checkbox("📝 Auto-generate transcript", value=True)
-            auto_summary = st.checkbox("🤖 AI-powered summary", value=True)
-            auto_action_items = st.checkbox("🎯 Extract action items automatically", value=True)
-            auto_sentiment = st.checkbox("😊 Sentiment analysis", value=False)
+            auto_transcript = st.checkbox("📝 Auto-generate transcript", **tabs.keep('call_auto_transcript', True))
+            auto_summary = st.checkbox("🤖 AI-powered summary", **tabs.keep('call_auto_summary', True))
+            auto_action_items = st.checkbox("🎯 Extract action items automatically", **tabs.keep('call_auto_action_items', True))
+            auto_sentiment = st.checkbox("😊 Sentiment analysis", **tabs.keep('call_auto_sentiment', False))
         
         # Recording options
         st.markdown("**Recording & Documentation**")
         
-        recording_available = st.checkbox("🎥 Recording available")
-        transcript_available = st.checkbox("📄 Transcript available")
+        recording_available = st.checkbox("🎥 Recording available", **tabs.keep('call_recording', False))
+        transcript_available = st.checkbox("📄 Transcript available", **tabs.keep('call_transcript', False))
         
         if transcript_available:
             transcript_quality = st.selectbox(
                 "Transcript Quality",
-                options=['Excellent', 'Good', 'Fair', 'Poor']
+                options=['Excellent', 'Good', 'Fair', 'Poor'],
+                **tabs.keep('call_transcript_quality', 'Excellent')
             )
     
     # Meeting content
@@ -158,28 +138,31 @@ with tab1:
     with col1:
         meeting_objective = st.text_area(
             "Meeting Objective",
-            placeholder="What was the purpose of this meeting?"
+            placeholder="What was the purpose of this meeting?",
+            **tabs.keep('call_objective', '')
         )
         
         key_discussion_points = st.text_area(
             "Key Discussion Points",
             placeholder="Summarize the main topics discussed...",
-            height=150
+            height=150,
+            **tabs.keep('call_discussion', '')
         )
     
     with col2:
         outcomes_decisions = st.text_area(
             "Outcomes & Decisions",
             placeholder="What decisions were made? What are the next steps?",
-            height=150
+            height=150,
+            **tabs.keep('call_outcomes', '')
         )
         
         deal_value = st.number_input(
             "Deal Value Discussed (£)",
             min_value=0,
-            value=0,
             step=100000,
-            format="%d"
+            format="%d",
+            **tabs.keep('call_deal_value', 0)
         )
     
     # Action items section
@@ -192,7 +175,7 @@ with tab1:
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        new_action_item = st.text_input("Add Action Item", placeholder="Describe the action item...")
+        new_action_item = st.text_input("Add Action Item", placeholder="Describe the action item...", **tabs.keep('call_new_action_item', ''))
     
     with col2:
         if st.button("➕ Add Action Item"):
@@ -310,8 +293,34 @@ with tab1:
     
     with col2:
         if st.button("✅ Complete Report"):
-            st.success("Call report completed and saved!")
-            st.balloons()
+            # Record the call; the analytics tab folds it in without a full regroup
+            clients = data.clients()
+            client_match = clients[clients['client_name'] == client_name]
+            rm_name = rm_choice or (str(client_match['relationship_manager'].iloc[0]) if len(client_match) else None)
+            if rm_name is None:
+                st.error("Choose the relationship manager, or enter a client on record")
+            else:
+                data.append('calls', pd.DataFrame([{
+                    'client_id': client_match['client_id'].iloc[0] if len(client_match) else '',
+                    'client_name': client_name,
+                    'meeting_type': meeting_type,
+                    'participants': max(2, len([p for p in participants.splitlines() if p.strip()])),
+                    'duration_minutes': duration,
+                    'platform': platform,
+                    'date': datetime.combine(meeting_date, meeting_time),
+                    'status': 'Completed',
+                    'rm_name': rm_name,
+                    'transcript_available': transcript_available,
+                    'ai_summary_generated': integration_enabled and auto_summary,
+                    'action_items_count': len(st.session_state.action_items),
+                    'follow_up_required': bool(st.session_state.action_items),
+                    'satisfaction_rating': np.nan,
+                    'deal_value_discussed': float(deal_value),
+                    'next_meeting_scheduled': False,
+                    'recording_available': recording_available
+                }]))
+                st.success("Call report completed and saved!")
+                st.balloons()
     
     with col3:
         if st.button("📧 Email Report"):
@@ -321,7 +330,7 @@ with tab1:
         if st.button("📅 Schedule Follow-up"):
             st.success("Follow-up meeting scheduled!")
 
-with tab2:
+if tab2:
     st.subheader("📋 Call History & Reports")
     
     # Filters
@@ -330,56 +339,55 @@ with tab2:
     with col1:
         type_filter = st.multiselect(
             "Meeting Type",
-            options=calls_df['meeting_type'].unique(),
-            default=calls_df['meeting_type'].unique()
+            options=calls_df['meeting_type'].unique().tolist(),
+            **tabs.keep('call_history_type', calls_df['meeting_type'].unique().tolist())
         )
     
     with col2:
         rm_filter = st.multiselect(
             "Relationship Manager",
-            options=calls_df['rm_name'].unique(),
-            default=calls_df['rm_name'].unique()
+            options=calls_df['rm_name'].unique().tolist(),
+            **tabs.keep('call_history_rm', calls_df['rm_name'].unique().tolist())
         )
     
     with col3:
         platform_filter = st.multiselect(
             "Platform",
-            options=calls_df['platform'].unique(),
-            default=calls_df['platform'].unique()
+            options=calls_df['platform'].unique().tolist(),
+            **tabs.keep('call_history_platform', calls_df['platform'].unique().tolist())
         )
     
     with col4:
         date_range = st.date_input(
             "Date Range",
-            value=[datetime.now().date() - timedelta(days=30), datetime.now().date()],
-            max_value=datetime.now().date()
+            max_value=datetime.now().date(),
+            **tabs.keep('call_history_dates', (datetime.now().date() - timedelta(days=30), datetime.now().date()), argument='value')
         )
     
-    # Apply filters
-    filtered_calls = calls_df[
-        (calls_df['meeting_type'].isin(type_filter)) &
-        (calls_df['rm_name'].isin(rm_filter)) &
-        (calls_df['platform'].isin(platform_filter))
-    ]
+    # Search functionality
+    search_query = st.text_input("🔍 Search calls...", placeholder="Search by client name or CIF", **tabs.keep('call_history_search', ''))
     
+    # Call history is paged newest first in the SQL engine, a page per query,
+    # so the filtered history is never materialised
+    filters = {'meeting_type': type_filter, 'rm_name': rm_filter, 'platform': platform_filter}
     if len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_calls = filtered_calls[
-            (filtered_calls['date'].dt.date >= start_date) &
-            (filtered_calls['date'].dt.date <= end_date)
-        ]
-    
-    # Search functionality
-    search_query = st.text_input("🔍 Search calls...", placeholder="Search by client name, content, or participants")
-    
+        filters['date'] = (pd.Timestamp(start_date), pd.Timestamp(end_date) + timedelta(days=1))
     if search_query:
-        search_mask = filtered_calls['client_name'].str.contains(search_query, case=False, na=False)
-        filtered_calls = filtered_calls[search_mask]
+        # The best matches only, as for the client pickers, so the IN list stays bounded
+        matches = fuzzy.clients().lookup(search_query, limit=fuzzy.PICKER_LIMIT)
+        filters['client_id'] = data.clients()['client_id'].iloc[matches['key']].tolist()
+    condition, params = paging.where(**filters)
+    total_calls = paging.count('calls', condition, params)
+    
+    call_pager = st.session_state.setdefault('call_history_pager', paging.Pager())
+    call_pager.start(filters)
+    page_calls, next_cursor = paging.page('calls', [('date', 'DESC')], condition, params, after=call_pager.after)
     
     # Display calls
-    st.markdown(f"**Showing {len(filtered_calls)} calls**")
+    st.markdown(f"**Showing {len(page_calls)} of {total_calls:,} calls**")
     
-    for idx, call in filtered_calls.head(20).iterrows():
+    for idx, call in page_calls.iterrows():
         with st.expander(f"📞 {call['meeting_type']} - {call['client_name']} ({call['date'].strftime('%Y-%m-%d')})"):
             col1, col2, col3 = st.columns(3)
             
@@ -392,7 +400,7 @@ with tab2:
             with col2:
                 st.markdown(f"**Participants:** {call['participants']}")
                 st.markdown(f"**Status:** {call['status']}")
-                if call['satisfaction_rating']:
+                if pd.notna(call['satisfaction_rating']):
                     st.markdown(f"**Satisfaction:** {call['satisfaction_rating']:.1f}/10")
                 if call['deal_value_discussed'] > 0:
                     st.markdown(f"**Deal Value:** £{call['deal_value_discussed']:,.0f}")
@@ -437,41 +445,21 @@ with tab2:
                 if st.button("📧 Share", key=f"share_{call['call_id']}"):
                     st.success("Call report shared!")
 
-with tab3:
-    st.subheader("🎯 Action Items Management")
+    col1, col2, col3 = st.columns([1, 4, 1])
     
-    # Generate sample action items
-    @st.cache_data
-    def generate_action_items():
-        priorities = ['High', 'Medium', 'Low']
-        statuses = ['Open', 'In Progress', 'Completed', 'Overdue']
-        
-        action_items = []
-        for i in range(50):
-            due_date = datetime.now() + timedelta(days=random.randint(-10, 30))
-            status = random.choice(statuses)
-            
-            # Make overdue items actually overdue
-            if status == 'Overdue':
-                due_date = datetime.now() - timedelta(days=random.randint(1, 15))
-            
-            action_items.append({
-                'id': f'ACTION-{4000 + i}',
-                'item': f'Action item {i+1}: Follow up on client requirements and provide detailed proposal',
-                'assignee': random.choice(['Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown', 'Lisa Davis']),
-                'client': f'Client {chr(65 + i % 26)}{i % 30}',
-                'priority': random.choice(priorities),
-                'status': status,
-                'due_date': due_date,
-                'created_date': datetime.now() - timedelta(days=random.randint(1, 30)),
-                'call_id': f'CALL-{3000 + random.randint(0, 149)}',
-                'estimated_hours': random.randint(1, 8),
-                'completion_percentage': random.randint(0, 100) if status in ['In Progress', 'Completed'] else 0
-            })
-        
-        return pd.DataFrame(action_items)
+    with col1:
+        st.button("⬅️ Previous", key="calls_previous", disabled=call_pager.number == 1, on_click=call_pager.previous)
     
-    action_items_df = generate_action_items()
+    with col2:
+        st.caption(f"Page {call_pager.number} of {max(1, -(-total_calls // paging.PAGE_SIZE))}")
+    
+    with col3:
+        st.button("Next ➡️", key="calls_next", disabled=next_cursor is None, on_click=call_pager.next, args=(next_cursor,))
+
+if tab3:
+    st.subheader("🎯 Action Items Management")
+    
+    action_items_df = data.action_items()
     
     # Action items overview
     col1, col2, col3, col4 = st.columns(4)
@@ -516,28 +504,29 @@ with tab3:
     with col1:
         status_filter = st.multiselect(
             "Status",
-            options=action_items_df['status'].unique(),
-            default=['Open', 'In Progress', 'Overdue']
+            options=action_items_df['status'].unique().tolist(),
+            **tabs.keep('call_actions_status', ['Open', 'In Progress', 'Overdue'])
         )
     
     with col2:
         priority_filter = st.multiselect(
             "Priority",
-            options=action_items_df['priority'].unique(),
-            default=action_items_df['priority'].unique()
+            options=action_items_df['priority'].unique().tolist(),
+            **tabs.keep('call_actions_priority', action_items_df['priority'].unique().tolist())
         )
     
     with col3:
         assignee_filter = st.multiselect(
             "Assignee",
-            options=action_items_df['assignee'].unique(),
-            default=action_items_df['assignee'].unique()
+            options=action_items_df['assignee'].unique().tolist(),
+            **tabs.keep('call_actions_assignee', action_items_df['assignee'].unique().tolist())
         )
     
     with col4:
         due_filter = st.selectbox(
             "Due Date",
-            options=["All", "Today", "This Week", "Next Week", "Overdue"]
+            options=["All", "Today", "This Week", "Next Week", "Overdue"],
+            **tabs.keep('call_actions_due', "All")
         )
     
     # Apply filters
@@ -571,7 +560,7 @@ with tab3:
     st.markdown(f"**Showing {len(filtered_actions)} action items**")
     
     # Prepare display dataframe
-    display_actions = filtered_actions.copy()
+    display_actions = filtered_actions.copy(deep=False)
     display_actions['Days Until Due'] = (display_actions['due_date'] - datetime.now()).dt.days
     
     # Status indicators
@@ -624,14 +613,14 @@ with tab3:
         }
     )
     
-    # Action items analytics
-    col1, col2 = st.columns(2)
-    
-    with col1:
+    # Action item charts, rebuilt only when the filters, the day or the data change
+    @sections.section('action_items')
+    def action_chart_section(status, priority, assignee, due, today):
         # Action items by status
         status_counts = filtered_actions['status'].value_counts()
         
-        fig_status = px.pie(
+        fig_status = figures.plot(
+            px.pie,
             values=status_counts.values,
             names=status_counts.index,
             title="Action Items by Status",
@@ -642,19 +631,35 @@ with tab3:
                 'Overdue': '#dc3545'
             }
         )
-        st.plotly_chart(fig_status, use_container_width=True)
-    
-    with col2:
+        
         # Action items by assignee
         assignee_counts = filtered_actions['assignee'].value_counts()
         
-        fig_assignee = px.bar(
+        fig_assignee = figures.plot(
+            px.bar,
             x=assignee_counts.values,
             y=assignee_counts.index,
             orientation='h',
             title="Action Items by Assignee"
         )
-        st.plotly_chart(fig_assignee, use_container_width=True)
+        return {'status': fig_status, 'assignee': fig_assignee}
+    
+    action_figures = action_chart_section(
+        status=status_filter,
+        priority=priority_filter,
+        assignee=assignee_filter,
+        due=due_filter,
+        today=datetime.now().date()
+    )
+    
+    # Action items analytics
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(action_figures['status'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(action_figures['assignee'], use_container_width=True)
     
     # SLA adherence tracking
     st.markdown("**📊 SLA Adherence & Performance**")
@@ -683,79 +688,86 @@ with tab3:
         for i, (metric, value) in enumerate(list(sla_metrics.items())[4:]):
             st.metric(label=metric, value=value)
 
-with tab4:
+if tab4:
     st.subheader("📊 Call & Meeting Analytics")
     
-    # Analytics overview
-    col1, col2 = st.columns(2)
-    
-    with col1:
+    # Call analytics figures, rebuilt only when the calls change
+    @sections.section('calls')
+    def call_analytics_section():
         # Calls by type
-        type_counts = calls_df['meeting_type'].value_counts()
+        call_types = aggregates.call_types()
+        type_counts = call_types.set_index('meeting_type')['count'].sort_values(ascending=False)
         
-        fig_types = px.pie(
+        fig_types = figures.plot(
+            px.pie,
             values=type_counts.values,
             names=type_counts.index,
             title="Calls by Type"
         )
-        st.plotly_chart(fig_types, use_container_width=True)
-    
-    with col2:
+        
         # Platform usage
-        platform_counts = calls_df['platform'].value_counts()
+        platform_counts = aggregates.call_platforms()
         
-        fig_platforms = px.bar(
+        fig_platforms = figures.plot(
+            px.bar,
             x=platform_counts.index,
             y=platform_counts.values,
             title="Platform Usage"
         )
-        st.plotly_chart(fig_platforms, use_container_width=True)
-    
-    # Time-based analytics
-    col1, col2 = st.columns(2)
-    
-    with col1:
+        
         # Daily call volume
-        daily_calls = calls_df.groupby(calls_df['date'].dt.date).size().reset_index(name='call_count')
+        daily_calls = aggregates.daily_calls()
         daily_calls = daily_calls.tail(30)  # Last 30 days
         
-        fig_daily = px.line(
+        fig_daily = figures.plot(
+            px.line,
             daily_calls,
             x='date',
             y='call_count',
             title="Daily Call Volume (Last 30 Days)"
         )
-        st.plotly_chart(fig_daily, use_container_width=True)
-    
-    with col2:
-        # Average duration by type
-        avg_duration = calls_df.groupby('meeting_type')['duration_minutes'].mean().reset_index()
         
-        fig_duration = px.bar(
-            avg_duration,
+        # Average duration by type
+        fig_duration = figures.plot(
+            px.bar,
+            call_types,
             x='meeting_type',
             y='duration_minutes',
             title="Average Duration by Meeting Type"
         )
-        st.plotly_chart(fig_duration, use_container_width=True)
+        return {'types': fig_types, 'platforms': fig_platforms, 'daily': fig_daily, 'duration': fig_duration}
+    
+    call_figures = call_analytics_section()
+    
+    # Analytics overview
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(call_figures['types'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(call_figures['platforms'], use_container_width=True)
+    
+    # Time-based analytics
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(call_figures['daily'], use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(call_figures['duration'], use_container_width=True)
     
     # Performance metrics
     st.markdown("**Performance Metrics**")
     
-    performance_data = calls_df.groupby('rm_name').agg({
-        'call_id': 'count',
-        'duration_minutes': 'sum',
-        'action_items_count': 'sum',
-        'satisfaction_rating': 'mean',
-        'deal_value_discussed': 'sum'
-    }).round(2)
+    performance_data = aggregates.call_performance()
     
     performance_data.columns = ['Total Calls', 'Total Duration (min)', 'Action Items', 'Avg Satisfaction', 'Total Deal Value']
     performance_data['Total Deal Value'] = performance_data['Total Deal Value'] / 1000000  # Convert to millions
     
     st.dataframe(performance_data, use_container_width=True)
 
-with tab5:
+if tab5:
     st.subheader("⚙️ Integration Settings")
     
     col1, col2 = st.columns(2)
@@ -764,47 +776,47 @@ with tab5:
         st.markdown("**Platform Integrations**")
         
         # MS Teams integration
-        teams_connected = st.checkbox("🔗 Microsoft Teams", value=True)
+        teams_connected = st.checkbox("🔗 Microsoft Teams", **tabs.keep('call_teams', True))
         if teams_connected:
             st.success("✅ Connected to MS Teams")
-            teams_auto_import = st.checkbox("Auto-import meeting details", value=True)
-            teams_transcript = st.checkbox("Auto-generate transcripts", value=True)
-            teams_recording = st.checkbox("Auto-save recordings", value=False)
+            teams_auto_import = st.checkbox("Auto-import meeting details", **tabs.keep('teams_import', True))
+            teams_transcript = st.checkbox("Auto-generate transcripts", **tabs.keep('teams_transcript', True))
+            teams_recording = st.checkbox("Auto-save recordings", **tabs.keep('teams_recording', False))
         
         # Zoom integration
-        zoom_connected = st.checkbox("🔗 Zoom", value=True)
+        zoom_connected = st.checkbox("🔗 Zoom", **tabs.keep('call_zoom', True))
         if zoom_connected:
             st.success("✅ Connected to Zoom")
-            zoom_auto_import = st.checkbox("Auto-import meeting details", value=True, key="zoom_import")
-            zoom_transcript = st.checkbox("Auto-generate transcripts", value=True, key="zoom_transcript")
-            zoom_recording = st.checkbox("Auto-save recordings", value=False, key="zoom_recording")
+            zoom_auto_import = st.checkbox("Auto-import meeting details", **tabs.keep('zoom_import', True))
+            zoom_transcript = st.checkbox("Auto-generate transcripts", **tabs.keep('zoom_transcript', True))
+            zoom_recording = st.checkbox("Auto-save recordings", **tabs.keep('zoom_recording', False))
         
         # Other platforms
-        google_meet = st.checkbox("🔗 Google Meet", value=False)
-        webex = st.checkbox("🔗 Cisco Webex", value=False)
+        google_meet = st.checkbox("🔗 Google Meet", **tabs.keep('call_google_meet', False))
+        webex = st.checkbox("🔗 Cisco Webex", **tabs.keep('call_webex', False))
     
     with col2:
         st.markdown("**AI & Automation Settings**")
         
         # AI settings
-        ai_summary = st.checkbox("🤖 Auto-generate AI summaries", value=True)
-        ai_action_items = st.checkbox("🎯 Auto-extract action items", value=True)
-        ai_sentiment = st.checkbox("😊 Sentiment analysis", value=True)
-        ai_follow_up = st.checkbox("📅 Suggest follow-up actions", value=True)
+        ai_summary = st.checkbox("🤖 Auto-generate AI summaries", **tabs.keep('call_ai_summary', True))
+        ai_action_items = st.checkbox("🎯 Auto-extract action items", **tabs.keep('call_ai_action_items', True))
+        ai_sentiment = st.checkbox("😊 Sentiment analysis", **tabs.keep('call_ai_sentiment', True))
+        ai_follow_up = st.checkbox("📅 Suggest follow-up actions", **tabs.keep('call_ai_follow_up', True))
         
         # Notification settings
         st.markdown("**Notification Settings**")
         
-        email_notifications = st.checkbox("📧 Email notifications", value=True)
-        slack_notifications = st.checkbox("💬 Slack notifications", value=False)
-        mobile_notifications = st.checkbox("📱 Mobile push notifications", value=True)
+        email_notifications = st.checkbox("📧 Email notifications", **tabs.keep('call_email_notifications', True))
+        slack_notifications = st.checkbox("💬 Slack notifications", **tabs.keep('call_slack_notifications', False))
+        mobile_notifications = st.checkbox("📱 Mobile push notifications", **tabs.keep('call_mobile_notifications', True))
         
         # SLA settings
         st.markdown("**SLA Configuration**")
         
-        high_priority_sla = st.number_input("High Priority SLA (hours)", min_value=1, max_value=72, value=24)
-        medium_priority_sla = st.number_input("Medium Priority SLA (hours)", min_value=1, max_value=168, value=72)
-        low_priority_sla = st.number_input("Low Priority SLA (days)", min_value=1, max_value=30, value=7)
+        high_priority_sla = st.number_input("High Priority SLA (hours)", min_value=1, max_value=72, **tabs.keep('call_high_sla', 24))
+        medium_priority_sla = st.number_input("Medium Priority SLA (hours)", min_value=1, max_value=168, **tabs.keep('call_medium_sla', 72))
+        low_priority_sla = st.number_input("Low Priority SLA (days)", min_value=1, max_value=30, **tabs.keep('call_low_sla', 7))
     
     # Save settings
     if st.button("💾 Save Settings"):
@@ -0,0 +1,7 @@
+"""Shared data and performance services for the PULSE Streamlit pages"""
+
+import pandas as pd
+
+# Shared frames are handed to every session as lazy copies: a page that writes
+# to its view gets its own copy of the touched column, the cached frame never changes
+pd.set_option('mode.copy_on_write', True)
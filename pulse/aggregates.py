@@ -0,0 +1,141 @@
+"""Aggregates shared by several pages, precomputed by ``pulse.warmup``.
+
+Each function is a registered artefact: cached in ``pulse.cache`` against
+the datasets it reads and computed once even when several sessions ask for
+it at the same time. The deal, call, news and conversation figures come from
+incremental rollups, so after a delta they are re-read from a few dozen
+grouped rows instead of regrouping the whole dataset.
+"""
+
+from pulse import data, incremental
+from pulse.warmup import artefact
+
+# Stage totals and RM sums both come from deals grouped by RM and stage
+DEAL_ROLLUP = incremental.rollup(
+    'deals', by=['rm_name', 'stage_label', 'stage_value'], sums=['value', 'weighted_value', 'probability']
+)
+CALL_RM_ROLLUP = incremental.rollup(
+    'calls', by=['rm_name'], sums=['duration_minutes', 'action_items_count', 'deal_value_discussed'],
+    means=['satisfaction_rating']
+)
+CALL_DAY_ROLLUP = incremental.rollup('calls', by=['day'])
+CALL_STATUS_ROLLUP = incremental.rollup(
+    'calls', by=['status'], sums=['duration_minutes', 'action_items_count'], means=['satisfaction_rating']
+)
+CALL_TYPE_ROLLUP = incremental.rollup('calls', by=['meeting_type'], means=['duration_minutes'])
+CALL_PLATFORM_ROLLUP = incremental.rollup('calls', by=['platform'])
+NEWS_ROLLUP = incremental.rollup(
+    'news', by=['sentiment', 'impact_level'], sums=['sentiment_score', 'client_mentions']
+)
+NEWS_DAY_ROLLUP = incremental.rollup('news', by=['date'], means=['sentiment_score'])
+CONVERSATION_ROLLUP = incremental.rollup('conversations', by=['sentiment'])
+
+
+def _deal_totals(by, active_only=False):
+    deals = DEAL_ROLLUP.result()
+    if active_only:
+        deals = deals[deals['stage_value'] > 0]
+    totals = deals.groupby(by, as_index=False)[['count', 'value', 'weighted_value', 'probability']].sum()
+    totals['probability'] = totals['probability'] / totals['count']
+    return totals
+
+
+@artefact('pipeline_funnel', 'deals')
+def pipeline_funnel():
+    """Open deals per stage, deepest stage first"""
+    funnel = _deal_totals(['stage_label', 'stage_value'], active_only=True)
+    funnel = funnel.sort_values('stage_value', ascending=False, ignore_index=True)
+    return funnel.rename(columns={'stage_label': 'stage', 'count': 'deal_id'})[
+        ['stage', 'stage_value', 'deal_id', 'value', 'weighted_value']
+    ]
+
+
+@artefact('rm_pipeline', 'deals')
+def rm_pipeline():
+    """Deal count, value, weighted value and average probability per RM"""
+    return _deal_totals(['rm_name'])
+
+
+@artefact('active_rm_pipeline', 'deals')
+def active_rm_pipeline():
+    """Same as rm_pipeline, open deals only"""
+    return _deal_totals(['rm_name'], active_only=True)
+
+
+@artefact('stage_by_rm', 'deals')
+def stage_by_rm():
+    stages = _deal_totals(['stage_label', 'rm_name'])
+    return stages.rename(columns={'stage_label': 'stage', 'count': 'deal_id'})[['stage', 'rm_name', 'deal_id', 'value']]
+
+
+@artefact('risk_metrics', 'risk')
+def risk_metrics():
+    """Headline portfolio risk figures and the risk level distribution"""
+    risk = data.risk()
+    return {
+        'total_exposure': float(risk['exposure_amount'].sum()),
+        'avg_risk_score': float(risk['risk_score'].mean()),
+        'high_risk_count': int((risk['risk_score'] > 7).sum()),
+        'covenant_breaches': int((risk['covenant_status'] == 'Breach').sum()),
+        'risk_level_counts': risk['risk_level'].value_counts()
+    }
+
+
+@artefact('news_sentiment', 'news')
+def news_sentiment():
+    """Headline news figures and the sentiment rollups"""
+    news = NEWS_ROLLUP.result()
+    total = int(news['count'].sum())
+    return {
+        'total_articles': total,
+        'avg_sentiment': float(news['sentiment_score'].sum() / total),
+        'high_impact_count': int(news.loc[news['impact_level'] == 'High', 'count'].sum()),
+        'client_mentions': int(news['client_mentions'].sum()),
+        'sentiment_counts': news.groupby('sentiment')['count'].sum().sort_values(ascending=False),
+        'daily_sentiment': NEWS_DAY_ROLLUP.result()[['date', 'sentiment_score']]
+    }
+
+
+@artefact('conversation_sentiment', 'conversations')
+def conversation_sentiment():
+    return CONVERSATION_ROLLUP.result().set_index('sentiment')['count'].sort_values(ascending=False)
+
+
+@artefact('call_performance', 'calls')
+def call_performance():
+    """Call totals per RM"""
+    calls = CALL_RM_ROLLUP.result().set_index('rm_name')
+    return calls[['count', 'duration_minutes', 'action_items_count', 'satisfaction_rating', 'deal_value_discussed']].round(2)
+
+
+@artefact('daily_calls', 'calls')
+def daily_calls():
+    calls = CALL_DAY_ROLLUP.result()
+    return calls.assign(date=calls['day'].dt.strftime('%Y-%m-%d'))[['date', 'count']].rename(columns={'count': 'call_count'})
+
+
+@artefact('call_summary', 'calls')
+def call_summary():
+    """Completed calls and minutes, action items and average satisfaction over all calls"""
+    calls = CALL_STATUS_ROLLUP.result().set_index('status')
+    completed = calls.reindex(['Completed']).fillna(0).iloc[0]
+    rated = calls['satisfaction_rating_n'].sum()
+    satisfaction = calls['satisfaction_rating'].mul(calls['satisfaction_rating_n']).sum()
+    return {
+        'completed_calls': int(completed['count']),
+        'completed_minutes': float(completed['duration_minutes']),
+        'action_items': int(calls['action_items_count'].sum()),
+        'avg_satisfaction': float(satisfaction / rated) if rated else float('nan')
+    }
+
+
+@artefact('call_types', 'calls')
+def call_types():
+    """Call count and average duration per meeting type"""
+    return CALL_TYPE_ROLLUP.result()[['meeting_type', 'count', 'duration_minutes']]
+
+
+@artefact('call_platforms', 'calls')
+def call_platforms():
+    """Calls per platform, busiest first"""
+    return CALL_PLATFORM_ROLLUP.result().set_index('platform')['count'].sort_values(ascending=False)
@@ -0,0 +1,134 @@
+"""Bitmap filter index for multiselect filter bars.
+
+Rows are stored in the order of one numeric column (e.g. exposure), and for
+every value of each categorical filter column the index keeps a bitmap of
+the rows holding it, packed 64 rows to a ``uint64`` word. A filter bar then
+becomes an OR of the selected values' bitmaps per column, an AND across
+columns, and a binary search on the sorted column that clears every bit
+below (or above) the threshold. Nothing touches the frame itself until the
+matching row positions are unpacked at the end.
+
+``facets`` counts, for every value of every indexed column, the rows that
+would match if that value were picked, given the other active filters. Each
+column's bitmaps are stacked into one 2-D array, so a column's counts are a
+single AND and popcount over the stack. Filter widgets label their options
+with these counts and charts reuse them instead of running value_counts.
+"""
+
+import numpy as np
+import pandas as pd
+
+_WORD = 64
+_ALL_BITS = (1 << _WORD) - 1
+# Bits set in each byte value, for counting without unpacking
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype=np.uint8)
+
+
+class BitmapIndex:
+    """Per-value bitmaps of categorical columns over rows sorted by a numeric column"""
+
+    def __init__(self, frame, columns, sort_by):
+        self.temporal = pd.api.types.is_datetime64_any_dtype(frame[sort_by])
+        if self.temporal:
+            values = frame[sort_by].to_numpy(dtype='datetime64[ns]').view('int64')
+        else:
+            values = frame[sort_by].to_numpy(dtype='float64')
+        self.size = len(frame)
+        self.sort_by = sort_by
+        self.order = np.argsort(values, kind='stable')
+        self.sorted = values[self.order]
+        self._all = self._pack(np.ones(self.size, dtype=bool))
+        # One (values x words) array per column; the per-value bitmaps are its rows
+        self._stacked = {}
+        self.bitmaps = {}
+        for column in columns:
+            series = frame[column]
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype('category')
+            codes = series.cat.codes.to_numpy()[self.order]
+            categories = series.cat.categories
+            stacked = np.empty((len(categories), len(self._all)), dtype='<u8')
+            for code in range(len(categories)):
+                stacked[code] = self._pack(codes == code)
+            self._stacked[column] = stacked
+            self.bitmaps[column] = {value: stacked[code] for code, value in enumerate(categories)}
+        self.nbytes = self.order.nbytes + self.sorted.nbytes + self._all.nbytes + sum(
+            stacked.nbytes for stacked in self._stacked.values()
+        )
+
+    def select(self, filters, low=None, high=None, within=None):
+        """Bitmap of rows whose columns hold one of the selected values and whose sort value is in [low, high]"""
+        result = self._range(low, high, within)
+        for column, values in filters.items():
+            np.bitwise_and(result, self._union(column, values), out=result)
+        return result
+
+    def facets(self, filters, low=None, high=None, within=None):
+        """Matching rows per value of every indexed column, given the filters on the other columns"""
+        base = self._range(low, high, within)
+        unions = {column: self._union(column, values) for column, values in filters.items()}
+        counts = {}
+        for column, stacked in self._stacked.items():
+            others = base.copy()
+            for other, union in unions.items():
+                if other != column:
+                    np.bitwise_and(others, union, out=others)
+            hits = _POPCOUNT[(stacked & others).view(np.uint8)].sum(axis=1, dtype=np.int64)
+            counts[column] = pd.Series(hits, index=list(self.bitmaps[column]), name=column)
+        return counts
+
+    def bitmap(self, positions):
+        """Bitmap of the given row positions of the original frame"""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[positions] = True
+        return self._pack(mask[self.order])
+
+    def positions(self, bitmap):
+        """Row positions in the original frame, in their original order"""
+        bits = np.unpackbits(bitmap.view(np.uint8), count=self.size, bitorder='little')
+        return np.sort(self.order[np.flatnonzero(bits)])
+
+    def count(self, bitmap):
+        """Number of rows set in a bitmap"""
+        return int(_POPCOUNT[bitmap.view(np.uint8)].sum(dtype=np.int64))
+
+    def _union(self, column, values):
+        bitmaps = self.bitmaps[column]
+        union = np.zeros_like(self._all)
+        for value in values:
+            if value in bitmaps:
+                np.bitwise_or(union, bitmaps[value], out=union)
+        return union
+
+    def _range(self, low, high, within):
+        result = self._all.copy() if within is None else within & self._all
+        if low is not None:
+            self._clear_below(result, int(np.searchsorted(self.sorted, self._key(low), side='left')))
+        if high is not None:
+            self._clear_from(result, int(np.searchsorted(self.sorted, self._key(high), side='right')))
+        return result
+
+    def _key(self, bound):
+        return pd.Timestamp(bound).value if self.temporal else bound
+
+    def _pack(self, mask):
+        padded = np.zeros(-(-self.size // _WORD) * _WORD, dtype=bool)
+        padded[:self.size] = mask
+        return np.packbits(padded, bitorder='little').view('<u8')
+
+    def _clear_below(self, bitmap, start):
+        word, bit = divmod(start, _WORD)
+        bitmap[:word] = 0
+        if bit and word < len(bitmap):
+            bitmap[word] &= np.uint64(_ALL_BITS ^ ((1 << bit) - 1))
+
+    def _clear_from(self, bitmap, end):
+        word, bit = divmod(end, _WORD)
+        if word < len(bitmap):
+            bitmap[word] &= np.uint64((1 << bit) - 1)
+            bitmap[word + 1:] = 0
+
+
+def label(counts):
+    """Format function showing an option with its facet count, as in Energy (1,204)"""
+    return lambda value: f"{value} ({int(counts.get(value, 0)):,})"
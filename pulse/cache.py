@@ -0,0 +1,268 @@
+"""Process-wide bounded cache for datasets and derived aggregates.
+
+Every loader registers through ``cached``, naming the canonical datasets its
+result is derived from. Entries expire after a TTL, the least recently used
+entries are evicted once the cache holds more than ``max_bytes``, and
+``invalidate('deals')`` drops every entry built from the deals dataset. The
+TTL and size limit are set from the Admin Config page, which saves them with
+the other system settings; ``restore`` applies the saved values at startup.
+
+Pinned entries (the canonical datasets themselves) sit outside the LRU:
+they never expire or get evicted and do not count against ``max_bytes``, so
+a budget smaller than a dataset cannot force it to reload, and with it
+every entry keyed on its version, on each read. They are reported
+separately and only leave the cache through ``invalidate``.
+
+Maintained entries (``put(..., maintained=True)``) are kept up to date by a
+delta listener in ``pulse.incremental`` and record the dataset version they
+match. A delta to their dataset leaves them in place; an explicit
+``invalidate`` still drops them.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_TTL_HOURS = 24
+DEFAULT_MAX_MB = 1024
+
+MISSING = object()
+
+
+class CacheManager:
+    """Thread-safe LRU cache with a TTL and a byte budget"""
+
+    def __init__(self, ttl_hours=DEFAULT_TTL_HOURS, max_mb=DEFAULT_MAX_MB):
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries = OrderedDict()
+        self._pinned = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        self.pinned_bytes = 0
+
+    def configure(self, ttl_hours=None, max_mb=None):
+        with self._lock:
+            if ttl_hours is not None:
+                self.ttl_seconds = ttl_hours * 3600
+            if max_mb is not None:
+                self.max_bytes = int(max_mb * 1024 * 1024)
+            self._evict()
+
+    def get(self, key):
+        """Return the cached value for key, or MISSING"""
+        with self._lock:
+            if key in self._pinned:
+                self.hits += 1
+                return self._pinned[key]['value']
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['value']
+
+    def peek(self, key):
+        """Like get, but without counting a hit or miss or refreshing recency"""
+        with self._lock:
+            if key in self._pinned:
+                return self._pinned[key]['value']
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry):
+                return MISSING
+            return entry['value']
+
+    def put(self, key, value, datasets=(), pinned=False, maintained=False):
+        """Store a value; unpinned values larger than the whole budget are not kept"""
+        size = sizeof(value)
+        with self._lock:
+            if key in self._entries or key in self._pinned:
+                self._remove(key)
+            if pinned:
+                self._pinned[key] = {'value': value, 'bytes': size, 'datasets': frozenset(datasets)}
+                self.pinned_bytes += size
+                return value
+            if size > self.max_bytes:
+                return value
+            self._entries[key] = {
+                'value': value,
+                'bytes': size,
+                'datasets': frozenset(datasets),
+                'maintained': maintained,
+                'created': time.monotonic()
+            }
+            self.bytes += size
+            self._evict()
+        return value
+
+    def invalidate(self, dataset=None, pinned=True, maintained=True):
+        """Drop every entry derived from a dataset, or everything; returns the count"""
+        with self._lock:
+            entries = list(self._entries.items()) + (list(self._pinned.items()) if pinned else [])
+            keys = [
+                key for key, entry in entries
+                if (dataset is None or dataset in entry['datasets']) and (maintained or not entry.get('maintained'))
+            ]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'pinned': len(self._pinned),
+                'pinned_bytes': self.pinned_bytes,
+                'ttl_hours': self.ttl_seconds / 3600,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+    def entries(self):
+        """One row per cached entry, pinned entries first and the most recently used last"""
+        now = time.monotonic()
+        with self._lock:
+            return pd.DataFrame([
+                {
+                    'key': _describe(key),
+                    'datasets': ', '.join(sorted(entry['datasets'])),
+                    'size_mb': entry['bytes'] / 1024 / 1024,
+                    'pinned': key in self._pinned,
+                    'expires_in_min': (
+                        np.nan if key in self._pinned else max(0.0, (entry['created'] + self.ttl_seconds - now) / 60)
+                    )
+                }
+                for key, entry in list(self._pinned.items()) + list(self._entries.items())
+            ], columns=['key', 'datasets', 'size_mb', 'pinned', 'expires_in_min'])
+
+    def _expired(self, entry):
+        # Checked against the current TTL, so a new Admin setting applies to existing entries
+        return entry['created'] + self.ttl_seconds <= time.monotonic()
+
+    def _remove(self, key):
+        if key in self._pinned:
+            self.pinned_bytes -= self._pinned.pop(key)['bytes']
+            return
+        entry = self._entries.pop(key)
+        self.bytes -= entry['bytes']
+
+    def _evict(self):
+        while self.bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+
+
+manager = CacheManager()
+
+
+def configure(ttl_hours=None, max_mb=None):
+    manager.configure(ttl_hours=ttl_hours, max_mb=max_mb)
+
+
+def restore():
+    """Apply the TTL and size limit saved from Admin Config"""
+    from pulse import db  # imported here: the settings table sits behind the pooled connection
+    saved = db.settings({'cache_duration': DEFAULT_TTL_HOURS, 'cache_size': DEFAULT_MAX_MB})
+    manager.configure(ttl_hours=saved['cache_duration'], max_mb=saved['cache_size'])
+
+
+def invalidate(dataset=None, pinned=True, maintained=True):
+    return manager.invalidate(dataset, pinned, maintained)
+
+
+def stats():
+    return manager.stats()
+
+
+def cached(*datasets):
+    """Cache a loader's result in the shared manager, tagged with the datasets it reads"""
+    def decorator(func):
+        # Pages all run as __main__, so identify loaders by file and name
+        name = f'{os.path.basename(func.__code__.co_filename)}:{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (name, _freeze(args), _freeze(kwargs))
+            value = manager.get(key)
+            if value is MISSING:
+                value = manager.put(key, func(*args, **kwargs), datasets)
+            return _view(value)
+
+        def peek(*args, **kwargs):
+            """The cached result for these arguments, or MISSING, without computing it"""
+            value = manager.get((name, _freeze(args), _freeze(kwargs)))
+            return value if value is MISSING else _view(value)
+
+        wrapper.peek = peek
+        return wrapper
+    return decorator
+
+
+def sizeof(value):
+    """Approximate memory held by a cached value, in bytes"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if isinstance(usage, pd.Series) else usage)
+    if isinstance(value, np.ndarray) or hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _view(value):
+    """Hand out shallow copies so callers can add columns without touching the entry"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, tuple):
+        return tuple(_view(v) for v in value)
+    return value
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, set):
+        return tuple(sorted(value))
+    return value
+
+
+def _describe(key):
+    if key[0] == 'data':
+        return f'dataset:{key[1]}'
+    if key[0] == 'sql':
+        return 'sql:' + ' '.join(key[2].split())[:80]
+    if key[0] == 'time':
+        return f'time:{key[1]}.{key[2]}'
+    if key[0] == 'view':
+        return f'view:{key[1]}[{key[3]}]'
+    if key[0] == 'figure':
+        return f'figure:{key[1]}[{key[2]}]'
+    name, args, kwargs = key
+    return name if not args and not kwargs else f'{name}{args}'
@@ -0,0 +1,307 @@
+"""Canonical data repository shared by every PULSE page.
+
+Each dataset (clients, risk, deals, news, calls, action items, notifications,
+conversations and daily performance) is generated once per process by
+``pulse.synth`` and kept in memory. Pages receive shallow views of the shared
+frame, so visiting more pages does not create more copies of the same entities.
+
+Derived columns that pages used to add on every rerun (risk level bands, the
+news publication day) are computed once here, when the dataset is loaded, and
+every column is cast to the compact dtype registered in ``pulse.schema``.
+
+Set ``PULSE_SCALE`` (default 1) and ``PULSE_SEED`` (default 42) to change the
+size of the book and the random seed. Generated datasets are persisted as
+memory-mapped snapshots (see ``pulse.snapshots``) so later processes reopen
+them instead of regenerating.
+
+``append`` and ``update`` apply deltas (new deals, stage changes, new calls,
+new news items) to the shared frame and hand just the changed rows to the
+rollups in ``pulse.incremental``. Deltas are kept in memory and replayed if the
+dataset is reloaded, until ``configure`` starts a fresh book. Built frames
+live in the shared ``pulse.cache`` manager; the Admin page's TTL and size
+limit apply to what is derived from them. The datasets themselves are pinned:
+they are never expired or evicted, and a reload (after ``configure`` or an
+explicit invalidation) is the only thing that bumps a dataset's version.
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+from pulse import cache, schema, snapshots, synth
+from pulse.synth import (  # noqa: F401 - re-exported for the pages
+    COMPANY_NAMES, INDUSTRIES, KEY_PHRASES, NEWS_HEADLINES, NEWS_SUMMARIES, NEWS_TAGS,
+    RELATIONSHIP_MANAGERS, STAGE_LABELS, STAGE_PROBABILITY, STAGE_VALUES, STAGES
+)
+
+SCALE = float(os.environ.get('PULSE_SCALE', '1'))
+SEED = int(os.environ.get('PULSE_SEED', '42'))
+
+_lock = threading.RLock()
+# One lock per dataset, so a page waits only for the datasets it reads
+_locks = {name: threading.RLock() for name in synth.DATASETS}
+_derivations = {}
+_versions = {}
+_deltas = {}
+
+
+def configure(scale=None, seed=None):
+    """Change the generator scale or seed and drop every built dataset"""
+    global SCALE, SEED
+    with _lock:
+        if scale is not None:
+            SCALE = float(scale)
+        if seed is not None:
+            SEED = int(seed)
+        _deltas.clear()
+        for name in synth.DATASETS:
+            cache.invalidate(name)
+
+
+def derived(name):
+    """Register a function adding derived columns to a dataset after it is loaded"""
+    def decorator(func):
+        _derivations.setdefault(name, []).append(func)
+        return func
+    return decorator
+
+
+def datasets():
+    """Names of all canonical datasets"""
+    return list(synth.DATASETS)
+
+
+def get(name):
+    """Return a read-only view of a canonical dataset, building it on first use"""
+    key = ('data', name)
+    frame = cache.manager.get(key)
+    if frame is cache.MISSING:
+        with _locks[name]:
+            frame = cache.manager.peek(key)
+            if frame is cache.MISSING:
+                frame = cache.manager.put(key, _load(name), datasets=(name,), pinned=True)
+    return frame.copy(deep=False)
+
+
+def version(name):
+    """Counter bumped every time a dataset is (re)loaded; part of derived cache keys"""
+    if cache.manager.peek(('data', name)) is cache.MISSING:
+        get(name)
+    return _versions[name]
+
+
+def snapshot(name):
+    """The current version of a dataset and its frame, read together"""
+    # Listeners call this before taking their own lock, since _delta calls them holding the dataset's
+    with _locks[name]:
+        frame = get(name)
+        return _versions[name], frame
+
+
+def append(name, rows):
+    """Add new rows to a dataset; rows without a key are numbered on from the highest key"""
+    return _delta(name, added=rows)
+
+
+def update(name, changes):
+    """Change existing rows, matched on the dataset's key column (see schema.KEYS)"""
+    return _delta(name, updated=changes)
+
+
+def deltas(name):
+    """Number of deltas applied to a dataset since the book was generated"""
+    return len(_deltas.get(name, []))
+
+
+def _delta(name, added=None, updated=None):
+    from pulse import incremental
+
+    with _locks[name]:
+        frame = get(name)
+        old_version = _versions[name]
+        if added is not None and len(added) and name in schema.KEYS:
+            # Keys are given out under the dataset lock, so concurrent appends never share one
+            added = _keyed(name, frame, added)
+        frame, new_rows, old_rows = _apply_delta(name, frame, added, updated)
+        _deltas.setdefault(name, []).append((added, updated))
+        # Publish the new frame, then drop what was derived from the old one and
+        # is not kept up to date by a listener
+        cache.manager.put(('data', name), frame, datasets=(name,), pinned=True)
+        _versions[name] = old_version + 1
+        cache.invalidate(name, pinned=False, maintained=False)
+        incremental.apply(name, new_rows, old_rows, old_version, _versions[name])
+    return frame.copy(deep=False)
+
+
+def _apply_delta(name, frame, added=None, updated=None):
+    """Return the new frame plus the rows added or rewritten and the rows they replaced"""
+    new_rows = []
+    old_rows = None
+    if updated is not None and len(updated):
+        key = schema.KEYS[name]
+        positions = pd.Index(frame[key]).get_indexer(updated[key])
+        if (positions < 0).any():
+            missing = list(updated[key][positions < 0])
+            raise KeyError(f"{name}: no rows with {key} {missing}")
+        old_rows = frame.iloc[positions]
+        rows = old_rows.copy()
+        for column in updated.columns:
+            rows[column] = updated[column].to_numpy()
+        rows = _prepare(name, rows)
+        frame, rows = _align_categories(frame, rows)
+        before = old_rows.reset_index(drop=True)
+        changed = [c for c in rows.columns if not rows[c].astype(object).equals(before[c].astype(object))]
+        for column in changed:
+            values = frame[column].copy()
+            values.iloc[positions] = rows[column].to_numpy()
+            frame[column] = values
+        new_rows.append(rows)
+    if added is not None and len(added):
+        rows = _prepare(name, added)
+        missing = [c for c in frame.columns if c not in rows.columns]
+        if missing:
+            raise ValueError(f"{name}: new rows are missing columns {missing}")
+        frame, rows = _align_categories(frame, rows)
+        frame = pd.concat([frame, rows[frame.columns]], ignore_index=True)
+        new_rows.append(rows)
+    new_rows = pd.concat(new_rows, ignore_index=True) if new_rows else None
+    return frame, new_rows, old_rows
+
+
+def _keyed(name, frame, rows):
+    """Rows with every missing key filled in, after checking the given keys are new"""
+    key = schema.KEYS[name]
+    rows = rows.reset_index(drop=True)
+    if key not in rows.columns:
+        rows[key] = None
+    given = rows[key].dropna()
+    taken = given[given.isin(frame[key]) | given.duplicated()]
+    if len(taken):
+        raise KeyError(f"{name}: {key} already used {list(taken)}")
+    missing = rows[key].isna()
+    if missing.any():
+        # Keys look like PREFIX-<number>; continue from the highest number in use
+        parts = frame[key].astype(str).str.extract(r'^(\D*)(\d+)$').dropna()
+        prefix = parts[0].iloc[0] if len(parts) else ''
+        start = int(parts[1].astype('int64').max()) + 1 if len(parts) else 0
+        rows[key] = rows[key].astype(object)
+        rows.loc[missing, key] = [f'{prefix}{n}' for n in range(start, start + int(missing.sum()))]
+    return rows
+
+
+def _prepare(name, rows):
+    """Derive and cast delta rows exactly as a freshly loaded frame"""
+    rows = rows.reset_index(drop=True)
+    for derive in _derivations.get(name, []):
+        for column, values in derive(rows).items():
+            rows[column] = values
+    return schema.apply(name, rows)
+
+
+def _align_categories(frame, rows):
+    """Give matching categorical columns in frame and rows the same categories"""
+    for column in rows.columns:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            categories = frame[column].cat.categories
+            extra = pd.Index(rows[column].dropna().astype(str).unique()).difference(categories)
+            if len(extra):
+                frame[column] = frame[column].cat.add_categories(extra)
+            rows[column] = pd.Categorical(rows[column].astype(object), categories=frame[column].cat.categories)
+    return frame, rows
+
+
+def _load(name):
+    """Reopen today's snapshot of a dataset, generating and saving it if missing"""
+    day = synth.default_now()
+    frame = snapshots.load(name, SCALE, SEED, day)
+    if frame is None:
+        frame = schema.apply(name, synth.generate(name, scale=SCALE, seed=SEED, now=day))
+        try:
+            snapshots.save(name, frame, SCALE, SEED, day)
+        except OSError:
+            # A read-only deployment still works, it just regenerates per process
+            pass
+    for derive in _derivations.get(name, []):
+        for column, values in derive(frame).items():
+            frame[column] = values
+    schema.apply(name, frame)
+    for added, updated in _deltas.get(name, []):
+        frame = _apply_delta(name, frame, added, updated)[0]
+    if name in _versions:
+        # Reloaded after expiry or invalidation: aggregates of the old frame are stale
+        cache.invalidate(name)
+    _versions[name] = _versions.get(name, 0) + 1
+    return frame
+
+
+@derived('risk')
+def _risk_level(risk):
+    return {
+        'risk_level': pd.cut(risk['risk_score'], bins=[0, 3, 5, 7, 10], labels=['Low', 'Medium', 'High', 'Critical'])
+    }
+
+
+@derived('deals')
+def _deal_stage(deals):
+    # Recomputed from stage, so a stage change in an update keeps the funnel columns in step
+    stage = deals['stage'].astype(object)
+    low = stage.map({s: p[0] for s, p in STAGE_PROBABILITY.items()})
+    high = stage.map({s: p[1] for s, p in STAGE_PROBABILITY.items()})
+    probability = deals['probability'].astype('float64').clip(lower=low, upper=high).round()
+    return {
+        'stage_label': stage.map(STAGE_LABELS),
+        'stage_value': stage.map(STAGE_VALUES),
+        'probability': probability,
+        'weighted_value': deals['value'] * probability / 100
+    }
+
+
+@derived('news')
+def _news_day(news):
+    impact_order = {'High': 3, 'Medium': 2, 'Low': 1}
+    return {
+        'date': news['published_date'].dt.normalize(),
+        'impact_numeric': news['impact_level'].map(impact_order).astype('int64')
+    }
+
+
+@derived('calls')
+def _call_day(calls):
+    return {'day': calls['date'].dt.normalize()}
+
+
+def clients():
+    return get('clients')
+
+
+def risk():
+    return get('risk')
+
+
+def deals():
+    return get('deals')
+
+
+def news():
+    return get('news')
+
+
+def calls():
+    return get('calls')
+
+
+def action_items():
+    return get('action_items')
+
+
+def notifications():
+    return get('notifications')
+
+
+def performance():
+    return get('performance')
+
+
+def conversations():
+    return get('conversations')
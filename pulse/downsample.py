@@ -0,0 +1,99 @@
+"""Down-sampling for long time series before they are charted.
+
+A line chart cannot show more points than it has horizontal pixels, yet
+Plotly ships every row of its frame to the browser, so multi-year daily
+series and minute-level service metrics cost megabytes per chart.
+``frame(data, x, y, width)`` keeps about ``width`` rows per series and drops
+the rest, before the figure is built.
+
+Two selections are offered. ``lttb`` (Largest-Triangle-Three-Buckets)
+splits the series into equal-count buckets and keeps, from each, the point
+forming the largest triangle with the previous kept point and the next
+bucket's mean, which preserves the visual shape of smooth series. ``minmax``
+keeps each bucket's lowest and highest point, so no spike or dip is lost,
+at two points per bucket.
+
+Both always keep the first and last point. Series no longer than the target
+are returned whole, so small frames pass through unchanged.
+"""
+
+import numpy as np
+import pandas as pd
+
+FULL_WIDTH = 1200
+HALF_WIDTH = 600
+
+
+def lttb(x, y, points):
+    """Positions of the points Largest-Triangle-Three-Buckets keeps out of x, y"""
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+    x, y = _numeric(x), _filled(y)
+    # points - 2 buckets between the first and last point
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    kept = np.empty(points, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        following = slice(hi, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        mean_x, mean_y = x[following].mean(), y[following].mean()
+        area = np.abs(
+            (x[previous] - mean_x) * (y[lo:hi] - y[previous]) - (x[previous] - x[lo:hi]) * (mean_y - y[previous])
+        )
+        previous = lo + int(np.argmax(area))
+        kept[i + 1] = previous
+    return kept
+
+
+def minmax(x, y, points):
+    """Positions of each bucket's lowest and highest point, about points in all"""
+    n = len(x)
+    if points >= n or points < 4:
+        return np.arange(n)
+    y = _filled(y)
+    edges = np.linspace(0, n, points // 2 + 1).astype(np.int64)
+    kept = [0, n - 1]
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        kept.append(lo + int(np.argmin(y[lo:hi])))
+        kept.append(lo + int(np.argmax(y[lo:hi])))
+    return np.unique(kept)
+
+
+def frame(data, x, y, width=FULL_WIDTH, by=None, method='lttb'):
+    """Rows of data keeping the shape of each y column against x, at about width rows per series"""
+    columns = [y] if isinstance(y, str) else list(y)
+    select = lttb if method == 'lttb' else minmax
+    series = [np.arange(len(data))] if by is None else list(data.groupby(by, sort=False, observed=True).indices.values())
+    if all(len(positions) <= width for positions in series):
+        return data
+
+    x_values = data[x].to_numpy()
+    kept = []
+    for positions in series:
+        if len(positions) <= width:
+            kept.append(positions)
+            continue
+        positions = positions[np.argsort(x_values[positions], kind='stable')]
+        for column in columns:
+            kept.append(positions[select(x_values[positions], data[column].to_numpy()[positions], width)])
+    return data.iloc[np.unique(np.concatenate(kept))]
+
+
+def _numeric(values):
+    # Timestamps as nanoseconds from the first point, so areas keep their precision
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        values = values.astype('datetime64[ns]').astype(np.int64)
+    values = values.astype(float)
+    return values - values[0]
+
+
+def _filled(values):
+    # Gaps stand at the series mean, so they are never picked as extremes
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    if missing.any():
+        values = np.where(missing, values[~missing].mean() if not missing.all() else 0.0, values)
+    return values
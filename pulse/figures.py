@@ -0,0 +1,166 @@
+"""Plotly figures built once per input data and chart spec.
+
+Building a Plotly Express figure validates every property of every trace,
+which costs tens of milliseconds even for a small aggregate, and pages used
+to pay it for every chart on every rerun. ``plot(builder, frame, **params)``
+calls ``builder`` (``px.line``, ``px.pie``, ``go.Figure``, ...) only the
+first time a given input and spec is seen. The figure is stored as JSON
+in the shared ``pulse.cache`` manager, and later reruns and other sessions
+get a fresh ``Figure`` loaded from that JSON, which is safe to update.
+
+The input is fingerprinted by ``source=(datasets, filters)`` when the
+caller knows where the frame came from: the datasets' versions and a hash
+of the filter state, so a large frame is never hashed. Otherwise the frame
+and any array parameters are hashed by content. ``stats`` reports, per
+chart, how often it was built or reused and the build time saved.
+
+``scatter`` is ``px.scatter`` for frames of any size: past ``WEBGL_POINTS``
+rows the markers are drawn with WebGL instead of SVG, and past
+``BINNED_POINTS`` the rows are counted on a grid on the server and drawn as
+a ``histogram2d`` heatmap, so the browser gets ``BINS`` x ``BINS`` cells
+rather than one marker per row.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from pulse import cache, data, views
+
+WEBGL_POINTS = 1000
+BINNED_POINTS = 50000
+BINS = 60
+
+_lock = threading.Lock()
+_stats = {}
+
+
+def plot(builder, data_frame=None, source=None, layout=None, **params):
+    """builder(data_frame, **params) with layout applied, served from the shared cache on repeats"""
+    name = f"{getattr(builder, '__name__', 'figure')}: {params.get('title') or (layout or {}).get('title_text', '')}"
+    datasets = tuple(source[0]) if source else ()
+    digest = hashlib.sha1(_identity(builder).encode('utf-8'))
+    if source:
+        versions = [data.version(dataset) for dataset in datasets]
+        digest.update(f'{versions}{views.fingerprint(source[1])}'.encode('utf-8'))
+    elif data_frame is not None:
+        digest.update(_content(data_frame))
+    digest.update(json.dumps([params, layout], sort_keys=True, default=_encode).encode('utf-8'))
+    key = ('figure', name, digest.hexdigest()[:16])
+
+    found = cache.manager.get(key)
+    if found is not cache.MISSING:
+        started = time.perf_counter()
+        figure = pio.from_json(found['json'])
+        _record(name, saved=found['seconds'] - (time.perf_counter() - started))
+        return figure
+    started = time.perf_counter()
+    if isinstance(data_frame, pd.DataFrame):
+        data_frame = _observed(data_frame, params)
+    figure = builder(**params) if data_frame is None else builder(data_frame, **params)
+    if layout:
+        figure.update_layout(**layout)
+    seconds = time.perf_counter() - started
+    cache.manager.put(key, {'json': figure.to_json(), 'seconds': seconds}, datasets)
+    _record(name, built=seconds)
+    return figure
+
+
+def scatter(data_frame, x, y, source=None, layout=None, **params):
+    """plot(px.scatter, ...), switching to WebGL and then to a 2D histogram as the rows grow"""
+    if len(data_frame) > BINNED_POINTS:
+        return plot(
+            histogram2d, data_frame, source=source, layout=layout,
+            x=x, y=y, title=params.get('title'), labels=params.get('labels')
+        )
+    if len(data_frame) > WEBGL_POINTS:
+        params['render_mode'] = 'webgl'
+    return plot(px.scatter, data_frame, source=source, layout=layout, x=x, y=y, **params)
+
+
+def histogram2d(data_frame, x, y, title=None, labels=None, bins=BINS):
+    """Heatmap of the number of rows in each cell of a bins x bins grid over x and y"""
+    labels = labels or {}
+    points = data_frame[[x, y]].dropna()
+    counts, x_edges, y_edges = np.histogram2d(points[x].to_numpy(float), points[y].to_numpy(float), bins=bins)
+    figure = go.Figure(go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        # Empty cells stay blank rather than taking the lowest colour
+        z=np.where(counts.T > 0, counts.T, np.nan),
+        colorscale='Viridis',
+        colorbar=dict(title='Rows'),
+        hovertemplate=f"{labels.get(x, x)}: %{{x}}<br>{labels.get(y, y)}: %{{y}}<br>Rows: %{{z}}<extra></extra>"
+    ))
+    figure.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    return figure
+
+
+def _observed(data_frame, params):
+    # Plotly Express groups categorical columns over every category, drawing empty
+    # traces for the unused ones; hand it the values of the columns it groups by
+    named = set()
+    for value in params.values():
+        for column in (value if isinstance(value, (list, tuple)) else [value]):
+            if isinstance(column, str) and column in data_frame.columns:
+                named.add(column)
+    categorical = [c for c in named if isinstance(data_frame[c].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return data_frame
+    return data_frame.assign(**{c: data_frame[c].astype(object) for c in categorical})
+
+
+def stats():
+    """Per chart: builds, reuses, and build time spent and saved, in seconds"""
+    with _lock:
+        return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def _record(name, built=None, saved=None):
+    with _lock:
+        counts = _stats.setdefault(name, {'builds': 0, 'reuses': 0, 'seconds': 0.0, 'saved': 0.0})
+        if built is not None:
+            counts['builds'] += 1
+            counts['seconds'] += built
+        if saved is not None:
+            counts['reuses'] += 1
+            counts['saved'] += max(saved, 0.0)
+
+
+def _identity(builder):
+    # Pages define their builders anew on every rerun, so not by id()
+    code = getattr(builder, '__code__', None)
+    origin = code.co_filename if code is not None else getattr(builder, '__module__', '')
+    return f"{origin}:{getattr(builder, '__qualname__', repr(builder))}"
+
+
+def _content(value):
+    """Bytes identifying an array-like's values, labels and dtypes"""
+    if isinstance(value, pd.DataFrame):
+        header = repr([(str(column), str(dtype)) for column, dtype in value.dtypes.items()])
+        return header.encode('utf-8') + pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes()
+    if isinstance(value, (pd.Series, pd.Index)):
+        return str(value.dtype).encode('utf-8') + pd.util.hash_pandas_object(value).to_numpy().tobytes()
+    array = np.asarray(value)
+    if array.dtype == object:
+        return repr(array.tolist()).encode('utf-8')
+    return str(array.dtype).encode('utf-8') + array.tobytes()
+
+
+def _encode(value):
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index, np.ndarray)):
+        return hashlib.sha1(_content(value)).hexdigest()
+    if isinstance(value, np.generic):
+        return value.item()
+    if hasattr(value, 'to_plotly_json'):
+        return value.to_plotly_json()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return repr(value)
@@ -0,0 +1,108 @@
+"""Typo-tolerant, ranked name lookup for client pickers.
+
+A ``NameIndex`` splits each normalised name into character trigrams (padded
+so the first letters form their own grams) and keeps the entries holding
+each trigram. A query scores only the entries sharing at least one trigram
+with it, by Dice similarity averaged with the share of the query's trigrams
+the name contains; entries that start with the query get a prefix bonus.
+So "acme crop" still finds "Acme Corp" and "tech" ranks "TechCorp Ltd"
+first. Several names can point at the same key (a client's
+name and its CIF); a lookup returns each key once, with its best score.
+
+``clients()`` is the shared index over client names and CIFs, keyed by row
+position in ``pulse.data.clients()``.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from pulse import data
+from pulse.warmup import artefact
+
+PREFIX_BONUS = 0.5
+MIN_SCORE = 0.3
+# Names a picker offers before anything is typed, and matches after
+PICKER_LIMIT = 50
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalise(text):
+    """Lower-case a name and collapse punctuation and spacing to single spaces"""
+    return _NON_ALNUM.sub(' ', str(text).lower()).strip()
+
+
+def trigrams(text):
+    """Distinct trigrams of a normalised name, padded at the start and end"""
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Trigram and prefix index over names, returning ranked keys"""
+
+    def __init__(self, names, keys=None):
+        self.names = [str(name) for name in names]
+        self.keys = np.arange(len(self.names)) if keys is None else np.asarray(keys)
+        normalised = [normalise(name) for name in self.names]
+        vocab = {}
+        entry_ids, gram_ids = [], []
+        self.gram_counts = np.zeros(len(self.names), dtype=np.float64)
+        for entry, text in enumerate(normalised):
+            grams = trigrams(text)
+            self.gram_counts[entry] = len(grams)
+            for gram in grams:
+                entry_ids.append(entry)
+                gram_ids.append(vocab.setdefault(gram, len(vocab)))
+        self.vocab = vocab
+        entry_ids = np.array(entry_ids, dtype=np.int64)
+        gram_ids = np.array(gram_ids, dtype=np.int64)
+        order = np.argsort(gram_ids, kind='stable')
+        self.postings = entry_ids[order]
+        self.offsets = np.searchsorted(gram_ids[order], np.arange(len(vocab) + 1))
+        # Sorted names for prefix ranges
+        self.sorted_names = np.array(normalised, dtype=str)
+        self.sorted_order = np.argsort(self.sorted_names, kind='stable')
+        self.sorted_names = self.sorted_names[self.sorted_order]
+        self.nbytes = self.postings.nbytes + self.offsets.nbytes + self.sorted_names.nbytes + self.keys.nbytes
+
+    def lookup(self, query, limit=10, min_score=MIN_SCORE):
+        """Best-matching keys for a query, as a frame of key, name and score"""
+        text = normalise(query)
+        if not text:
+            return pd.DataFrame({'key': self.keys[:0], 'name': [], 'score': []})
+        grams = [self.vocab[gram] for gram in trigrams(text) if gram in self.vocab]
+        matches = np.concatenate(
+            [self.postings[self.offsets[g]:self.offsets[g + 1]] for g in grams] or [np.empty(0, dtype=np.int64)]
+        )
+        shared = np.bincount(matches, minlength=len(self.names)).astype(np.float64)
+        query_grams = len(trigrams(text))
+        # Dice similarity, averaged with how much of the query the name contains
+        scores = (2 * shared / (query_grams + self.gram_counts) + shared / query_grams) / 2
+
+        lo, hi = np.searchsorted(self.sorted_names, [text, text + '\uffff'])
+        scores[self.sorted_order[lo:hi]] += PREFIX_BONUS
+
+        candidates = np.flatnonzero(scores >= min_score)
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        # Keep each key's best entry, then the top ``limit`` keys
+        _, first = np.unique(self.keys[candidates], return_index=True)
+        candidates = candidates[np.sort(first)][:limit]
+        return pd.DataFrame({
+            'key': self.keys[candidates],
+            'name': [self.names[i] for i in candidates],
+            'score': scores[candidates]
+        })
+
+
+@artefact('client_index', 'clients')
+def clients():
+    """Shared index over client names and CIFs, keyed by row position"""
+    frame = data.clients()
+    positions = np.arange(len(frame))
+    return NameIndex(
+        frame['client_name'].tolist() + frame['cif'].tolist(),
+        keys=np.concatenate([positions, positions])
+    )
@@ -0,0 +1,113 @@
+"""Grouped rollups that update from deltas instead of recomputing.
+
+A rollup keeps counts, sums and the running sum/count behind each mean for
+one dataset, grouped by a few key columns. It is built from the full frame
+the first time it is read; after that ``pulse.data.append``/``update`` feed
+it only the rows that were added and the old versions of rows that changed,
+so one new call report costs a handful of additions rather than a groupby
+over every call.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from pulse import data
+
+_listeners = {}
+
+
+class Rollup:
+    """Counts, sums and means of a dataset grouped by key columns"""
+
+    def __init__(self, dataset, by, sums=(), means=()):
+        self.dataset = dataset
+        self.by = list(by)
+        self.sums = list(sums)
+        self.means = list(means)
+        self._state = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def result(self):
+        """One row per group: the keys, count, each sum, and each mean with the number of values behind it"""
+        current, frame = data.snapshot(self.dataset)
+        with self._lock:
+            if self._state is None or self._version != current:
+                self._state = self._partial(frame)
+                self._version = current
+            state = self._state
+        result = state[['count'] + self.sums].copy()
+        for column in self.means:
+            result[column] = state[f'{column}__sum'] / state[f'{column}__n'].replace(0, np.nan)
+            result[f'{column}_n'] = state[f'{column}__n']
+        return result.reset_index()
+
+    def apply(self, added, removed, old_version, new_version):
+        """Fold a delta into the rollup; rebuild lazily if it is not current"""
+        with self._lock:
+            if self._state is None or self._version != old_version:
+                return
+            state = self._state
+            if added is not None and len(added):
+                state = state.add(self._partial(added), fill_value=0)
+            if removed is not None and len(removed):
+                state = state.sub(self._partial(removed), fill_value=0)
+            state['count'] = state['count'].astype('int64')
+            self._state = state[state['count'] > 0]
+            self._version = new_version
+
+    def check(self):
+        """True when the rollup matches a full regroup of the current frame"""
+        current, frame = data.snapshot(self.dataset)
+        full = self._partial(frame)
+        with self._lock:
+            if self._state is None or self._version != current:
+                return True
+            state = self._state
+        columns = list(full.columns)
+        state = state[columns].sort_index()
+        return state.index.equals(full.index) and np.allclose(state.to_numpy(float), full.to_numpy(float), equal_nan=True)
+
+    def _partial(self, rows):
+        columns = {}
+        for column in self.by:
+            keys = rows[column]
+            # Category sets differ between a delta and the full frame; compare values
+            columns[column] = keys.astype(str) if isinstance(keys.dtype, pd.CategoricalDtype) else keys
+        columns['count'] = np.ones(len(rows), dtype=np.int64)
+        for column in self.sums:
+            columns[column] = rows[column].astype('float64').fillna(0).to_numpy()
+        for column in self.means:
+            values = rows[column].astype('float64')
+            columns[f'{column}__sum'] = values.fillna(0).to_numpy()
+            columns[f'{column}__n'] = values.notna().to_numpy(dtype=np.int64)
+        frame = pd.DataFrame({k: pd.Series(v).reset_index(drop=True) for k, v in columns.items()})
+        return frame.groupby(self.by, sort=True, observed=True).sum()
+
+
+def register(dataset, instance):
+    """Send deltas to a dataset to anything with Rollup's ``apply`` method"""
+    _listeners.setdefault(dataset, []).append(instance)
+    return instance
+
+
+def rollup(dataset, by, sums=(), means=()):
+    """Create and register a rollup so deltas to its dataset reach it"""
+    return register(dataset, Rollup(dataset, by, sums, means))
+
+
+def check():
+    """Rollups, by dataset and grouping, whose incremental state differs from a full regroup"""
+    return [
+        f"{instance.dataset} by {', '.join(instance.by)}"
+        for instances in _listeners.values() for instance in instances
+        if isinstance(instance, Rollup) and not instance.check()
+    ]
+
+
+def apply(dataset, added, removed, old_version, new_version):
+    """Called by pulse.data after a delta has been applied to a dataset"""
+    for instance in _listeners.get(dataset, []):
+        instance.apply(added, removed, old_version, new_version)
@@ -0,0 +1,152 @@
+"""Cursor-based pages over sorted, filtered feeds.
+
+A feed is ordered by one or more columns, with the dataset's key column
+(see ``pulse.schema.KEYS``) as the final tie-break, so every row has a
+unique position. A page is the first ``size`` rows after a cursor, the sort
+values of the previous page's last row, rather than an offset: pages stay
+put when rows are added ahead of them, and reaching page 500 costs the same
+as page 2.
+
+``page`` runs in the embedded SQL engine (``pulse.query``) as a filtered,
+ordered ``LIMIT`` query, so paging a multi-million-row call history never
+materialises the filtered frame; ``count`` gives the total from a cached
+``COUNT(*)``. ``frame_page`` applies the same cursors to a frame that is
+already materialised, such as search results ranked in memory. A ``Pager``,
+kept in a session, remembers the cursors of the pages visited so far.
+"""
+
+import numpy as np
+import pandas as pd
+
+from pulse import data, query, schema, views
+
+PAGE_SIZE = 20
+
+
+def where(**filters):
+    """SQL condition and parameters: a list matches any of its values, a (start, end) tuple is a half-open range"""
+    clauses, params = [], []
+    for column, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, tuple):
+            start, end = value
+            if start is not None:
+                clauses.append(f'"{column}" >= ?')
+                params.append(query.param(start))
+            if end is not None:
+                clauses.append(f'"{column}" < ?')
+                params.append(query.param(end))
+        elif len(value):
+            clauses.append(f'"{column}" IN ({", ".join("?" * len(value))})')
+            params.extend(query.param(item) for item in value)
+        else:
+            clauses.append('1 = 0')
+    return ' AND '.join(clauses) or '1 = 1', tuple(params)
+
+
+def count(dataset, condition='1 = 1', params=()):
+    """Number of rows of a dataset matching a condition"""
+    result = query.sql(f'SELECT COUNT(*) AS n FROM {dataset} WHERE {condition}', dataset, params=params)
+    return int(result['n'].iloc[0])
+
+
+def page(dataset, order, condition='1 = 1', params=(), after=None, size=PAGE_SIZE):
+    """Rows after a cursor in (column, 'ASC'|'DESC') order, with the cursor of the next page or None"""
+    order = _with_key(dataset, order)
+    params = tuple(params)
+    if after is not None:
+        keyset, keyset_params = _keyset(order, after)
+        condition = f'({condition}) AND ({keyset})'
+        params += keyset_params
+    ordering = ', '.join(f'"{column}" {direction}' for column, direction in order)
+    rows = query.sql(
+        f'SELECT * FROM {dataset} WHERE {condition} ORDER BY {ordering} LIMIT {size + 1}', dataset, params=params
+    )
+    # The SQLite fallback returns timestamps as text
+    frame = data.get(dataset)
+    for column in rows.columns:
+        if pd.api.types.is_datetime64_any_dtype(frame[column]) and not pd.api.types.is_datetime64_any_dtype(rows[column]):
+            rows[column] = pd.to_datetime(rows[column], format='ISO8601')
+    return _split(rows, order, size)
+
+
+def frame_page(frame, order, key, after=None, size=PAGE_SIZE):
+    """Like ``page``, over a materialised frame; ``key`` is the tie-break column"""
+    order = list(order) + [(key, 'ASC')]
+    rows = frame.sort_values(
+        [column for column, _ in order],
+        ascending=[direction == 'ASC' for column, direction in order],
+        kind='stable'
+    )
+    if after is not None:
+        rows = rows[_after(rows, order, after)]
+    return _split(rows.head(size + 1), order, size)
+
+
+class Pager:
+    """Cursors of the pages visited in one feed, restarted when its filters change"""
+
+    def __init__(self):
+        self.filters = None
+        self.cursors = [None]
+
+    def start(self, filters):
+        """Go back to the first page if the filters differ from the last run"""
+        filters = views.fingerprint(filters)
+        if filters != self.filters:
+            self.filters = filters
+            self.cursors = [None]
+
+    @property
+    def after(self):
+        return self.cursors[-1]
+
+    @property
+    def number(self):
+        return len(self.cursors)
+
+    def next(self, cursor):
+        self.cursors.append(cursor)
+
+    def previous(self):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+
+
+def _with_key(dataset, order):
+    key = schema.KEYS[dataset]
+    order = list(order)
+    if key not in [column for column, _ in order]:
+        order.append((key, 'ASC'))
+    return order
+
+
+def _keyset(order, after):
+    # (a, b) after (x, y) is a beyond x, or a = x and b beyond y
+    clauses, params, equal, equal_params = [], [], [], []
+    for (column, direction), value in zip(order, after):
+        beyond = '<' if direction == 'DESC' else '>'
+        clauses.append(' AND '.join(equal + [f'"{column}" {beyond} ?']))
+        params.extend(equal_params + [query.param(value)])
+        equal.append(f'"{column}" = ?')
+        equal_params.append(query.param(value))
+    return ' OR '.join(f'({clause})' for clause in clauses), tuple(params)
+
+
+def _after(rows, order, after):
+    beyond = np.zeros(len(rows), dtype=bool)
+    equal = np.ones(len(rows), dtype=bool)
+    for (column, direction), value in zip(order, after):
+        values = rows[column].to_numpy()
+        beyond |= equal & ((values < value) if direction == 'DESC' else (values > value))
+        equal &= values == value
+    return beyond
+
+
+def _split(rows, order, size):
+    if len(rows) <= size:
+        return rows, None
+    rows = rows.iloc[:size]
+    last = rows.iloc[-1]
+    return rows, tuple(last[column] for column, _ in order)
@@ -0,0 +1,139 @@
+"""Embedded SQL engine for aggregate queries over the canonical datasets.
+
+Pages describe an aggregate as SQL over tables named after the datasets
+(``deals``, ``clients``, ``calls``, ...) and get a small result frame back::
+
+    query.sql('SELECT rm_name, SUM(value) AS value FROM deals GROUP BY rm_name', 'deals')
+
+DuckDB is used when it is installed: the shared frames, whose columns are
+mapped straight from the snapshot files, are scanned through Arrow without a
+copy, and filters and aggregation run in its vectorised engine. Without
+DuckDB the datasets are loaded once into an in-memory SQLite database, and
+deltas from ``pulse.data.append``/``update`` are written into its tables
+rather than reloading them. Results are kept in ``pulse.cache``, tagged with
+the datasets they read, so an invalidated dataset drops its aggregates too.
+
+Set ``PULSE_SQL_ENGINE=sqlite`` to force the fallback. Use ``month()`` and
+``day()`` for date buckets, since the two engines spell them differently.
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from pulse import cache, data, incremental, schema, synth
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - depends on the deployment
+    duckdb = None
+
+ENGINE = os.environ.get('PULSE_SQL_ENGINE', 'duckdb' if duckdb is not None else 'sqlite')
+
+_sqlite = None
+_sqlite_versions = {}
+_sqlite_columns = {}
+_sqlite_lock = threading.Lock()
+
+
+def sql(text, *datasets, params=None):
+    """Run a query over the named datasets and return the result as a DataFrame"""
+    params = tuple(params or ())
+    versions = tuple(data.version(name) for name in datasets)
+    key = ('sql', ENGINE, text, params, versions)
+    result = cache.manager.get(key)
+    if result is cache.MISSING:
+        run = _duckdb if ENGINE == 'duckdb' else _sqlite_query
+        result = run(text, datasets, params)
+        # Group keys come back as categoricals from the compact schema; results
+        # are small, so hand pages plain strings they can map and concatenate
+        for column in result.columns:
+            if isinstance(result[column].dtype, pd.CategoricalDtype):
+                result[column] = result[column].astype(str)
+        result = cache.manager.put(key, result, datasets)
+    return result.copy(deep=False)
+
+
+def month(column):
+    """SQL expression bucketing a timestamp column to 'YYYY-MM'"""
+    if ENGINE == 'duckdb':
+        return f"strftime({column}, '%Y-%m')"
+    return f"strftime('%Y-%m', {column})"
+
+
+def day(column):
+    """SQL expression bucketing a timestamp column to 'YYYY-MM-DD'"""
+    if ENGINE == 'duckdb':
+        return f"strftime({column}, '%Y-%m-%d')"
+    return f"strftime('%Y-%m-%d', {column})"
+
+
+def param(value):
+    """A query parameter as the engine compares it; SQLite holds timestamps as text"""
+    if isinstance(value, (datetime.date, np.datetime64)):
+        value = pd.Timestamp(value)
+        return str(value) if ENGINE == 'sqlite' else value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _duckdb(text, datasets, params):
+    # A connection per query keeps concurrent sessions apart; registering a
+    # frame is zero-copy, so this costs about a millisecond
+    con = duckdb.connect()
+    try:
+        for name in datasets:
+            con.register(name, data.get(name))
+        return con.execute(text, list(params)).df()
+    finally:
+        con.close()
+
+
+def _sqlite_query(text, datasets, params):
+    global _sqlite
+    # Read before taking the SQLite lock, which _SqliteTable.apply takes under the dataset's
+    read = {name: data.snapshot(name) for name in datasets}
+    with _sqlite_lock:
+        if _sqlite is None:
+            _sqlite = sqlite3.connect(':memory:', check_same_thread=False)
+        for name, (version, frame) in read.items():
+            if _sqlite_versions.get(name) != version:
+                # SQLite has no list type; drop such columns (news tags)
+                _sqlite_columns[name] = [c for c in frame.columns if not _is_list(frame[c])]
+                frame[_sqlite_columns[name]].to_sql(name, _sqlite, if_exists='replace', index=False)
+                _sqlite_versions[name] = version
+        return pd.read_sql_query(text, _sqlite, params=params)
+
+
+class _SqliteTable:
+    """Writes a dataset's deltas into its SQLite table"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def apply(self, added, removed, old_version, new_version):
+        with _sqlite_lock:
+            if _sqlite_versions.get(self.name) != old_version:
+                return
+            if removed is not None and len(removed):
+                key = schema.KEYS[self.name]
+                _sqlite.executemany(
+                    f'DELETE FROM {self.name} WHERE "{key}" = ?', [(param(value),) for value in removed[key]]
+                )
+            if added is not None and len(added):
+                added[_sqlite_columns[self.name]].to_sql(self.name, _sqlite, if_exists='append', index=False)
+            _sqlite_versions[self.name] = new_version
+
+
+if ENGINE == 'sqlite':
+    for _name in synth.DATASETS:
+        incremental.register(_name, _SqliteTable(_name))
+
+
+def _is_list(column):
+    return column.dtype == object and len(column) > 0 and isinstance(column.iloc[0], list)
@@ -0,0 +1,215 @@
+"""Batched HTML renderers: many items, one Streamlit element.
+
+Feeds that emit a container, columns and buttons per item cost Streamlit
+elements in proportion to the items shown. These renderers instead send the
+items as a JSON payload inside a single ``components.html`` frame, together
+with an HTML template that the browser compiles once and fills per item.
+
+Templates use ``{{field}}`` for values, which are HTML-escaped, and
+``{{{field}}}`` for fields the caller has already rendered as HTML (tag
+chips, badges). An element with a ``data-message`` attribute shows that
+message when clicked, standing in for the per-item buttons' feedback.
+
+``virtual_list`` keeps only the rows in view, plus a few either side, in
+the page. Items of equal height are stacked in a scrolling viewport, and the
+payload is split into chunks that are only parsed when scrolling reaches
+them, so a feed of thousands of items costs one element and a few dozen DOM
+rows.
+
+``cards`` renders every item at once, for lists of up to a few hundred
+cards, with sorting, a select filter on one field and a text filter that
+run in the browser without a rerun.
+"""
+
+import html
+import json
+from string import Template
+
+import streamlit.components.v1 as components
+
+CHUNK_SIZE = 200
+OVERSCAN = 6
+
+_BASE_STYLES = """
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #31333f; font-size: 14px; }
+.pulse-empty { padding: 1rem; color: #6c757d; }
+.pulse-toast { position: fixed; right: 12px; bottom: 12px; background: #31333f; color: white;
+               padding: 6px 12px; border-radius: 6px; opacity: 0; transition: opacity 0.2s; }
+.pulse-toast.shown { opacity: 0.9; }
+"""
+
+_COMPILE = """
+function compile(template) {
+    const parts = template.split(/(\\{\\{\\{?\\w+\\}?\\}\\})/);
+    const escape = value => String(value ?? '').replace(/[&<>"']/g, c => (
+        {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]
+    ));
+    return item => parts.map((part, i) => {
+        if (i % 2 === 0) return part;
+        const raw = part.startsWith('{{{');
+        const value = item[part.replace(/[{}]/g, '')];
+        return raw ? String(value ?? '') : escape(value);
+    }).join('');
+}
+function toasts(root) {
+    const toast = document.createElement('div');
+    toast.className = 'pulse-toast';
+    document.body.appendChild(toast);
+    let timer = null;
+    root.addEventListener('click', event => {
+        const target = event.target.closest('[data-message]');
+        if (!target) return;
+        toast.textContent = target.dataset.message;
+        toast.classList.add('shown');
+        clearTimeout(timer);
+        timer = setTimeout(() => toast.classList.remove('shown'), 1800);
+    });
+}
+"""
+
+_VIRTUAL_LIST = Template("""
+<style>$base_styles
+.pulse-viewport { height: ${height}px; overflow-y: auto; position: relative; }
+.pulse-rows { position: absolute; top: 0; left: 0; right: 0; }
+.pulse-row { height: ${row_height}px; box-sizing: border-box; overflow: hidden; }
+$styles</style>
+<div class="pulse-viewport" id="viewport">
+  <div style="height: ${total_height}px"></div>
+  <div class="pulse-rows" id="rows"></div>
+</div>
+$chunks
+<script>
+$compile
+const total = $total, rowHeight = $row_height, chunkSize = $chunk_size, overscan = $overscan;
+const render = compile($template);
+const sources = document.querySelectorAll('script[data-chunk]');
+const chunks = [];
+const viewport = document.getElementById('viewport');
+const rows = document.getElementById('rows');
+function item(i) {
+    const c = Math.floor(i / chunkSize);
+    if (!chunks[c]) chunks[c] = JSON.parse(sources[c].textContent);
+    return chunks[c][i % chunkSize];
+}
+let shown = [-1, -1];
+function draw() {
+    const first = Math.max(0, Math.floor(viewport.scrollTop / rowHeight) - overscan);
+    const last = Math.min(total, Math.ceil((viewport.scrollTop + viewport.clientHeight) / rowHeight) + overscan);
+    if (first === shown[0] && last === shown[1]) return;
+    shown = [first, last];
+    const html = [];
+    for (let i = first; i < last; i++) html.push('<div class="pulse-row">' + render(item(i)) + '</div>');
+    rows.style.transform = 'translateY(' + first * rowHeight + 'px)';
+    rows.innerHTML = html.join('');
+}
+let pending = false;
+viewport.addEventListener('scroll', () => {
+    if (pending) return;
+    pending = true;
+    requestAnimationFrame(() => { pending = false; draw(); });
+});
+if (total === 0) rows.innerHTML = '<div class="pulse-empty">$empty</div>';
+toasts(viewport);
+draw();
+</script>
+""")
+
+_CARDS = Template("""
+<style>$base_styles
+.pulse-controls { display: flex; gap: 8px; align-items: center; margin-bottom: 8px; }
+.pulse-controls input, .pulse-controls select { padding: 4px 8px; border: 1px solid #d6d6d9; border-radius: 6px;
+                                               font: inherit; }
+.pulse-controls input { flex: 1; }
+.pulse-count { color: #6c757d; white-space: nowrap; }
+.pulse-cards { height: ${height}px; overflow-y: auto; }
+$styles</style>
+<div class="pulse-controls">
+  <input id="search" placeholder="Filter...">
+  <select id="facet"><option value="">All</option></select>
+  <select id="sort"></select>
+  <span class="pulse-count" id="count"></span>
+</div>
+<div class="pulse-cards" id="cards"></div>
+<script type="application/json" id="items">$items</script>
+<script>
+$compile
+const items = JSON.parse(document.getElementById('items').textContent);
+const sorts = $sorts, facetField = $facet;
+const render = compile($template);
+const text = items.map(item => Object.values(item).join(' ').toLowerCase());
+const search = document.getElementById('search'), facet = document.getElementById('facet');
+const sort = document.getElementById('sort'), cards = document.getElementById('cards');
+const count = document.getElementById('count');
+sorts.forEach((option, i) => sort.add(new Option(option[0], i)));
+if (facetField) {
+    [...new Set(items.map(item => item[facetField]))].forEach(value => facet.add(new Option(value, value)));
+} else {
+    facet.style.display = 'none';
+}
+function compare(a, b) {
+    return typeof a === 'number' && typeof b === 'number' ? a - b : String(a).localeCompare(String(b));
+}
+function draw() {
+    const query = search.value.trim().toLowerCase();
+    const order = items.map((item, i) => i).filter(i =>
+        (!facet.value || String(items[i][facetField]) === facet.value) && (!query || text[i].includes(query))
+    );
+    if (sorts.length) {
+        const [, field, descending] = sorts[sort.value];
+        order.sort((i, j) => (descending ? -1 : 1) * compare(items[i][field], items[j][field]) || i - j);
+    }
+    cards.innerHTML = order.length ? order.map(i => render(items[i])).join('') : '<div class="pulse-empty">$empty</div>';
+    count.textContent = order.length + ' of ' + items.length;
+}
+[search, facet, sort].forEach(control => control.addEventListener('input', draw));
+toasts(cards);
+draw();
+</script>
+""")
+
+
+def escape(value):
+    """HTML-escape a value for a pre-rendered ``{{{field}}}``"""
+    return html.escape(str(value))
+
+
+def virtual_list(items, template, row_height, height=600, styles='', empty='Nothing to show'):
+    """Scrolling list of equal-height items that only builds the rows in view"""
+    chunks = [
+        f'<script type="application/json" data-chunk>{_json(items[start:start + CHUNK_SIZE])}</script>'
+        for start in range(0, len(items), CHUNK_SIZE)
+    ]
+    components.html(_VIRTUAL_LIST.substitute(
+        base_styles=_BASE_STYLES,
+        styles=styles,
+        compile=_COMPILE,
+        template=_json(template),
+        chunks='\n'.join(chunks),
+        total=len(items),
+        total_height=len(items) * row_height,
+        row_height=row_height,
+        height=height,
+        chunk_size=CHUNK_SIZE,
+        overscan=OVERSCAN,
+        empty=escape(empty)
+    ), height=height + 8)
+
+
+def cards(items, template, sorts=(), facet=None, height=600, styles='', empty='Nothing to show'):
+    """All items as cards in one frame; sorts are (label, field, descending), facet a field to select on"""
+    components.html(_CARDS.substitute(
+        base_styles=_BASE_STYLES,
+        styles=styles,
+        compile=_COMPILE,
+        template=_json(template),
+        items=_json(items),
+        sorts=_json([list(option) for option in sorts]),
+        facet=_json(facet),
+        height=height,
+        empty=escape(empty)
+    ), height=height + 56)
+
+
+def _json(value):
+    # "</" would close the script element holding the payload
+    return json.dumps(value, default=str).replace('</', '<\\/')
@@ -0,0 +1,227 @@
+"""Schema registry: compact storage dtypes for every canonical dataset.
+
+Low-cardinality labels are categoricals, identifiers and free text stay as
+Arrow-backed strings, counts use the narrowest integer that fits, scores and
+ratios are float32 and timestamps are datetime64. Money amounts stay float64
+or int64 so totals across millions of rows do not drift. ``apply`` enforces a
+schema when a dataset is loaded; ``report`` compares each column's footprint
+with the object/int64/float64 representation the pages used to build.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+CATEGORY = 'category'
+STRING = 'string[pyarrow]'
+DATETIME = 'datetime64[ns]'
+
+SCHEMAS = {
+    'clients': {
+        'client_id': STRING,
+        'client_name': STRING,
+        'cif': STRING,
+        'industry': CATEGORY,
+        'country': CATEGORY,
+        'region': CATEGORY,
+        'relationship_manager': CATEGORY,
+        'annual_revenue': 'int64',
+        'revenue_contribution': 'float64',
+        'employee_count': 'int32',
+        'relationship_length': 'int8',
+        'products_used': 'int8',
+        'satisfaction_score': 'float32',
+        'profitability_score': 'float32',
+        'growth_potential': CATEGORY,
+        'last_interaction': DATETIME
+    },
+    'risk': {
+        'client_id': STRING,
+        'client_name': STRING,
+        'industry': CATEGORY,
+        'relationship_manager': CATEGORY,
+        'credit_rating': CATEGORY,
+        'risk_score': 'float32',
+        'probability_default': 'float32',
+        'exposure_amount': 'float64',
+        'collateral_value': 'float64',
+        'debt_to_equity': 'float32',
+        'current_ratio': 'float32',
+        'cash_flow_ratio': 'float32',
+        'revenue_growth': 'float32',
+        'last_review_date': DATETIME,
+        'next_review_date': DATETIME,
+        'risk_trend': CATEGORY,
+        'covenant_status': CATEGORY,
+        'risk_level': CATEGORY
+    },
+    'deals': {
+        'deal_id': STRING,
+        'client_id': STRING,
+        'client_name': STRING,
+        'industry': CATEGORY,
+        'deal_name': CATEGORY,
+        'product_type': CATEGORY,
+        'rm_name': CATEGORY,
+        'stage': CATEGORY,
+        'stage_label': CATEGORY,
+        'stage_value': 'int8',
+        'probability': 'int8',
+        'value': 'int64',
+        'weighted_value': 'float64',
+        'days_in_pipeline': 'int16',
+        'created_date': DATETIME,
+        'expected_close': DATETIME,
+        'last_activity': DATETIME,
+        'risk_rating': CATEGORY,
+        'next_action': CATEGORY
+    },
+    'news': {
+        'id': STRING,
+        'headline': STRING,
+        'category': CATEGORY,
+        'source': CATEGORY,
+        'sentiment': CATEGORY,
+        'sentiment_score': 'float32',
+        'relevance_score': 'float32',
+        'published_date': DATETIME,
+        'impact_level': CATEGORY,
+        'client_mentions': 'int8',
+        'summary': CATEGORY,
+        'date': DATETIME,
+        'impact_numeric': 'int8'
+    },
+    'calls': {
+        'call_id': STRING,
+        'client_id': STRING,
+        'client_name': STRING,
+        'meeting_type': CATEGORY,
+        'participants': 'int8',
+        'duration_minutes': 'int16',
+        'platform': CATEGORY,
+        'date': DATETIME,
+        'status': CATEGORY,
+        'rm_name': CATEGORY,
+        'transcript_available': 'bool',
+        'ai_summary_generated': 'bool',
+        'action_items_count': 'int8',
+        'follow_up_required': 'bool',
+        'satisfaction_rating': 'float32',
+        'deal_value_discussed': 'float64',
+        'next_meeting_scheduled': 'bool',
+        'recording_available': 'bool',
+        'day': DATETIME
+    },
+    'action_items': {
+        'id': STRING,
+        'item': STRING,
+        'assignee': CATEGORY,
+        'client': STRING,
+        'priority': CATEGORY,
+        'status': CATEGORY,
+        'due_date': DATETIME,
+        'created_date': DATETIME,
+        'call_id': STRING,
+        'estimated_hours': 'int8',
+        'completion_percentage': 'int8'
+    },
+    'notifications': {
+        'id': STRING,
+        'timestamp': DATETIME,
+        'client': CATEGORY,
+        'type': CATEGORY,
+        'priority': CATEGORY,
+        'status': CATEGORY,
+        'title': CATEGORY,
+        'message': CATEGORY,
+        'rm_assigned': CATEGORY,
+        'action_required': 'bool',
+        'due_date': DATETIME,
+        'source': CATEGORY,
+        'category': CATEGORY
+    },
+    'conversations': {
+        'timestamp': DATETIME,
+        'client': CATEGORY,
+        'topic': CATEGORY,
+        'sentiment': CATEGORY,
+        'confidence_score': 'float32',
+        'risk_indicators': 'int8',
+        'opportunity_score': 'float32',
+        'next_action': CATEGORY,
+        'rm_name': CATEGORY,
+        'duration_minutes': 'int16',
+        'key_phrases': CATEGORY
+    },
+    'performance': {
+        'date': DATETIME,
+        'revenue': 'float64',
+        'target': 'int32',
+        'new_clients': 'int16',
+        'deals_closed': 'int16',
+        'pipeline_value': 'float64',
+        'client_satisfaction': 'float32',
+        'operational_efficiency': 'float32',
+        'risk_score': 'float32',
+        'market_share': 'float32'
+    }
+}
+
+# Column identifying a row, used to match update deltas; conversations are append-only
+KEYS = {
+    'clients': 'client_id',
+    'risk': 'client_id',
+    'deals': 'deal_id',
+    'news': 'id',
+    'calls': 'call_id',
+    'action_items': 'id',
+    'notifications': 'id',
+    'performance': 'date'
+}
+
+
+def apply(name, frame):
+    """Cast a dataset's columns to its registered dtypes, in place"""
+    for column, dtype in SCHEMAS.get(name, {}).items():
+        if column in frame.columns and str(frame[column].dtype) != dtype:
+            frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def report(frame):
+    """Per-column bytes now versus the legacy object/int64/float64 layout"""
+    rows = []
+    for column in frame.columns:
+        series = frame[column]
+        rows.append({
+            'column': column,
+            'dtype': str(series.dtype),
+            'legacy_dtype': str(_legacy_dtype(series)),
+            'bytes': int(series.memory_usage(index=False, deep=True)),
+            'legacy_bytes': _legacy_bytes(series)
+        })
+    return pd.DataFrame(rows, columns=['column', 'dtype', 'legacy_dtype', 'bytes', 'legacy_bytes'])
+
+
+def _legacy_dtype(series):
+    if isinstance(series.dtype, pd.CategoricalDtype) or series.dtype == STRING:
+        return np.dtype(object)
+    if pd.api.types.is_integer_dtype(series.dtype):
+        return np.dtype('int64')
+    if pd.api.types.is_float_dtype(series.dtype):
+        return np.dtype('float64')
+    return series.dtype
+
+
+def _legacy_bytes(series):
+    """Bytes the column would take as Python objects or 64-bit numbers"""
+    legacy = _legacy_dtype(series)
+    if legacy != object:
+        return len(series) * legacy.itemsize
+    if series.dtype == object:
+        return int(series.memory_usage(index=False, deep=True))
+    # One pointer per row plus one Python string per row, as pandas counts it;
+    # computed from the distinct values so large columns are not materialised
+    counts = series.value_counts(dropna=False)
+    return len(series) * 8 + int(sum(sys.getsizeof(str(value)) * count for value, count in counts.items()))
@@ -0,0 +1,205 @@
+"""Inverted full-text index with BM25 ranking.
+
+Text fields of a dataset are lower-cased and split into alphanumeric tokens.
+Each segment of the index holds, for every term in its sorted vocabulary,
+the positions of the rows containing it and the term frequency in each, so a
+query touches only the postings of its own terms. Distinct field values are
+tokenised once, which matters for fields like news summaries that repeat.
+
+Queries are a list of clauses that must all match: ``rate`` is a term,
+``infra*`` matches any term starting with ``infra`` and ``"interest rate"``
+an exact phrase within one field. Matching rows are ranked by BM25 over all
+query terms. Appended rows go into a new small segment (see
+``pulse.incremental``); other changes, or too many segments, rebuild the
+index from the dataset the next time it is searched.
+"""
+
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from pulse import data, incremental
+
+TOKEN = re.compile(r'[a-z0-9]+')
+QUERY = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text):
+    """Lower-cased alphanumeric tokens of a string"""
+    return TOKEN.findall(str(text).lower())
+
+
+class _Segment:
+    """Postings for a contiguous run of rows, starting at row ``start``"""
+
+    def __init__(self, frame, fields, start):
+        self.start = start
+        self.size = len(frame)
+        vocab = {}
+        tokenized = {}
+        for field in fields:
+            codes, uniques = pd.factorize(frame[field].astype(object))
+            tokens = [tokenize(value) for value in uniques]
+            for value_tokens in tokens:
+                for token in value_tokens:
+                    vocab.setdefault(token, len(vocab))
+            tokenized[field] = (codes, tokens)
+
+        # Number terms in sorted order so prefixes are a contiguous range
+        self.terms = np.array(sorted(vocab), dtype=str)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[vocab[term] for term in self.terms]] = np.arange(len(vocab))
+
+        self.texts = {}
+        doc_parts, term_parts = [], []
+        for field, (codes, tokens) in tokenized.items():
+            self.texts[field] = (codes, np.array([' ' + ' '.join(t) + ' ' for t in tokens], dtype=object))
+            lengths = np.array([len(t) for t in tokens], dtype=np.int64)
+            flat = rank[np.array([vocab[token] for t in tokens for token in t], dtype=np.int64)]
+            offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+            rows = np.flatnonzero(codes >= 0)
+            counts = lengths[codes[rows]]
+            total = int(counts.sum())
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            doc_parts.append(np.repeat(rows, counts))
+            term_parts.append(flat[np.repeat(offsets[codes[rows]], counts) + within])
+        docs = np.concatenate(doc_parts) if doc_parts else np.empty(0, dtype=np.int64)
+        term_ids = np.concatenate(term_parts) if term_parts else np.empty(0, dtype=np.int64)
+
+        self.doc_len = np.bincount(docs, minlength=self.size).astype(np.float64)
+        pairs, tf = np.unique(term_ids * max(self.size, 1) + docs, return_counts=True)
+        pair_terms = pairs // max(self.size, 1)
+        self.docs = pairs % max(self.size, 1) + start
+        self.tf = tf.astype(np.float64)
+        self.offsets = np.searchsorted(pair_terms, np.arange(len(self.terms) + 1))
+
+    def postings(self, term):
+        """Row positions and term frequencies for one term"""
+        i = int(np.searchsorted(self.terms, term))
+        if i < len(self.terms) and self.terms[i] == term:
+            return self.docs[self.offsets[i]:self.offsets[i + 1]], self.tf[self.offsets[i]:self.offsets[i + 1]]
+        return self.docs[:0], self.tf[:0]
+
+    def expand(self, prefix):
+        """Terms in this segment starting with a prefix"""
+        lo, hi = np.searchsorted(self.terms, [prefix, prefix + '\uffff'])
+        return self.terms[lo:hi].tolist()
+
+    def phrase(self, rows, phrase):
+        """Which of the given rows contain the phrase in any one field"""
+        local = rows - self.start
+        found = np.zeros(len(rows), dtype=bool)
+        needle = ' ' + phrase + ' '
+        for codes, texts in self.texts.values():
+            row_codes = codes[local]
+            candidates = np.unique(row_codes[row_codes >= 0])
+            matching = [code for code in candidates if needle in texts[code]]
+            found |= np.isin(row_codes, matching)
+        return found
+
+
+class InvertedIndex:
+    """BM25-ranked search over text fields of a dataset, kept current with appends"""
+
+    def __init__(self, dataset, fields, k1=1.2, b=0.75, max_segments=8):
+        self.dataset = dataset
+        self.fields = list(fields)
+        self.k1 = k1
+        self.b = b
+        self.max_segments = max_segments
+        self._segments = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def search(self, query, limit=None):
+        """Row positions matching every clause of the query and their BM25 scores, best first"""
+        segments = self._current()
+        clauses, phrases = self._parse(query, segments)
+        if not clauses:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+
+        rows = None
+        for terms in clauses:
+            matches = np.unique(np.concatenate(
+                [s.postings(term)[0] for s in segments for term in terms] or [np.empty(0, dtype=np.int64)]
+            ))
+            rows = matches if rows is None else np.intersect1d(rows, matches, assume_unique=True)
+            if not len(rows):
+                return rows, np.empty(0)
+        for phrase in phrases:
+            keep = np.zeros(len(rows), dtype=bool)
+            for segment in segments:
+                inside = (rows >= segment.start) & (rows < segment.start + segment.size)
+                keep[inside] = segment.phrase(rows[inside], phrase)
+            rows = rows[keep]
+
+        # BM25 over every distinct query term, with corpus statistics across segments
+        doc_len = np.concatenate([s.doc_len for s in segments])
+        total = len(doc_len)
+        avg_len = doc_len.mean() if total else 1.0
+        norm = self.k1 * (1 - self.b + self.b * doc_len[rows] / avg_len)
+        scores = np.zeros(len(rows))
+        for term in {term for terms in clauses for term in terms}:
+            tf = np.zeros(len(rows))
+            df = 0
+            for segment in segments:
+                docs, freqs = segment.postings(term)
+                df += len(docs)
+                if len(docs):
+                    i = np.minimum(np.searchsorted(docs, rows), len(docs) - 1)
+                    tf += np.where(docs[i] == rows, freqs[i], 0)
+            idf = np.log(1 + (total - df + 0.5) / (df + 0.5))
+            scores += idf * tf * (self.k1 + 1) / (tf + norm)
+
+        order = np.lexsort((rows, -scores))[:limit]
+        return rows[order], scores[order]
+
+    def apply(self, added, removed, old_version, new_version):
+        """Index appended rows as a new segment; anything else rebuilds on next search"""
+        with self._lock:
+            if self._segments is None or self._version != old_version:
+                return
+            if removed is not None and len(removed) or len(self._segments) >= self.max_segments:
+                self._segments = None
+                return
+            if added is not None and len(added):
+                start = sum(segment.size for segment in self._segments)
+                self._segments = self._segments + [_Segment(added, self.fields, start)]
+            self._version = new_version
+
+    def _current(self):
+        current, frame = data.snapshot(self.dataset)
+        with self._lock:
+            if self._segments is None or self._version != current:
+                self._segments = [_Segment(frame, self.fields, 0)]
+                self._version = current
+            return self._segments
+
+    def _parse(self, query, segments):
+        """Clauses as lists of alternative terms, plus phrases to verify"""
+        clauses, phrases = [], []
+        for quoted, word in QUERY.findall(query):
+            if quoted:
+                tokens = tokenize(quoted)
+                clauses += [[token] for token in tokens]
+                if len(tokens) > 1:
+                    phrases.append(' '.join(tokens))
+            elif word.endswith('*') and tokenize(word):
+                prefix = tokenize(word)[-1]
+                clauses += [[token] for token in tokenize(word)[:-1]]
+                clauses.append(sorted({term for s in segments for term in s.expand(prefix)}) or [prefix])
+            else:
+                clauses += [[token] for token in tokenize(word)]
+        return clauses, phrases
+
+
+def index(dataset, fields, **options):
+    """Create an index and register it so appends to its dataset reach it"""
+    instance = InvertedIndex(dataset, fields, **options)
+    incremental.register(dataset, instance)
+    return instance
+
+
+NEWS = index('news', ['headline', 'summary'])
@@ -0,0 +1,69 @@
+"""Page sections whose outputs survive reruns until their inputs change.
+
+Streamlit reruns a whole page script on every widget interaction, so a
+slider in one tab rebuilds the aggregates and figures of every other tab.
+``section(*datasets)`` decorates the function computing one section's
+outputs (frames, figures, numbers); the page renders what it returns. The
+outputs are kept in the session under the versions of the datasets the
+section reads and a hash of its declared inputs, passed as keyword
+arguments. A rerun with the same inputs hands the previous outputs back
+without calling the function, so moving a slider recomputes only the
+sections that declared it.
+
+Each section keeps just its latest outputs per session. Work shared by every
+session belongs in ``pulse.cache`` or ``pulse.views`` instead.
+"""
+
+import functools
+import os
+import threading
+import time
+
+import streamlit as st
+
+from pulse import data, views
+
+_STATE_KEY = '_pulse_sections'
+
+_lock = threading.Lock()
+_stats = {}
+
+
+def section(*datasets):
+    """Reuse a section's outputs across reruns until its keyword inputs or datasets change"""
+    def decorator(func):
+        name = f'{os.path.basename(func.__code__.co_filename)}:{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(**inputs):
+            state = st.session_state.setdefault(_STATE_KEY, {})
+            key = (tuple(data.version(dataset) for dataset in datasets), views.fingerprint(inputs))
+            entry = state.get(name)
+            if entry is not None and entry['key'] == key:
+                _record(name, reused=entry['seconds'])
+                return entry['outputs']
+            started = time.perf_counter()
+            outputs = func(**inputs)
+            seconds = time.perf_counter() - started
+            state[name] = {'key': key, 'outputs': outputs, 'seconds': seconds}
+            _record(name, computed=seconds)
+            return outputs
+        return wrapper
+    return decorator
+
+
+def stats():
+    """Per section: runs, reuses, and compute time spent and saved, in seconds"""
+    with _lock:
+        return {name: dict(counts) for name, counts in _stats.items()}
+
+
+def _record(name, computed=None, reused=None):
+    with _lock:
+        counts = _stats.setdefault(name, {'runs': 0, 'reuses': 0, 'seconds': 0.0, 'saved': 0.0})
+        if computed is not None:
+            counts['runs'] += 1
+            counts['seconds'] += computed
+        if reused is not None:
+            counts['reuses'] += 1
+            counts['saved'] += reused
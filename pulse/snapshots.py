@@ -0,0 +1,111 @@
+"""Memory-mapped Feather snapshots of the canonical datasets.
+
+A dataset is written once as an uncompressed Arrow IPC (Feather v2) file and
+reopened with ``pyarrow.memory_map``. Numeric, datetime and string columns are
+then backed directly by the mapped file, so every worker process serving the
+app shares the same pages through the OS page cache and a cold start is a file
+open rather than a regeneration.
+
+Snapshots are keyed by dataset, scale, seed and the generator's reference day,
+and live in ``PULSE_SNAPSHOT_DIR`` (default ``data/snapshots`` in the repo).
+Set ``PULSE_SNAPSHOTS=0`` to disable them. Pre-build every dataset with::
+
+    python -m pulse.snapshots --scale 100
+"""
+
+import argparse
+import glob
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+SNAPSHOT_DIR = os.environ.get(
+    'PULSE_SNAPSHOT_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'snapshots')
+)
+
+ENABLED = os.environ.get('PULSE_SNAPSHOTS', '1') != '0'
+
+# Read Arrow strings back as pandas' Arrow-backed string dtype, without a copy
+_TYPES = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+
+
+def path(name, scale, seed, day):
+    """File holding one snapshot of a dataset"""
+    return os.path.join(SNAPSHOT_DIR, f"{name}-x{scale:g}-s{seed}-{pd.Timestamp(day):%Y%m%d}.feather")
+
+
+def load(name, scale, seed, day):
+    """Open a snapshot memory-mapped, or return None if there is none"""
+    if not ENABLED:
+        return None
+    target = path(name, scale, seed, day)
+    if not os.path.exists(target):
+        return None
+    source = pa.memory_map(target, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    # split_blocks keeps each column on its own mapped buffer instead of consolidating
+    frame = table.to_pandas(split_blocks=True, types_mapper=_TYPES.get)
+    for field in table.schema:
+        if pa.types.is_list(field.type):
+            # Pages treat list cells (news tags) as Python lists, not NumPy arrays
+            frame[field.name] = pd.Series(table.column(field.name).to_pylist(), dtype=object)
+    return frame
+
+
+def save(name, frame, scale, seed, day):
+    """Write a snapshot atomically and drop older snapshots of the same dataset"""
+    if not ENABLED:
+        return None
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    target = path(name, scale, seed, day)
+    fd, tmp = tempfile.mkstemp(dir=SNAPSHOT_DIR, prefix=f'.{name}-', suffix='.feather')
+    os.close(fd)
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        feather.write_feather(table, tmp, compression='uncompressed')
+        # Rename is atomic, so concurrent workers never see a half-written file
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    for stale in glob.glob(os.path.join(SNAPSHOT_DIR, f'{name}-x*.feather')):
+        if stale != target and _day(stale) < _day(target):
+            try:
+                os.remove(stale)
+            except OSError:
+                pass
+    return target
+
+
+def clear(name=None):
+    """Remove the snapshots of one dataset, or all of them"""
+    pattern = f'{name}-x*.feather' if name else '*.feather'
+    for stale in glob.glob(os.path.join(SNAPSHOT_DIR, pattern)):
+        os.remove(stale)
+
+
+def _day(file_path):
+    return os.path.basename(file_path).rsplit('-', 1)[-1].split('.')[0]
+
+
+def main(argv=None):
+    from pulse import data, synth
+
+    parser = argparse.ArgumentParser(description="Build memory-mapped snapshots of the PULSE datasets")
+    parser.add_argument('--scale', type=float, default=data.SCALE, help="Row multiplier (1.0 = demo sizes)")
+    parser.add_argument('--seed', type=int, default=data.SEED)
+    parser.add_argument('datasets', nargs='*', default=synth.DATASETS)
+    args = parser.parse_args(argv)
+
+    data.configure(scale=args.scale, seed=args.seed)
+    for name in args.datasets:
+        frame = data.get(name)
+        print(f"{name}: {len(frame):,} rows -> {path(name, args.scale, args.seed, synth.default_now())}")
+
+
+if __name__ == '__main__':
+    main()
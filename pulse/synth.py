@@ -0,0 +1,494 @@
+"""Vectorised, seeded synthetic data generator for the canonical datasets.
+
+Row counts grow linearly with ``scale``: 1.0 reproduces the demo sizes and
+10000 gives a million obligors and three million deals. Rows are drawn in
+blocks of ``BLOCK_ROWS``, each from a generator seeded by the block's
+position in the dataset; the partition size asked for only re-slices those
+blocks, so a dataset is identical whether it is built in memory or streamed
+to Parquet, at any ``--block-rows``.
+
+Attributes that other datasets refer to (a client's name, industry and RM, or
+the client behind a call) are pure functions of the row index, which lets a
+deal partition resolve its client without materialising the client table.
+
+Stream a production-sized book to disk with::
+
+    python -m pulse.synth --scale 10000 --out data/synthetic
+"""
+
+import argparse
+import itertools
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+BLOCK_ROWS = 1 << 20
+
+RELATIONSHIP_MANAGERS = [
+    'Sarah Johnson', 'Michael Chen', 'Emma Williams', 'David Brown',
+    'Lisa Davis', 'James Wilson', 'Maria Garcia', 'Robert Taylor'
+]
+
+INDUSTRIES = ['Technology', 'Manufacturing', 'Healthcare', 'Retail', 'Energy', 'Finance']
+
+COMPANY_NAMES = [
+    'TechCorp Ltd', 'Manufacturing Inc', 'RetailChain PLC', 'EnergyPlus Ltd', 'HealthcarePro',
+    'StartupXYZ', 'LogisticsCorp', 'FinanceGroup', 'PropertyDev', 'MediaHouse',
+    'AutoMotors Ltd', 'FoodChain Co', 'PharmaCorp', 'TelecomGiant', 'ConstructionPro',
+    'AeroSpace Inc', 'MarineServices', 'AgriTech Ltd', 'CleanEnergy Co', 'DataSystems'
+]
+
+STAGES = ['Prospect', 'Qualified', 'Proposal', 'Negotiation', 'Closed Won', 'Closed Lost']
+
+STAGE_LABELS = {
+    'Prospect': '🔍 Prospect',
+    'Qualified': '✅ Qualified',
+    'Proposal': '📋 Proposal',
+    'Negotiation': '🤝 Negotiation',
+    'Closed Won': '🎉 Closed Won',
+    'Closed Lost': '❌ Closed Lost'
+}
+
+# Funnel position of each stage; Closed Lost drops out of the funnel
+STAGE_VALUES = {'Prospect': 1, 'Qualified': 2, 'Proposal': 3, 'Negotiation': 4, 'Closed Won': 5, 'Closed Lost': 0}
+
+# Win probability range (percent) for each stage
+STAGE_PROBABILITY = {
+    'Prospect': (10, 40),
+    'Qualified': (30, 60),
+    'Proposal': (50, 75),
+    'Negotiation': (70, 90),
+    'Closed Won': (100, 100),
+    'Closed Lost': (0, 0)
+}
+
+NEWS_HEADLINES = [
+    "Technology Sector Shows Strong Q2 Performance Amid Market Volatility",
+    "Central Bank Signals Potential Interest Rate Adjustments",
+    "Healthcare Innovation Drives Record Investment Levels",
+    "Manufacturing Industry Faces Supply Chain Challenges",
+    "ESG Financing Reaches New Heights in Corporate Banking",
+    "Digital Banking Transformation Accelerates Post-Pandemic",
+    "Energy Sector Transitions Toward Renewable Solutions",
+    "Retail Banking Embraces AI for Customer Experience",
+    "Regulatory Changes Impact Commercial Lending Practices",
+    "Fintech Partnerships Reshape Traditional Banking Models"
+]
+
+NEWS_SUMMARIES = [
+    "Market analysis reveals significant growth opportunities in the technology sector, with increased demand for digital solutions driving revenue growth across multiple subsectors.",
+    "Economic indicators suggest potential monetary policy adjustments, which could impact lending rates and credit availability for commercial clients.",
+    "Healthcare sector demonstrates resilience with strong fundamentals, presenting attractive lending opportunities for banks focused on this vertical.",
+    "Supply chain disruptions continue to challenge manufacturing companies, requiring flexible financing solutions and risk management approaches.",
+    "Environmental, Social, and Governance (ESG) criteria increasingly influence corporate financing decisions, creating new market opportunities.",
+    "Digital transformation initiatives accelerate across industries, driving demand for technology financing and innovation funding.",
+    "Renewable energy investments surge as companies commit to sustainability goals, opening new financing markets for forward-thinking banks.",
+    "Artificial intelligence adoption in banking operations improves efficiency and customer experience while reducing operational costs.",
+    "New regulatory frameworks require banks to adapt compliance procedures and risk management practices for commercial lending.",
+    "Strategic partnerships between traditional banks and fintech companies create innovative solutions for business banking clients."
+]
+
+NEWS_TAGS = ['M&A', 'IPO', 'Earnings', 'Regulation', 'Innovation', 'ESG']
+
+KEY_PHRASES = [
+    'expansion plans, credit facility, market volatility',
+    'cash flow concerns, payment delays, restructuring',
+    'growth opportunities, investment, partnership',
+    'regulatory compliance, risk assessment, audit'
+]
+
+# Rows per dataset at scale 1.0; risk has exactly one row per client
+BASE_ROWS = {
+    'clients': 100,
+    'risk': 100,
+    'deals': 300,
+    'news': 100,
+    'calls': 150,
+    'action_items': 50,
+    'notifications': 50,
+    'conversations': 50,
+    'performance': 182
+}
+
+DATASETS = list(BASE_ROWS)
+
+# Every 1-3 tag combination, shared by all news rows that draw it
+_TAG_COMBOS = np.empty(41, dtype=object)
+_TAG_COMBOS[:] = [list(c) for k in (1, 2, 3) for c in itertools.combinations(NEWS_TAGS, k)]
+
+
+def rows(name, scale=1.0):
+    """Number of rows in a dataset at the given scale"""
+    if name == 'risk':
+        name = 'clients'
+    return max(1, int(round(BASE_ROWS[name] * scale)))
+
+
+def default_now():
+    """Reference time for relative dates; fixed per day so output is reproducible"""
+    return pd.Timestamp.now().floor('D')
+
+
+def _hash_uniform(seed, salt, idx):
+    """Uniform draws in [0, 1) that depend only on (seed, salt, row index)"""
+    with np.errstate(over='ignore'):
+        x = idx.astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+        x += np.uint64((seed * 0x100000001B3 + salt) & 0xFFFFFFFFFFFFFFFF)
+        x ^= x >> np.uint64(30)
+        x *= np.uint64(0xBF58476D1CE4E5B9)
+        x ^= x >> np.uint64(27)
+        x *= np.uint64(0x94D049BB133111EB)
+        x ^= x >> np.uint64(31)
+    return (x >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+def _hash_choice(seed, salt, idx, size):
+    return (_hash_uniform(seed, salt, idx) * size).astype(np.int64)
+
+
+def _take(vocab, codes):
+    """Arrow-backed string column picked from a small vocabulary"""
+    return pd.arrays.ArrowStringArray(pa.array(vocab, pa.string()).take(pa.array(codes)))
+
+
+def _pick(rng, vocab, n):
+    return _take(vocab, rng.integers(0, len(vocab), n))
+
+
+def _concat(*parts):
+    """Element-wise string concatenation of literals, arrays and numbers"""
+    arrays = [
+        part if isinstance(part, str) else pc.cast(pa.array(part), pa.string())
+        for part in parts
+    ]
+    return pd.arrays.ArrowStringArray(pc.binary_join_element_wise(*arrays, ''))
+
+
+def _prefixed(prefix, numbers):
+    return _concat(prefix, numbers)
+
+
+def _before(now, rng, low, high, n, unit='D'):
+    offsets = rng.integers(low, high + 1, n).astype(f'timedelta64[{unit}]')
+    return (np.datetime64(now, 'ns') - offsets).astype('datetime64[ns]')
+
+
+def _after(now, rng, low, high, n, unit='D'):
+    offsets = rng.integers(low, high + 1, n).astype(f'timedelta64[{unit}]')
+    return (np.datetime64(now, 'ns') + offsets).astype('datetime64[ns]')
+
+
+def client_ids(idx):
+    return _prefixed('CLI-', idx + 1000)
+
+
+def client_names(idx):
+    """Named companies for the first rows, then 'Client <letter><n>'"""
+    letters = pa.array([chr(65 + i) for i in range(26)]).take(pa.array(idx % 26))
+    generated = pc.binary_join_element_wise('Client ', letters, pc.cast(pa.array(idx), pa.string()), '')
+    named = pa.array(COMPANY_NAMES).take(pa.array(np.minimum(idx, len(COMPANY_NAMES) - 1)))
+    return pd.arrays.ArrowStringArray(pc.if_else(pa.array(idx < len(COMPANY_NAMES)), named, generated))
+
+
+def client_industries(seed, idx):
+    return _take(INDUSTRIES, _hash_choice(seed, 1, idx, len(INDUSTRIES)))
+
+
+def client_managers(seed, idx):
+    return _take(RELATIONSHIP_MANAGERS, _hash_choice(seed, 2, idx, len(RELATIONSHIP_MANAGERS)))
+
+
+def call_clients(seed, idx, n_clients):
+    """Client index behind each call"""
+    return _hash_choice(seed, 3, idx, n_clients)
+
+
+def _clients(rng, idx, ctx):
+    n = len(idx)
+    return pd.DataFrame({
+        'client_id': client_ids(idx),
+        'client_name': client_names(idx),
+        'cif': _prefixed('0', 131045486 + idx * 7919),
+        'industry': client_industries(ctx['seed'], idx),
+        'country': _pick(rng, ['UK', 'Germany', 'France', 'Netherlands', 'Switzerland'], n),
+        'region': _pick(rng, ['London', 'Manchester', 'Birmingham', 'Edinburgh', 'Cardiff'], n),
+        'relationship_manager': client_managers(ctx['seed'], idx),
+        'annual_revenue': rng.integers(5000000, 500000000, n),
+        'revenue_contribution': rng.uniform(100000, 5000000, n),
+        'employee_count': rng.integers(50, 10000, n),
+        'relationship_length': rng.integers(1, 16, n),
+        'products_used': rng.integers(1, 9, n),
+        'satisfaction_score': rng.uniform(6.0, 10.0, n),
+        'profitability_score': rng.uniform(0.3, 0.95, n),
+        'growth_potential': _pick(rng, ['High', 'Medium', 'Low'], n),
+        'last_interaction': _before(ctx['now'], rng, 1, 90, n)
+    })
+
+
+def _risk(rng, idx, ctx):
+    n = len(idx)
+    now = ctx['now']
+    return pd.DataFrame({
+        'client_id': client_ids(idx),
+        'client_name': client_names(idx),
+        'industry': client_industries(ctx['seed'], idx),
+        'relationship_manager': client_managers(ctx['seed'], idx),
+        'credit_rating': _pick(rng, ['AAA', 'AA', 'A', 'BBB', 'BB', 'B', 'CCC'], n),
+        'risk_score': rng.uniform(1, 10, n),
+        'probability_default': rng.uniform(0.01, 0.15, n),
+        'exposure_amount': rng.uniform(1000000, 50000000, n),
+        'collateral_value': rng.uniform(500000, 30000000, n),
+        'debt_to_equity': rng.uniform(0.2, 3.0, n),
+        'current_ratio': rng.uniform(0.8, 2.5, n),
+        'cash_flow_ratio': rng.uniform(-0.2, 0.4, n),
+        'revenue_growth': rng.uniform(-0.3, 0.5, n),
+        'last_review_date': _before(now, rng, 1, 365, n),
+        'next_review_date': _after(now, rng, 30, 180, n),
+        'risk_trend': _pick(rng, ['Improving', 'Stable', 'Deteriorating'], n),
+        'covenant_status': _pick(rng, ['Compliant', 'Warning', 'Breach'], n)
+    })
+
+
+def _deals(rng, idx, ctx):
+    n = len(idx)
+    now = ctx['now']
+    client_idx = rng.integers(0, ctx['n_clients'], n)
+    stage_codes = rng.integers(0, len(STAGES), n)
+    low = np.array([STAGE_PROBABILITY[s][0] for s in STAGES])[stage_codes]
+    high = np.array([STAGE_PROBABILITY[s][1] for s in STAGES])[stage_codes]
+    probability = rng.integers(low, high + 1)
+    value = rng.integers(250000, 25000000, n)
+    return pd.DataFrame({
+        'deal_id': _prefixed('DEAL-', idx + 2024000),
+        'client_id': client_ids(client_idx),
+        'client_name': client_names(client_idx),
+        'industry': client_industries(ctx['seed'], client_idx),
+        'deal_name': _pick(rng, ['Credit Facility', 'Term Loan', 'Working Capital', 'Trade Finance', 'Investment Loan', 'Equipment Finance'], n),
+        'product_type': _pick(rng, ['Term Loan', 'Credit Line', 'Trade Finance', 'Treasury Services', 'Investment Banking'], n),
+        'rm_name': _pick(rng, RELATIONSHIP_MANAGERS, n),
+        'stage': _take(STAGES, stage_codes),
+        'stage_label': _take([STAGE_LABELS[s] for s in STAGES], stage_codes),
+        'stage_value': np.array([STAGE_VALUES[s] for s in STAGES])[stage_codes],
+        'probability': probability,
+        'value': value,
+        'weighted_value': value * probability / 100,
+        'days_in_pipeline': rng.integers(1, 366, n),
+        'created_date': _before(now, rng, 1, 180, n),
+        'expected_close': _after(now, rng, 7, 120, n),
+        'last_activity': _before(now, rng, 1, 14, n),
+        'risk_rating': _pick(rng, ['🟢 Low', '🟡 Medium', '🔴 High'], n),
+        'next_action': _pick(rng, ['Client Meeting', 'Proposal Review', 'Documentation', 'Credit Approval', 'Contract Signing'], n)
+    })
+
+
+def _news(rng, idx, ctx):
+    n = len(idx)
+    return pd.DataFrame({
+        'id': _prefixed('NEWS-', idx + 1000),
+        'headline': _concat(_take(NEWS_HEADLINES, idx % len(NEWS_HEADLINES)), ' - Update ', idx // 10 + 1),
+        'category': _pick(rng, ['Banking', 'Technology', 'Healthcare', 'Manufacturing', 'Energy', 'Retail'], n),
+        'source': _pick(rng, ['Financial Times', 'Reuters', 'Bloomberg', 'Wall Street Journal', 'BBC Business', 'CNBC'], n),
+        'sentiment': _pick(rng, ['Positive', 'Negative', 'Neutral'], n),
+        'sentiment_score': rng.uniform(-1, 1, n),
+        'relevance_score': rng.uniform(0.3, 1.0, n),
+        'published_date': _before(ctx['now'], rng, 1, 168, n, unit='h'),
+        'impact_level': _pick(rng, ['High', 'Medium', 'Low'], n),
+        'client_mentions': rng.integers(0, 6, n),
+        'summary': _take(NEWS_SUMMARIES, idx % len(NEWS_SUMMARIES)),
+        'tags': _TAG_COMBOS[rng.integers(0, len(_TAG_COMBOS), n)]
+    })
+
+
+def _calls(rng, idx, ctx):
+    n = len(idx)
+    client_idx = call_clients(ctx['seed'], idx, ctx['n_clients'])
+    rated = rng.random(n) > 0.3
+    discussed = rng.random(n) > 0.5
+    return pd.DataFrame({
+        'call_id': _prefixed('CALL-', idx + 3000),
+        'client_id': client_ids(client_idx),
+        'client_name': client_names(client_idx),
+        'meeting_type': _pick(rng, ['Client Call', 'Internal Meeting', 'Prospect Call', 'Review Meeting', 'Training Session'], n),
+        'participants': rng.integers(2, 9, n),
+        'duration_minutes': rng.integers(15, 121, n),
+        'platform': _pick(rng, ['MS Teams', 'Zoom', 'Phone', 'In-Person', 'Google Meet'], n),
+        'date': _before(ctx['now'], rng, 0, 90 * 24, n, unit='h'),
+        'status': _pick(rng, ['Completed', 'Scheduled', 'Cancelled', 'Rescheduled'], n),
+        'rm_name': _pick(rng, RELATIONSHIP_MANAGERS[:5], n),
+        'transcript_available': rng.random(n) > 0.5,
+        'ai_summary_generated': rng.random(n) > 0.5,
+        'action_items_count': rng.integers(0, 9, n),
+        'follow_up_required': rng.random(n) > 0.5,
+        'satisfaction_rating': np.where(rated, rng.uniform(7.0, 10.0, n), np.nan),
+        'deal_value_discussed': np.where(discussed, rng.uniform(0, 10000000, n), 0.0),
+        'next_meeting_scheduled': rng.random(n) > 0.5,
+        'recording_available': rng.random(n) > 0.5
+    })
+
+
+def _action_items(rng, idx, ctx):
+    n = len(idx)
+    statuses = ['Open', 'In Progress', 'Completed', 'Overdue']
+    status_codes = rng.integers(0, len(statuses), n)
+    # Overdue items are always due in the past
+    due_offset = np.where(status_codes == 3, -rng.integers(1, 16, n), rng.integers(-10, 31, n))
+    in_flight = (status_codes == 1) | (status_codes == 2)
+    call_idx = rng.integers(0, ctx['n_calls'], n)
+    return pd.DataFrame({
+        'id': _prefixed('ACTION-', idx + 4000),
+        'item': _concat('Action item ', idx + 1, ': Follow up on client requirements and provide detailed proposal'),
+        'assignee': _pick(rng, RELATIONSHIP_MANAGERS[:5], n),
+        'client': client_names(call_clients(ctx['seed'], call_idx, ctx['n_clients'])),
+        'priority': _pick(rng, ['High', 'Medium', 'Low'], n),
+        'status': _take(statuses, status_codes),
+        'due_date': (np.datetime64(ctx['now'], 'ns') + due_offset.astype('timedelta64[D]')).astype('datetime64[ns]'),
+        'created_date': _before(ctx['now'], rng, 1, 30, n),
+        'call_id': _prefixed('CALL-', call_idx + 3000),
+        'estimated_hours': rng.integers(1, 9, n),
+        'completion_percentage': np.where(in_flight, rng.integers(0, 101, n), 0)
+    })
+
+
+def _notifications(rng, idx, ctx):
+    n = len(idx)
+    notification_types = ['Deal Alert', 'Risk Warning', 'Payment Due', 'Meeting Reminder', 'Compliance Alert', 'Opportunity']
+    names = client_names(rng.integers(0, min(5, ctx['n_clients']), n))
+    timestamps = _before(ctx['now'], rng, 1, 168, n, unit='h')
+    return pd.DataFrame({
+        'id': _prefixed('NOTIF-', idx + 1000),
+        'timestamp': timestamps,
+        'client': names,
+        'type': _pick(rng, notification_types, n),
+        'priority': _pick(rng, ['High', 'Medium', 'Low', 'Critical'], n),
+        'status': _pick(rng, ['Unread', 'Read', 'Acknowledged', 'Resolved'], n),
+        'title': _concat('Alert for ', names),
+        'message': _concat('Important notification regarding ', _pick(rng, [t.lower() for t in notification_types], n)),
+        'rm_assigned': _pick(rng, RELATIONSHIP_MANAGERS[:3], n),
+        'action_required': rng.random(n) > 0.5,
+        'due_date': (timestamps + rng.integers(1, 15, n).astype('timedelta64[D]')).astype('datetime64[ns]'),
+        'source': _pick(rng, ['System', 'AI Engine', 'Manual', 'External API'], n),
+        'category': _pick(rng, ['Client Management', 'Risk Management', 'Compliance', 'Sales'], n)
+    })
+
+
+def _conversations(rng, idx, ctx):
+    n = len(idx)
+    return pd.DataFrame({
+        'timestamp': _before(ctx['now'], rng, 0, 30 * 24, n, unit='h'),
+        'client': client_names(rng.integers(0, min(5, ctx['n_clients']), n)),
+        'topic': _pick(rng, ['Credit Expansion', 'Risk Assessment', 'Market Concerns', 'Payment Terms', 'Investment Plans'], n),
+        'sentiment': _pick(rng, ['Positive', 'Neutral', 'Negative', 'Concerned', 'Optimistic'], n),
+        'confidence_score': rng.uniform(0.7, 0.98, n),
+        'risk_indicators': rng.integers(0, 6, n),
+        'opportunity_score': rng.uniform(0.3, 0.9, n),
+        'next_action': _pick(rng, ['Follow-up Call', 'Send Proposal', 'Risk Review', 'Schedule Meeting'], n),
+        'rm_name': _pick(rng, RELATIONSHIP_MANAGERS[:3], n),
+        'duration_minutes': rng.integers(15, 91, n),
+        'key_phrases': _pick(rng, KEY_PHRASES, n)
+    })
+
+
+def _performance(rng, idx, ctx):
+    n = len(idx)
+    # The series always ends on 2024-06-30; larger scales add older history
+    end = np.datetime64('2024-06-30', 'ns')
+    dates = end - (ctx['n_rows'] - 1 - idx).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'date': dates.astype('datetime64[ns]'),
+        'revenue': rng.uniform(800000, 1200000, n) + np.sin(idx * 2 * np.pi / 30) * 100000,
+        'target': np.full(n, 1000000),
+        'new_clients': rng.integers(2, 9, n),
+        'deals_closed': rng.integers(1, 6, n),
+        'pipeline_value': rng.uniform(50000000, 80000000, n),
+        'client_satisfaction': rng.uniform(7.5, 9.5, n),
+        'operational_efficiency': rng.uniform(0.75, 0.95, n),
+        'risk_score': rng.uniform(3.0, 7.0, n),
+        'market_share': rng.uniform(0.12, 0.18, n)
+    })
+
+
+_GENERATORS = {
+    'clients': _clients,
+    'risk': _risk,
+    'deals': _deals,
+    'news': _news,
+    'calls': _calls,
+    'action_items': _action_items,
+    'notifications': _notifications,
+    'conversations': _conversations,
+    'performance': _performance
+}
+
+
+def iter_blocks(name, scale=1.0, seed=42, now=None, block_rows=BLOCK_ROWS):
+    """Yield a dataset as consecutive DataFrame blocks of at most block_rows rows"""
+    pending, held = [], 0
+    for frame in _seeded_blocks(name, scale, seed, now):
+        pending.append(frame)
+        held += len(frame)
+        while held >= block_rows:
+            frame = pending[0] if len(pending) == 1 else pd.concat(pending)
+            yield frame.iloc[:block_rows]
+            rest = frame.iloc[block_rows:]
+            pending, held = ([rest] if len(rest) else []), len(rest)
+    if held:
+        yield pending[0] if len(pending) == 1 else pd.concat(pending)
+
+
+def _seeded_blocks(name, scale, seed, now):
+    """The dataset in BLOCK_ROWS blocks, each from a generator seeded by its position"""
+    ctx = {
+        'seed': seed,
+        'now': pd.Timestamp(now if now is not None else default_now()).to_datetime64(),
+        'n_rows': rows(name, scale),
+        'n_clients': rows('clients', scale),
+        'n_calls': rows('calls', scale)
+    }
+    salt = DATASETS.index(name)
+    n_rows = ctx['n_rows']
+    for block, start in enumerate(range(0, n_rows, BLOCK_ROWS)):
+        rng = np.random.default_rng([seed, salt, block])
+        idx = np.arange(start, min(start + BLOCK_ROWS, n_rows), dtype=np.int64)
+        frame = _GENERATORS[name](rng, idx, ctx)
+        frame.index = pd.RangeIndex(start, start + len(idx))
+        yield frame
+
+
+def generate(name, scale=1.0, seed=42, now=None):
+    """Build a whole dataset in memory"""
+    blocks = list(iter_blocks(name, scale=scale, seed=seed, now=now))
+    return blocks[0] if len(blocks) == 1 else pd.concat(blocks)
+
+
+def write_partitions(name, directory, scale=1.0, seed=42, now=None, block_rows=BLOCK_ROWS):
+    """Stream a dataset to Parquet, one file per block, without holding it in memory"""
+    target = os.path.join(directory, name)
+    os.makedirs(target, exist_ok=True)
+    paths = []
+    for part, frame in enumerate(iter_blocks(name, scale=scale, seed=seed, now=now, block_rows=block_rows)):
+        path = os.path.join(target, f'part-{part:05d}.parquet')
+        pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), path)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream synthetic PULSE datasets to Parquet partitions")
+    parser.add_argument('--out', required=True, help="Output directory")
+    parser.add_argument('--scale', type=float, default=1.0, help="Row multiplier (1.0 = demo sizes)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--block-rows', type=int, default=BLOCK_ROWS)
+    parser.add_argument('datasets', nargs='*', default=DATASETS)
+    args = parser.parse_args(argv)
+
+    for name in args.datasets:
+        paths = write_partitions(name, args.out, scale=args.scale, seed=args.seed, block_rows=args.block_rows)
+        print(f"{name}: {rows(name, args.scale):,} rows in {len(paths)} partition(s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Tabs that only run the body of the tab being viewed.
+
+``st.tabs`` sends every tab's content to the browser and switches between
+them there, so each rerun executes every tab body, including the hidden
+ones. ``lazy(labels, key)`` draws the tab strip as a horizontal radio whose
+choice is kept in the session, and returns one flag per tab that is True
+only for the active tab. Pages run each body under ``if flag:`` in place of
+``with tab:``, so a rerun costs what is visible.
+
+A hidden tab's outputs are not lost: bodies that compute through
+``pulse.sections`` or ``pulse.figures`` get their previous results back when
+the tab is shown again. Its widgets are not rendered while hidden, so
+Streamlit would return them to their defaults; a widget given
+``**keep(key, default)`` in place of its ``value``/``index``/``default``
+argument has its value saved beside it and re-applied when it is drawn.
+"""
+
+import streamlit as st
+
+_STYLES = """
+<style>
+div.element-container:has(.pulse-tabs) + div.element-container [role="radiogroup"] {
+    gap: 0; border-bottom: 1px solid rgba(49, 51, 63, 0.2); width: 100%;
+}
+div.element-container:has(.pulse-tabs) + div.element-container label[data-baseweb="radio"] {
+    padding: 0.5rem 1rem; margin: 0; border-bottom: 2px solid transparent;
+}
+div.element-container:has(.pulse-tabs) + div.element-container label[data-baseweb="radio"] > div:first-child {
+    display: none;
+}
+div.element-container:has(.pulse-tabs) + div.element-container label[data-baseweb="radio"]:has(input:checked) {
+    border-bottom-color: #ff4b4b; color: #ff4b4b;
+}
+</style>
+<div class="pulse-tabs"></div>
+"""
+
+
+def lazy(labels, key):
+    """One flag per tab, True only for the active one, which is kept in the session under key"""
+    # The radio's own state is dropped when the user leaves the page, so the choice is saved beside it
+    saved = f'{key}_saved'
+    if st.session_state.get(saved) not in labels:
+        st.session_state[saved] = labels[0]
+    st.session_state[key] = st.session_state[saved]
+    st.markdown(_STYLES, unsafe_allow_html=True)
+    active = st.radio(
+        key, labels, key=key, horizontal=True, label_visibility='collapsed', on_change=_save, args=(key,)
+    )
+    return [label == active for label in labels]
+
+
+def keep(key, default=None, argument=None):
+    """Widget arguments that keep its value under key while its tab is hidden, starting from default"""
+    saved = st.session_state.setdefault(f'{key}_saved', default)
+    if argument is not None:
+        # Widgets whose mode follows their value (date ranges) take the saved value as that argument
+        return {argument: saved, 'key': key, 'on_change': _save, 'args': (key,)}
+    st.session_state[key] = saved
+    return {'key': key, 'on_change': _save, 'args': (key,)}
+
+
+def _save(key):
+    st.session_state[f'{key}_saved'] = st.session_state[key]
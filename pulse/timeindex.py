@@ -0,0 +1,137 @@
+"""Sorted timestamp indexes for date-range filters.
+
+``index(dataset, column)`` keeps one timestamp column of a dataset sorted,
+along with the row order that sorts it, in the shared cache. Appended rows
+are merged into it by a delta listener, without sorting the column again;
+other changes to the column rebuild it. A window is then two binary searches, so
+``count`` costs O(log n) and ``window``/``frame`` O(log n) plus the rows
+returned, instead of comparing every timestamp in the column.
+
+Windows are half-open, ``start <= t < end``; either bound may be None.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from pulse import cache, data, incremental
+
+_columns = {}
+_lock = threading.Lock()
+
+
+class TimeIndex:
+    """One timestamp column, sorted, with the row order that sorts it"""
+
+    def __init__(self, values, version=None):
+        values = _timestamps(values)
+        order = np.argsort(values, kind='stable')
+        self._set(order, values[order], version)
+
+    def _set(self, order, values, version):
+        self.order = order
+        self.sorted = values
+        # Missing timestamps sort last and never fall inside a window
+        self.valid = len(values) - int(np.isnat(values).sum())
+        self.nbytes = self.order.nbytes + self.sorted.nbytes
+        self.version = version
+
+    def appended(self, values, version):
+        """The index with values added as the next rows, merged in without a sort"""
+        values = _timestamps(values)
+        order = np.argsort(values, kind='stable')
+        values = values[order]
+        valid = len(values) - int(np.isnat(values).sum())
+        # Equal timestamps keep row order, as a stable sort of the whole column would
+        at = np.searchsorted(self.sorted[:self.valid], values[:valid], 'right')
+        rows = order + len(self.order)
+        merged = object.__new__(TimeIndex)
+        merged._set(
+            np.concatenate([np.insert(self.order[:self.valid], at, rows[:valid]), self.order[self.valid:], rows[valid:]]),
+            np.concatenate([np.insert(self.sorted[:self.valid], at, values[:valid]), self.sorted[self.valid:], values[valid:]]),
+            version
+        )
+        return merged
+
+    def bounds(self, start=None, end=None):
+        """Slice of the sorted order covering [start, end)"""
+        lo = 0 if start is None else self._search(start)
+        hi = self.valid if end is None else min(self._search(end), self.valid)
+        return lo, max(lo, hi)
+
+    def count(self, start=None, end=None):
+        """Number of rows in the window"""
+        lo, hi = self.bounds(start, end)
+        return hi - lo
+
+    def window(self, start=None, end=None):
+        """Row positions in the window, in their original order"""
+        lo, hi = self.bounds(start, end)
+        return np.sort(self.order[lo:hi])
+
+    def _search(self, bound):
+        return int(np.searchsorted(self.sorted[:self.valid], np.datetime64(pd.Timestamp(bound), 'ns'), 'left'))
+
+
+class _Listener:
+    """Merges appended rows into a dataset's cached time indexes"""
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+
+    def apply(self, added, removed, old_version, new_version):
+        if added is None:
+            return
+        # Updated rows come first in a delta, followed by the appended ones
+        changed = 0 if removed is None else len(removed)
+        for column in list(_columns[self.dataset]):
+            key = ('time', self.dataset, column)
+            found = cache.manager.peek(key)
+            if found is cache.MISSING or found.version != old_version:
+                continue
+            # Updates that move a timestamp leave the index stale, to be rebuilt when next read
+            if changed and not np.array_equal(
+                _timestamps(added[column].iloc[:changed]), _timestamps(removed[column]), equal_nan=True
+            ):
+                continue
+            index = found.appended(added[column].iloc[changed:], new_version)
+            cache.manager.put(key, index, datasets=(self.dataset,), maintained=True)
+
+
+def index(dataset, column):
+    """Sorted index of a dataset's timestamp column, built on first use"""
+    key = ('time', dataset, column)
+    found = cache.manager.get(key)
+    if found is cache.MISSING or found.version != data.version(dataset):
+        _listen(dataset, column)
+        current, frame = data.snapshot(dataset)
+        found = cache.manager.put(key, TimeIndex(frame[column], current), datasets=(dataset,), maintained=True)
+    return found
+
+
+def count(dataset, column, start=None, end=None):
+    """Number of rows with start <= column < end"""
+    return index(dataset, column).count(start, end)
+
+
+def window(dataset, column, start=None, end=None):
+    """Positions of the rows with start <= column < end"""
+    return index(dataset, column).window(start, end)
+
+
+def frame(dataset, column, start=None, end=None):
+    """View of the rows with start <= column < end"""
+    return data.get(dataset).iloc[window(dataset, column, start, end)]
+
+
+def _listen(dataset, column):
+    with _lock:
+        if dataset not in _columns:
+            _columns[dataset] = set()
+            incremental.register(dataset, _Listener(dataset))
+        _columns[dataset].add(column)
+
+
+def _timestamps(values):
+    return pd.to_datetime(values).to_numpy(dtype='datetime64[ns]')
@@ -0,0 +1,342 @@
+"""In-process semantic "find similar" search over free-text fields.
+
+Texts are embedded by a hashing vectoriser: word unigrams and bigrams are
+hashed with CRC32 (stable across processes) into ``DIM`` signed buckets,
+weighted by sublinear term frequency and a per-bucket IDF learned from the
+corpus, then L2-normalised. An IVF index clusters the vectors with spherical
+k-means into about sqrt(n) lists; a query is scored against the centroids and
+then only against the vectors of the ``nprobe`` closest lists.
+
+``CORPUS`` covers news summaries, call notes (the action items recorded
+against each call) and conversation key phrases; identical texts share one
+vector. The built index is saved under ``PULSE_VECTOR_DIR`` (default
+``data/vectors``) and reopened by later processes for the same book. Rows
+appended to a source dataset are embedded and inserted into their nearest
+list without retraining, and updated rows are re-pointed at their new text.
+"""
+
+import os
+import tempfile
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from pulse import data, incremental, search, snapshots, synth
+
+DIM = 256
+MAX_LISTS = 512
+NPROBE = 8
+
+VECTOR_DIR = os.environ.get(
+    'PULSE_VECTOR_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'vectors')
+)
+
+
+def terms(text):
+    """Word unigrams and bigrams of a text"""
+    tokens = search.tokenize(text)
+    return tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+
+
+class HashingVectorizer:
+    """Signed feature hashing with sublinear TF and per-bucket IDF"""
+
+    def __init__(self, dim=DIM, idf=None):
+        self.dim = dim
+        self.idf = np.ones(dim, dtype=np.float32) if idf is None else idf.astype(np.float32)
+        self._ids = {}
+        self._buckets = []
+        self._signs = []
+
+    def fit(self, texts):
+        """Learn IDF weights from the buckets each text touches"""
+        counts = self._counts(texts)
+        df = (counts != 0).sum(axis=0)
+        self.idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+        return self
+
+    def transform(self, texts):
+        """Unit-length float32 vectors, one row per text"""
+        vectors = self._counts(texts) * self.idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    def _counts(self, texts):
+        rows, ids = [], []
+        for row, text in enumerate(texts):
+            for term in terms(text):
+                term_id = self._ids.get(term)
+                if term_id is None:
+                    term_id = self._ids[term] = len(self._ids)
+                    digest = zlib.crc32(term.encode('utf-8'))
+                    self._buckets.append(digest % self.dim)
+                    self._signs.append(1.0 if digest & 0x80000000 else -1.0)
+                rows.append(row)
+                ids.append(term_id)
+        counts = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if not ids:
+            return counts
+        pairs, tf = np.unique(np.array(rows, dtype=np.int64) * len(self._ids) + np.array(ids), return_counts=True)
+        rows, ids = pairs // len(self._ids), pairs % len(self._ids)
+        weights = np.asarray(self._signs)[ids] * (1 + np.log(tf))
+        cells = rows * self.dim + np.asarray(self._buckets)[ids]
+        return np.bincount(cells, weights, minlength=counts.size).reshape(counts.shape).astype(np.float32)
+
+
+class IVFIndex:
+    """Inverted-file index over unit vectors, scored by inner product"""
+
+    def __init__(self, centroids):
+        self.centroids = centroids.astype(np.float32)
+        self.dim = centroids.shape[1]
+        self.size = 0
+        self._vectors = np.empty((0, self.dim), dtype=np.float32)
+        self._lists = [np.empty(0, dtype=np.int64) for _ in range(len(centroids))]
+
+    @classmethod
+    def train(cls, vectors, nlist, iterations=8, seed=0):
+        """Spherical k-means on a sample of the vectors"""
+        rng = np.random.default_rng(seed)
+        sample = vectors[rng.choice(len(vectors), min(len(vectors), nlist * 32), replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            order = np.argsort(assign, kind='stable')
+            sizes = np.bincount(assign, minlength=nlist)
+            sums = np.zeros_like(centroids)
+            filled = np.flatnonzero(sizes)
+            sums[filled] = np.add.reduceat(sample[order], np.cumsum(sizes)[filled] - sizes[filled])
+            empty = sizes == 0
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+        return cls(centroids)
+
+    def add(self, vectors):
+        """Append vectors and file each under its nearest centroid; returns their ids"""
+        ids = np.arange(self.size, self.size + len(vectors))
+        if len(self._vectors) < self.size + len(vectors):
+            grown = np.empty((max(2 * len(self._vectors), self.size + len(vectors)), self.dim), dtype=np.float32)
+            grown[:self.size] = self._vectors[:self.size]
+            self._vectors = grown
+        self._vectors[self.size:self.size + len(vectors)] = vectors
+        self.size += len(vectors)
+        assign = np.concatenate([
+            np.argmax(vectors[i:i + 65536] @ self.centroids.T, axis=1) for i in range(0, len(vectors), 65536)
+        ] or [np.empty(0, dtype=np.int64)])
+        order = np.argsort(assign, kind='stable')
+        bounds = np.searchsorted(assign[order], np.arange(len(self.centroids) + 1))
+        for cell in np.unique(assign):
+            self._lists[cell] = np.concatenate([self._lists[cell], ids[order[bounds[cell]:bounds[cell + 1]]]])
+        return ids
+
+    def search(self, query, k, nprobe=NPROBE):
+        """Ids and scores of the k best vectors in the nprobe closest lists"""
+        probes = np.argsort(-(self.centroids @ query))[:nprobe]
+        ids = np.concatenate([self._lists[cell] for cell in probes])
+        scores = self._vectors[ids] @ query
+        top = np.argpartition(-scores, min(k, len(ids)) - 1)[:k] if len(ids) > k else np.arange(len(ids))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return ids[top], scores[top]
+
+    def arrays(self):
+        """Everything needed to reopen the index, as plain arrays"""
+        return {
+            'centroids': self.centroids,
+            'vectors': self._vectors[:self.size],
+            'list_ids': np.concatenate(self._lists),
+            'list_offsets': np.cumsum([0] + [len(ids) for ids in self._lists])
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        index = cls(arrays['centroids'])
+        index._vectors = np.array(arrays['vectors'], dtype=np.float32)
+        index.size = len(index._vectors)
+        offsets = arrays['list_offsets']
+        index._lists = [arrays['list_ids'][offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        return index
+
+
+class _Source:
+    """Forwards deltas to one source dataset into the semantic index"""
+
+    def __init__(self, index, label):
+        self.index = index
+        self.label = label
+
+    def apply(self, added, removed, old_version, new_version):
+        self.index._apply(self.label, added, removed, old_version, new_version)
+
+
+class SemanticIndex:
+    """Nearest-neighbour search over text columns of several datasets"""
+
+    def __init__(self, sources, nprobe=NPROBE):
+        # label -> (dataset, text column, key column, or None for the row position)
+        self.sources = sources
+        self.nprobe = nprobe
+        self._state = None
+        self._lock = threading.Lock()
+        for label, (dataset, _, _) in sources.items():
+            incremental.register(dataset, _Source(self, label))
+
+    def similar(self, text, k=10, sources=None):
+        """Top-k distinct texts closest to a query, with the documents holding each"""
+        state = self._current()
+        query = state['vectorizer'].transform([text])[0]
+        columns = ['source', 'key', 'text', 'score', 'documents']
+        if not query.any():
+            return pd.DataFrame(columns=columns)
+        ids, scores = state['ivf'].search(query, k * 4, self.nprobe)
+        keep = scores > 0
+        rows = []
+        for vector, score in zip(ids[keep], scores[keep]):
+            for label in sources or self.sources:
+                counts, first = self._lookup(state, label)
+                if vector < len(counts) and counts[vector]:
+                    rows.append((label, state['docs'][label][1][first[vector]], state['texts'][vector],
+                                 float(score), int(counts[vector])))
+        return pd.DataFrame(rows[:k], columns=columns)
+
+    def stats(self):
+        """Size of the index and of each source"""
+        state = self._current()
+        return {
+            'vectors': state['ivf'].size,
+            'lists': len(state['ivf'].centroids),
+            'dim': state['ivf'].dim,
+            'nprobe': self.nprobe,
+            'documents': {label: len(state['docs'][label][0]) for label in self.sources},
+            'loaded_from_disk': state['loaded']
+        }
+
+    def _current(self):
+        read = {dataset: data.snapshot(dataset) for dataset, _, _ in self.sources.values()}
+        versions = {dataset: version for dataset, (version, _) in read.items()}
+        with self._lock:
+            if self._state is None or self._state['versions'] != versions:
+                self._state = self._open(versions, {dataset: frame for dataset, (_, frame) in read.items()})
+            return self._state
+
+    def _open(self, versions, frames):
+        """Reopen the saved index for this book, or build and save it"""
+        pristine = not any(data.deltas(dataset) for dataset in versions)
+        path = os.path.join(
+            VECTOR_DIR, f"semantic-x{data.SCALE:g}-s{data.SEED}-{pd.Timestamp(synth.default_now()):%Y%m%d}.npz"
+        )
+        if pristine and snapshots.ENABLED and os.path.exists(path):
+            with np.load(path) as saved:
+                state = {
+                    'vectorizer': HashingVectorizer(int(saved['centroids'].shape[1]), saved['idf']),
+                    'ivf': IVFIndex.from_arrays(saved),
+                    'texts': saved['texts'].tolist(),
+                    'docs': {label: (saved[f'{label}__vectors'], saved[f'{label}__keys']) for label in self.sources}
+                }
+            state.update(text_ids={text: i for i, text in enumerate(state['texts'])},
+                         versions=versions, lookups={}, loaded=True)
+            return state
+        state = self._build(versions, frames)
+        if pristine and snapshots.ENABLED:
+            try:
+                self._save(state, path)
+            except OSError:
+                pass
+        return state
+
+    def _build(self, versions, frames):
+        text_ids, docs = {}, {}
+        for label, (dataset, column, key) in self.sources.items():
+            frame = frames[dataset]
+            codes, uniques = pd.factorize(frame[column].astype(object))
+            ids = np.array([text_ids.setdefault(str(text), len(text_ids)) for text in uniques] + [-1], dtype=np.int64)
+            keys = np.arange(len(frame)).astype(str) if key is None else frame[key].astype(str).to_numpy(dtype=str)
+            docs[label] = (ids[codes], keys)
+        texts = list(text_ids)
+        vectorizer = HashingVectorizer().fit(texts)
+        vectors = vectorizer.transform(texts)
+        ivf = IVFIndex.train(vectors, max(1, min(MAX_LISTS, int(np.sqrt(len(texts))))))
+        ivf.add(vectors)
+        return {'vectorizer': vectorizer, 'ivf': ivf, 'texts': texts, 'text_ids': text_ids,
+                'docs': docs, 'versions': versions, 'lookups': {}, 'loaded': False}
+
+    def _save(self, state, path):
+        os.makedirs(VECTOR_DIR, exist_ok=True)
+        arrays = dict(state['ivf'].arrays(), idf=state['vectorizer'].idf, texts=np.array(state['texts'], dtype=str))
+        for label, (vectors, keys) in state['docs'].items():
+            arrays[f'{label}__vectors'] = vectors
+            arrays[f'{label}__keys'] = keys
+        handle, temp = tempfile.mkstemp(dir=VECTOR_DIR, suffix='.npz.tmp')
+        with os.fdopen(handle, 'wb') as out:
+            np.savez(out, **arrays)
+        os.replace(temp, path)
+
+    def _lookup(self, state, label):
+        """Per-vector document count and first document of a source"""
+        if label not in state['lookups']:
+            vectors = state['docs'][label][0]
+            valid = vectors >= 0
+            counts = np.bincount(vectors[valid], minlength=state['ivf'].size)
+            first = np.full(state['ivf'].size, -1, dtype=np.int64)
+            first[vectors[valid][::-1]] = np.flatnonzero(valid)[::-1]
+            state['lookups'][label] = (counts, first)
+        return state['lookups'][label]
+
+    def check(self):
+        """Sources whose documents no longer match their dataset, once deltas have been applied"""
+        read = {dataset: data.snapshot(dataset) for dataset, _, _ in self.sources.values()}
+        with self._lock:
+            state = self._state
+            if state is None or state['versions'] != {dataset: version for dataset, (version, _) in read.items()}:
+                return []
+            drifted = []
+            for label, (dataset, column, key) in self.sources.items():
+                frame = read[dataset][1]
+                vectors, keys = state['docs'][label]
+                texts = np.array(state['texts'] + [None], dtype=object)[vectors]
+                expected = frame[column].astype(object)
+                expected = expected.where(expected.notna(), None).astype(str).to_numpy(dtype=object)
+                expected_keys = np.arange(len(frame)).astype(str) if key is None \
+                    else frame[key].astype(str).to_numpy(dtype=str)
+                if not (np.array_equal(texts.astype(str), expected) and np.array_equal(keys, expected_keys)):
+                    drifted.append(label)
+            return drifted
+
+    def _apply(self, label, added, removed, old_version, new_version):
+        dataset, column, key = self.sources[label]
+        with self._lock:
+            state = self._state
+            if state is None or state['versions'].get(dataset) != old_version or added is None:
+                return
+            values = added[column].astype(object)
+            texts = [None if pd.isna(text) else str(text) for text in values]
+            new = [text for text in dict.fromkeys(texts) if text is not None and text not in state['text_ids']]
+            if new:
+                for text, vector in zip(new, state['ivf'].add(state['vectorizer'].transform(new))):
+                    state['text_ids'][text] = int(vector)
+                state['texts'].extend(new)
+            ids = np.array([-1 if text is None else state['text_ids'][text] for text in texts], dtype=np.int64)
+            vectors, keys = state['docs'][label]
+            # A delta lists the rewritten rows first, then any appended ones
+            updated = 0 if removed is None else len(removed)
+            if updated:
+                # Updated rows keep their position and point at their new text
+                vectors = vectors.copy()
+                vectors[removed.index.to_numpy()] = ids[:updated]
+            if len(added) > updated:
+                appended = added.iloc[updated:]
+                new_keys = np.arange(len(vectors), len(vectors) + len(appended)).astype(str) if key is None \
+                    else appended[key].astype(str).to_numpy(dtype=str)
+                vectors = np.concatenate([vectors, ids[updated:]])
+                keys = np.concatenate([keys, new_keys])
+            state['docs'][label] = (vectors, keys)
+            state['versions'][dataset] = new_version
+            state['lookups'] = {}
+
+CORPUS = SemanticIndex({
+    'news': ('news', 'summary', 'id'),
+    'call_notes': ('action_items', 'item', 'call_id'),
+    'conversations': ('conversations', 'key_phrases', None)
+})
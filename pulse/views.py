@@ -0,0 +1,63 @@
+"""Memoised filtered views shared by every session.
+
+``filtered(*datasets)`` decorates a page's filter chain. The result is
+stored in the shared ``pulse.cache`` manager under the versions of the
+datasets it reads plus a hash of the canonical filter state, so an
+unrelated button press, another tab, or another RM sitting on the same
+default filters gets the materialised frame back instead of re-running the
+chain. Entries live under the cache's LRU and byte budget and are dropped
+when one of their datasets changes.
+
+Filter values are canonicalised before hashing: lists and sets (multiselect
+values) are order-insensitive, tuples (date ranges) keep their order, and
+dates, timestamps and NumPy scalars hash by value.
+"""
+
+import datetime
+import functools
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from pulse import cache, data
+
+
+def canonical(value):
+    """A JSON-serialisable form of a filter value; equal filters give equal forms"""
+    if isinstance(value, dict):
+        return {str(key): canonical(value[key]) for key in sorted(value, key=str)}
+    if isinstance(value, tuple):
+        return [canonical(item) for item in value]
+    if isinstance(value, (list, set, frozenset, pd.Index, np.ndarray)):
+        return sorted((canonical(item) for item in value), key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, (datetime.date, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def fingerprint(filters):
+    """Short stable hash of a filter state"""
+    encoded = json.dumps(canonical(filters), sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16]
+
+
+def filtered(*datasets):
+    """Memoise a filter chain over the given datasets, keyed by its keyword filters"""
+    def decorator(func):
+        name = f'{os.path.basename(func.__code__.co_filename)}:{func.__qualname__}'
+
+        @functools.wraps(func)
+        def wrapper(**filters):
+            versions = tuple(data.version(dataset) for dataset in datasets)
+            key = ('view', name, versions, fingerprint(filters))
+            value = cache.manager.get(key)
+            if value is cache.MISSING:
+                value = cache.manager.put(key, func(**filters), datasets)
+            return value.copy(deep=False)
+        return wrapper
+    return decorator
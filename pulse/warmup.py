@@ -0,0 +1,104 @@
+"""Background warm-up of datasets and shared aggregates.
+
+``app.py`` calls ``start()`` once per process. A daemon thread then applies
+the cache settings saved from Admin Config, loads every canonical dataset and computes every registered artefact (see
+``pulse.aggregates``) so the first visitor to a page finds them cached.
+``status()`` reports progress for the sidebar.
+
+Artefacts are single-flight: while one is being computed, by the warm-up
+thread or by a page, other callers of that artefact wait for the result
+instead of computing it again. A cached artefact is returned without taking
+its lock, so readers never queue behind a rebuild they do not need, and a
+page only ever waits for the datasets and artefacts it actually uses.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+from pulse import cache, data
+
+_artefacts = OrderedDict()
+_thread = None
+_lock = threading.Lock()
+_status = {
+    'state': 'idle',
+    'done': 0,
+    'total': 0,
+    'current': None,
+    'started': None,
+    'finished': None,
+    'errors': {}
+}
+
+
+def artefact(name, *datasets):
+    """Register a cached, single-flight aggregate over the given datasets"""
+    def decorator(func):
+        compute = cache.cached(*datasets)(func)
+        flight = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper():
+            # Cached results are handed out without waiting; the lock only serialises building
+            value = compute.peek()
+            if value is cache.MISSING:
+                with flight:
+                    value = compute()
+            return value
+
+        _artefacts[name] = wrapper
+        return wrapper
+    return decorator
+
+
+def artefacts():
+    """Names of all registered artefacts"""
+    _register()
+    return list(_artefacts)
+
+
+def start():
+    """Start the warm-up thread unless it is already running or has finished"""
+    global _thread
+    with _lock:
+        if _thread is not None:
+            return _thread
+        _register()
+        _status.update(state='running', done=0, total=1 + len(data.datasets()) + len(_artefacts),
+                       started=time.time(), finished=None, errors={})
+        _thread = threading.Thread(target=_run, name='pulse-warmup', daemon=True)
+        _thread.start()
+        return _thread
+
+
+def status():
+    """Snapshot of warm-up progress"""
+    with _lock:
+        snapshot = dict(_status)
+        snapshot['errors'] = dict(_status['errors'])
+    snapshot['progress'] = snapshot['done'] / snapshot['total'] if snapshot['total'] else 0.0
+    return snapshot
+
+
+def _run():
+    steps = [('cache:settings', cache.restore)]
+    steps += [(f'dataset:{name}', functools.partial(data.get, name)) for name in data.datasets()]
+    steps += list(_artefacts.items())
+    for label, step in steps:
+        with _lock:
+            _status['current'] = label
+        try:
+            step()
+        except Exception as exc:  # a failed artefact is recomputed by the page that needs it
+            with _lock:
+                _status['errors'][label] = repr(exc)
+        with _lock:
+            _status['done'] += 1
+    with _lock:
+        _status.update(state='finished', current=None, finished=time.time())
+
+
+def _register():
+    from pulse import aggregates, fuzzy  # noqa: F401 - importing registers the artefacts